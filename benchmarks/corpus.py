@@ -0,0 +1,80 @@
+"""Deterministic synthetic corpora for the benchmarks.
+
+The documents are built offline from a fixed vocabulary with a seeded random
+generator, so every run, on every machine, benchmarks the primitives on
+exactly the same text. Words are drawn with Zipf-like frequencies from the
+English stopwords mixed with common content words, including sentiment words
+for ``PolarityScore`` and numbers for ``PartOfSpeechCount``, and joined into
+capitalized, punctuated sentences.
+"""
+import numpy as np
+import pandas as pd
+from nlp_primitives.utilities import get_stopwords
+
+# Number of sentences in each document, by document length
+LENGTHS = {"short": 1, "medium": 5, "long": 25}
+
+_CONTENT_WORDS = """
+time year people way day man thing woman life child world school state family
+student group country problem hand part place case week company system program
+question work government number night point home water room mother area money
+story fact month lot right study book eye job word business issue side kind head
+house service friend father power hour game line end member law car city name
+president team minute idea kid body information back parent face others level
+office door health person art war history party result change morning reason
+research girl guy moment air teacher force education say get make go know take
+see come think look want give use find tell ask seem feel try leave call keep
+provide hold turn follow begin bring like write run move live believe happen
+walk carry talk appear produce sit offer consider expect suggest spend grow open
+good new first last long great little own other old big high different small
+large next early young important few public bad same able quickly slowly really
+happy sad wonderful terrible excellent awful love hate beautiful ugly best worst
+amazing horrible nice poor brilliant boring fantastic dreadful 1 2 3 10 42 2019
+""".split()
+
+_PUNCTUATION = np.array([".", ".", ".", ".", "!", "?"])
+
+
+def _vocabulary():
+    words = sorted(get_stopwords()) + _CONTENT_WORDS
+    # Zipf-like frequencies over a fixed shuffle of the words, so stopwords
+    # and content words are both found among the most frequent ones
+    order = np.random.default_rng(0).permutation(len(words))
+    words = np.array(words, dtype=object)[order]
+    weights = 1.0 / np.arange(1, len(words) + 1)
+    return words, weights / weights.sum()
+
+
+def _sentence(rng, words, weights):
+    n_words = rng.integers(4, 20)
+    tokens = rng.choice(words, size=n_words, p=weights).tolist()
+    tokens[0] = tokens[0].capitalize()
+    if n_words > 8 and rng.random() < 0.3:
+        comma = rng.integers(2, n_words - 2)
+        tokens[comma] += ","
+    return " ".join(tokens) + rng.choice(_PUNCTUATION)
+
+
+def make_corpus(rows, length="medium", missing=0.01, seed=0):
+    """Return a Series of ``rows`` synthetic documents.
+
+    Args:
+        rows (int): The number of documents.
+        length (str): The number of sentences in each document, one of
+            ``LENGTHS``. Defaults to ``"medium"``.
+        missing (float): The fraction of documents replaced with a missing
+            value. Defaults to 0.01.
+        seed (int): The seed of the random generator. Defaults to 0.
+    """
+    if length not in LENGTHS:
+        raise ValueError(f"length must be one of {list(LENGTHS)}")
+    rng = np.random.default_rng(seed)
+    words, weights = _vocabulary()
+    n_sentences = LENGTHS[length]
+    documents = [
+        " ".join(_sentence(rng, words, weights) for _ in range(n_sentences))
+        for _ in range(rows)
+    ]
+    documents = pd.Series(documents, dtype=object)
+    documents[rng.random(rows) < missing] = np.nan
+    return documents
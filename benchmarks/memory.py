@@ -0,0 +1,256 @@
+"""Measures the peak memory of loading and computing every primitive.
+
+Each primitive is measured in a fresh process, so that its models and data are
+loaded from scratch. The process reports the peak memory allocated while
+loading the primitive, by creating it and computing it on a single document,
+and then while computing it on synthetic corpora (see ``benchmarks.corpus``)
+of each of the given numbers of rows, along with the size of the output.
+``lsa[fit]`` measures fitting an LSA trainer on each corpus instead, apart
+from transforming with the prefit trainer measured under ``lsa``.
+Allocations are traced with ``tracemalloc``, which also sees the buffers of
+NumPy arrays, and the growth of the peak resident set size of the process is
+reported where the platform provides it.
+
+The traced peaks are compared with the budgets stored in
+``benchmarks/baselines/memory.json``, and with ``--check`` the run fails if any
+budget is exceeded, if any measurement has no budget, or if any primitive is
+skipped because its data is not installed. ``--save`` stores the measured
+peaks, with some headroom, as the new budgets.
+
+The primitives in ``OPTIONAL`` need data or dependencies that are not installed
+with nlp_primitives: the averaged perceptron tagger data of NLTK, used by
+default by ``PartOfSpeechCount``, and TensorFlow with the TF Hub models of
+``UniversalSentenceEncoder`` and ``Elmo``. ``--exclude-optional`` leaves them
+out, so that ``make benchmark-check`` passes on an install without them. To
+budget them, measure them on an install that has them with
+``--primitives part_of_speech_count universal_sentence_encoder elmo --save``.
+
+Usage::
+
+    python -m benchmarks.memory [--rows 1000 10000] [--primitives lsa]
+        [--exclude-optional] [--headroom 1.5] [--budgets PATH] [--save]
+        [--check]
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.corpus import make_corpus
+from benchmarks.primitives import PRIMITIVES, fit_lsa
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+DEFAULT_BUDGETS = os.path.join(os.path.dirname(__file__), "baselines", "memory.json")
+
+MB = 2**20
+
+# The primitives needing data or dependencies not installed with nlp_primitives
+OPTIONAL = ["part_of_speech_count", "universal_sentence_encoder", "elmo"]
+
+
+def peak_rss():
+    """Return the peak resident set size of this process in bytes, or ``None``
+    if it is not known."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux and in bytes on macOS
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+def output_size(output):
+    if isinstance(output, pd.Series):
+        return output.memory_usage(index=False, deep=True)
+    if isinstance(output, list):
+        return sum(output_size(o) for o in output)
+    return np.asarray(output).nbytes
+
+
+class _Measure:
+    """Traces the peak memory allocated inside a ``with`` block."""
+
+    def __enter__(self):
+        tracemalloc.reset_peak()
+        self._current = tracemalloc.get_traced_memory()[0]
+        self._rss = peak_rss()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.peak = tracemalloc.get_traced_memory()[1] - self._current
+        rss = peak_rss()
+        self.rss = None if rss is None else rss - self._rss
+
+
+def measure_primitive(name, rows):
+    """Return the memory measurements of the primitive ``name``, keyed by
+    measurement name, or ``None`` if the data it needs is not installed.
+
+    Meant to run in a fresh process.
+    """
+    corpora = {n_rows: make_corpus(n_rows) for n_rows in rows}
+    tracemalloc.start()
+    results = {}
+    try:
+        with _Measure() as load:
+            function = PRIMITIVES[name]().get_function()
+            function(make_corpus(1, missing=0))
+    except LookupError:
+        return None
+    results[f"{name}/load"] = {"peak": load.peak, "rss": load.rss}
+
+    for n_rows, corpus in corpora.items():
+        with _Measure() as transform:
+            output = function(corpus)
+        results[f"{name}/transform/{n_rows}"] = {
+            "peak": transform.peak,
+            "rss": transform.rss,
+            "output": output_size(output),
+        }
+        del output
+    tracemalloc.stop()
+    return results
+
+
+def measure_fit(rows):
+    """Return the memory measurements of fitting an LSA trainer on corpora of
+    each number of ``rows``, keyed by measurement name.
+
+    Meant to run in a fresh process.
+    """
+    corpora = {n_rows: make_corpus(n_rows) for n_rows in rows}
+    tracemalloc.start()
+    results = {}
+    for n_rows, corpus in corpora.items():
+        with _Measure() as fit:
+            trainer = fit_lsa(corpus)
+        results[f"lsa[fit]/{n_rows}"] = {"peak": fit.peak, "rss": fit.rss}
+        del trainer
+    tracemalloc.stop()
+    return results
+
+
+def run_isolated(name, rows):
+    """Run ``measure_primitive``, or ``measure_fit`` for ``lsa[fit]``, in a new
+    process."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        if name == "lsa[fit]":
+            return pool.submit(measure_fit, rows).result()
+        return pool.submit(measure_primitive, name, rows).result()
+
+
+def _mb(size):
+    return "" if size is None else f"{size / MB:.1f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument(
+        "--primitives",
+        nargs="+",
+        choices=list(PRIMITIVES) + ["lsa[fit]"],
+        default=list(PRIMITIVES) + ["lsa[fit]"],
+    )
+    parser.add_argument(
+        "--exclude-optional",
+        action="store_true",
+        help=f"leave out the primitives needing optional data: {', '.join(OPTIONAL)}",
+    )
+    parser.add_argument(
+        "--headroom",
+        type=float,
+        default=1.5,
+        help="budget saved for each measurement, as a multiple of its peak",
+    )
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS)
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="store the measured peaks with headroom as the new budgets",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help=(
+            "exit with an error if any budget is exceeded or missing, or any"
+            " primitive is skipped"
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.exclude_optional:
+        args.primitives = [name for name in args.primitives if name not in OPTIONAL]
+
+    budgets = {}
+    if os.path.exists(args.budgets):
+        with open(args.budgets) as f:
+            budgets = json.load(f)
+
+    print(
+        (
+            f"{'measurement':<48}{'peak (MB)':>10}{'RSS (MB)':>10}"
+            f"{'output (MB)':>13}{'budget (MB)':>13}"
+        ),
+    )
+    results = {}
+    exceeded = []
+    unbudgeted = []
+    skipped = []
+    for name in args.primitives:
+        measurements = run_isolated(name, args.rows)
+        if measurements is None:
+            print(f"Skipping {name}: its NLTK data is not installed")
+            skipped.append(name)
+            continue
+        results.update(measurements)
+        for key, result in measurements.items():
+            budget = budgets.get(key)
+            flag = ""
+            if budget is None:
+                unbudgeted.append(key)
+                flag = "  NO BUDGET"
+            elif result["peak"] > budget * MB:
+                exceeded.append(key)
+                flag = "  OVER BUDGET"
+            print(
+                (
+                    f"{key:<48}{_mb(result['peak']):>10}{_mb(result['rss']):>10}"
+                    f"{_mb(result.get('output')):>13}{budget or '':>13}{flag}"
+                ),
+            )
+    print(f"\n{len(exceeded)} budgets exceeded")
+    if unbudgeted:
+        print(f"Warning: no budget for {', '.join(unbudgeted)}")
+    if skipped:
+        print(f"Warning: skipped {', '.join(skipped)}, their data is not installed")
+
+    if args.save:
+        budgets.update(
+            {
+                key: math.ceil(result["peak"] * args.headroom / MB)
+                for key, result in results.items()
+            },
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(args.budgets)), exist_ok=True)
+        with open(args.budgets, "w") as f:
+            json.dump(dict(sorted(budgets.items())), f, indent=2)
+            f.write("\n")
+        print(f"Saved the budgets to {args.budgets}")
+
+    if args.check and (exceeded or unbudgeted or skipped):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Builds the lexicon of the ``"lexicon"`` part of speech tagger.
+
+The lexicon maps each lowercase word to the Penn Treebank tag it is most often
+given, and is shipped in ``nlp_primitives/data/pos/lexicon.tsv.gz`` so that
+loading the tagger only reads a small table. Its entries come from the
+following sources, each overriding the ones before it:
+
+* ``wordnet``: the WordNet part of speech whose base form, found with morphy,
+  has the most senses tagged in the WordNet semantic concordance, for every
+  WordNet lemma and every word of the NLTK Gutenberg corpus. WordNet only
+  covers nouns, verbs, adjectives and adverbs.
+* the closed-class words listed in ``CLOSED_CLASS``, e.g. determiners,
+  pronouns, prepositions and modals, with their most frequent tag in the Penn
+  Treebank.
+* ``treebank``: the most frequent tag of each word in the NLTK sample of the
+  Penn Treebank, if it is installed.
+
+Words whose tag has the same first letter as the one given by the suffix rules
+of the tagger are left out, since the tagger falls back to those rules.
+
+Usage::
+
+    python -m benchmarks.pos_lexicon [--sources wordnet treebank] [--output PATH]
+"""
+import argparse
+import gzip
+import re
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import nlp_primitives
+from nlp_primitives.pos_tagging import FALLBACK_PATTERNS, LEXICON_PATH
+from nlp_primitives.utilities import add_nltk_data_path
+
+SOURCES = ["wordnet", "treebank"]
+
+# Penn Treebank tag given to words of each WordNet part of speech
+_WORDNET_TAGS = {"n": "NN", "v": "VB", "a": "JJ", "r": "RB"}
+_WORDNET_INDEX_FILES = {"n": "noun", "v": "verb", "a": "adj", "r": "adv"}
+
+_CLOSED_CLASS = {
+    "CC": "and but or nor plus",
+    "CD": """
+        zero one two three four five six seven eight nine ten eleven twelve
+        thirteen fourteen fifteen sixteen seventeen eighteen nineteen twenty
+        thirty forty fifty sixty seventy eighty ninety hundred thousand million
+        billion trillion
+    """,
+    "DT": """
+        a an the this these those all any some each every no another both
+        either neither
+    """,
+    "EX": "there",
+    "IN": """
+        about above across after against along amid amidst among amongst around
+        as at because before behind below beneath beside besides between beyond
+        by despite during except for from if in inside into like near of off on
+        onto out outside over per since than that though although through
+        throughout till toward towards under underneath unless until unlike
+        upon via whether while whilst with within without
+    """,
+    "MD": "can could may might must shall should will would ought",
+    "PRP": """
+        i me you he him she her it we us they them myself yourself himself
+        herself itself ourselves yourselves themselves mine yours hers ours
+        theirs
+    """,
+    "PRP$": "my your his its our their",
+    "RB": """
+        not never also very too so then now here just only even still already
+        again ever quite rather almost perhaps soon always often
+    """,
+    "RP": "up",
+    "TO": "to",
+    "UH": "oh ah yes hello hi hey okay ok please wow alas oops hmm",
+    "VB": "be have do",
+    "VBD": "was were had did",
+    "VBG": "being having doing",
+    "VBN": "been done",
+    "VBP": "am are",
+    "VBZ": "is has does",
+    "WDT": "which whatever whichever",
+    "WP": "who whom what whoever whomever",
+    "WP$": "whose",
+    "WRB": "when where why how whenever wherever",
+}
+# The tag of each closed-class word
+CLOSED_CLASS = {
+    word: tag for tag, words in _CLOSED_CLASS.items() for word in words.split()
+}
+
+
+def wordnet_tags():
+    """Return the most likely WordNet tag of the WordNet lemmas and of the
+    words of the Gutenberg corpus."""
+    add_nltk_data_path()
+    from nltk.corpus import gutenberg, wordnet
+
+    # For each WordNet part of speech, map its lemmas to how often they are
+    # tagged with it in the WordNet semantic concordance, with the number of
+    # senses to break ties. Index lines have the form
+    # "lemma pos synset_cnt p_cnt [ptr_symbol...] sense_cnt tagsense_cnt ..."
+    scores = {}
+    for pos, filename in _WORDNET_INDEX_FILES.items():
+        pos_scores = scores[pos] = {}
+        with wordnet.open(f"index.{filename}") as f:
+            for line in f:
+                if line.startswith(" "):
+                    continue
+                fields = line.split()
+                n_pointers = int(fields[3])
+                tagged_senses = int(fields[5 + n_pointers])
+                pos_scores[fields[0]] = (tagged_senses, int(fields[4 + n_pointers]))
+
+    words = {word for pos_scores in scores.values() for word in pos_scores}
+    words.update(word.lower() for word in gutenberg.words())
+    tags = {}
+    for word in sorted(words):
+        if not word.isalpha():
+            continue
+        best_tag, best_score = None, None
+        for pos, pos_scores in scores.items():
+            score = pos_scores.get(wordnet.morphy(word, pos))
+            if score is not None and (best_score is None or score > best_score):
+                best_tag, best_score = _WORDNET_TAGS[pos], score
+        if best_tag is not None:
+            tags[word] = best_tag
+    return tags
+
+
+def treebank_tags():
+    """Return the most frequent tag of each word in the Penn Treebank sample."""
+    add_nltk_data_path()
+    from nltk.corpus import treebank
+
+    counts = defaultdict(Counter)
+    for word, tag in treebank.tagged_words():
+        if tag[:1].isalpha():
+            counts[word.lower()][tag] += 1
+    return {word: tags.most_common(1)[0][0] for word, tags in counts.items()}
+
+
+def build_lexicon(sources):
+    """Return the lexicon built from ``sources``, a list of ``SOURCES``."""
+    lexicon = {}
+    if "wordnet" in sources:
+        lexicon.update(wordnet_tags())
+    lexicon.update(CLOSED_CLASS)
+    if "treebank" in sources:
+        lexicon.update(treebank_tags())
+
+    patterns = [(re.compile(pattern), tag) for pattern, tag in FALLBACK_PATTERNS]
+
+    def fallback(word):
+        return next(tag for pattern, tag in patterns if pattern.match(word))
+
+    return {word: tag for word, tag in lexicon.items() if tag[:1] != fallback(word)[:1]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", nargs="+", choices=SOURCES, default=SOURCES)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(nlp_primitives.__file__).parent / LEXICON_PATH,
+    )
+    args = parser.parse_args(argv)
+
+    lexicon = build_lexicon(args.sources)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    # A fixed mtime keeps the file identical between builds
+    with gzip.GzipFile(args.output, "wb", mtime=0) as f:
+        for word, tag in sorted(lexicon.items()):
+            f.write(f"{word}\t{tag}\n".encode("utf-8"))
+    print(f"Wrote {len(lexicon)} words to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
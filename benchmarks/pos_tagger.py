@@ -0,0 +1,104 @@
+"""Compares the part of speech taggers available to ``PartOfSpeechCount``.
+
+For each tagger, reports the throughput of tagging cleaned sentences from the
+NLTK Gutenberg corpus shipped with nlp_primitives, and how often its coarse
+part of speech categories agree with the default perceptron tagger.
+
+Usage::
+
+    python -m benchmarks.pos_tagger [--rows 5000]
+"""
+import argparse
+import time
+
+import nltk
+import numpy as np
+from nlp_primitives.pos_tagging import POS_TYPES, TAGGERS, count_tags, get_tagger
+from nlp_primitives.utilities import add_nltk_data_path, clean_tokens
+
+
+def load_sentences(rows):
+    add_nltk_data_path()
+    sentences = nltk.corpus.gutenberg.sents()[:rows]
+    return [clean_tokens(" ".join(sentence)) for sentence in sentences]
+
+
+def time_tagger(name, sentences):
+    """Return the tagged sentences and the seconds taken to load the tagger
+    and to tag the sentences."""
+    start = time.perf_counter()
+    tagger = get_tagger(name)
+    loaded = time.perf_counter()
+    tagged = tagger.tag_sents(sentences)
+    return tagged, loaded - start, time.perf_counter() - loaded
+
+
+def agreement(reference, tagged):
+    """Return the fraction of tokens with the same coarse category, and of
+    sentences with the same ``PartOfSpeechCount`` output."""
+    categories = [
+        (ref_tag[:1], tag[:1])
+        for ref_sent, sent in zip(reference, tagged)
+        for (_, ref_tag), (_, tag) in zip(ref_sent, sent)
+    ]
+    tokens = np.mean([a == b for a, b in categories]) if categories else 1.0
+
+    columns = range(len(reference))
+    reference_counts = count_tags(reference, columns, np.zeros((15, len(reference))))
+    counts = count_tags(tagged, columns, np.zeros((15, len(tagged))))
+    rows = np.mean((reference_counts == counts).all(axis=0))
+    return tokens, rows
+
+
+def per_category_agreement(reference, tagged):
+    """Return the fraction of tokens of each reference category given the same
+    category by the other tagger."""
+    totals = dict.fromkeys(POS_TYPES, 0)
+    matches = dict.fromkeys(POS_TYPES, 0)
+    for ref_sent, sent in zip(reference, tagged):
+        for (_, ref_tag), (_, tag) in zip(ref_sent, sent):
+            category = ref_tag[:1]
+            if category in totals:
+                totals[category] += 1
+                matches[category] += category == tag[:1]
+    return {c: matches[c] / totals[c] for c in POS_TYPES if totals[c]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    sentences = load_sentences(args.rows)
+    n_tokens = sum(len(sentence) for sentence in sentences)
+    print(f"{len(sentences)} sentences, {n_tokens} tokens\n")
+
+    results = {name: time_tagger(name, sentences) for name in TAGGERS}
+    reference = results["perceptron"][0]
+
+    print(
+        (
+            f"{'tagger':<12}{'load (s)':>10}{'tag (s)':>10}{'rows/s':>12}"
+            f"{'tokens/s':>12}{'token agr.':>12}{'row agr.':>10}"
+        ),
+    )
+    for name, (tagged, load_time, tag_time) in results.items():
+        tokens, rows = agreement(reference, tagged)
+        print(
+            (
+                f"{name:<12}{load_time:>10.2f}{tag_time:>10.2f}"
+                f"{len(sentences) / tag_time:>12.0f}{n_tokens / tag_time:>12.0f}"
+                f"{tokens:>12.1%}{rows:>10.1%}"
+            ),
+        )
+
+    for name, (tagged, _, _) in results.items():
+        if name == "perceptron":
+            continue
+        print(f"\nAgreement of {name} by perceptron category:")
+        for category, value in per_category_agreement(reference, tagged).items():
+            print(f"  {category}: {value:.1%}")
+
+
+if __name__ == "__main__":
+    main()
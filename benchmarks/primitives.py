@@ -0,0 +1,295 @@
+"""Measures the throughput and latency of every primitive.
+
+Each primitive is computed on deterministic synthetic corpora (see
+``benchmarks.corpus``) of every combination of the given numbers of rows and
+document lengths, which shows how its cost scales with both. Each timing calls
+the primitive as many times as needed to take at least ``--min-time`` seconds,
+so that fast runs are well above the resolution of the timer, and the best of
+``--repeat`` timings is reported as rows and megabytes per second. The latency
+of computing a single document is reported for each document length. ``LSA``
+is measured both fitting a trainer on the corpus and transforming the corpus
+with the prefit Gutenberg trainer.
+
+Timings depend on the machine, so baselines are not shared: ``--save`` stores
+the results in ``.benchmarks/primitives.json``, which is not committed, and
+later runs on the same machine are compared with it. Runs slower than the
+baseline by more than ``--tolerance`` are flagged as regressions, and with
+``--check`` the run fails on any regression, on any benchmark of the baseline
+skipped because its data is not installed, and when the baseline was recorded
+on another machine.
+
+Usage::
+
+    python -m benchmarks.primitives [--rows 100 1000] [--lengths short long]
+        [--primitives lsa stopword_count] [--repeat 5] [--min-time 0.2]
+        [--tolerance 0.25] [--baseline PATH] [--save] [--check]
+"""
+import argparse
+import json
+import os
+import platform
+import time
+from functools import lru_cache
+
+import nlp_primitives
+from nlp_primitives import (
+    LSA,
+    DiversityScore,
+    MeanCharactersPerSentence,
+    NumberOfSentences,
+    PartOfSpeechCount,
+    PolarityScore,
+    StopwordCount,
+    TextStatistics,
+)
+from nlp_primitives.segmentation import sentence_cache
+from nlp_primitives.utilities import token_cache
+
+from benchmarks.corpus import LENGTHS, make_corpus
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    ".benchmarks",
+    "primitives.json",
+)
+
+# The primitives benchmarked, by the name they are reported under
+PRIMITIVES = {
+    "diversity_score": DiversityScore,
+    "lsa": LSA,
+    "mean_characters_per_sentence": MeanCharactersPerSentence,
+    "number_of_sentences": NumberOfSentences,
+    "number_of_sentences[fast]": lambda: NumberOfSentences(splitter="fast"),
+    "part_of_speech_count": PartOfSpeechCount,
+    "part_of_speech_count[lexicon]": lambda: PartOfSpeechCount(tagger="lexicon"),
+    "polarity_score": PolarityScore,
+    "stopword_count": StopwordCount,
+    "stopword_count[fast]": lambda: StopwordCount(tokenizer="fast"),
+    "text_statistics": TextStatistics,
+}
+if hasattr(nlp_primitives, "UniversalSentenceEncoder"):
+    PRIMITIVES["universal_sentence_encoder"] = nlp_primitives.UniversalSentenceEncoder
+    PRIMITIVES["elmo"] = nlp_primitives.Elmo
+
+LATENCY_CALLS = 20
+
+# The primitives skipped because their data is not installed
+SKIPPED = []
+
+
+def clear_caches():
+    """Empty the shared analysis caches, so every timing includes the work of
+    analyzing the text rather than looking it up."""
+    token_cache.clear()
+    sentence_cache.clear()
+
+
+@lru_cache(maxsize=None)
+def load_function(name):
+    """Return the function of the primitive ``name``, with any models and data
+    it needs loaded, or ``None`` if the data is not installed."""
+    try:
+        function = PRIMITIVES[name]().get_function()
+        function(make_corpus(1, missing=0))
+    except LookupError:
+        print(f"Skipping {name}: its NLTK data is not installed")
+        SKIPPED.append(name)
+        return None
+    return function
+
+
+def time_calls(function, min_time):
+    """Return the mean seconds taken by ``function()``, called as many times as
+    needed to take at least ``min_time`` seconds in total."""
+    calls = 0
+    elapsed = 0.0
+    while elapsed < min_time or calls == 0:
+        clear_caches()
+        start = time.perf_counter()
+        function()
+        elapsed += time.perf_counter() - start
+        calls += 1
+    return elapsed / calls
+
+
+def best_time(function, repeat, min_time):
+    """Return the shortest of ``repeat`` timings of ``function()``."""
+    return min(time_calls(function, min_time) for _ in range(repeat))
+
+
+def fit_lsa(corpus):
+    """Fit an LSA trainer on ``corpus``, bypassing the shared trainer cache."""
+    return LSA(corpus=corpus.dropna().tolist())._fit_trainer()
+
+
+def run_benchmarks(names, rows, lengths, repeat, min_time):
+    """Return the timings of the benchmarks, keyed by benchmark name,
+    document length and number of rows."""
+    results = {}
+    for length in lengths:
+        for n_rows in rows:
+            corpus = make_corpus(n_rows, length)
+            n_chars = int(corpus.str.len().sum())
+            runs = {}
+            for name in names:
+                if name == "lsa[fit]":
+                    runs[name] = lambda: fit_lsa(corpus)
+                    continue
+                function = load_function(name)
+                if function is not None:
+                    runs[name] = lambda function=function: function(corpus)
+            for name, run in runs.items():
+                seconds = best_time(run, repeat, min_time)
+                results[f"{name}/{length}/{n_rows}"] = {
+                    "seconds": seconds,
+                    "rows_per_second": n_rows / seconds,
+                    "mb_per_second": n_chars / seconds / 1e6,
+                }
+                print_result(name, length, n_rows, results)
+    return results
+
+
+def run_latency(names, lengths, min_time):
+    """Return the mean seconds taken to compute a single document of each
+    length, keyed by benchmark name and document length."""
+    results = {}
+    for length in lengths:
+        documents = make_corpus(LATENCY_CALLS, length, missing=0)
+        for name in names:
+            function = None if name == "lsa[fit]" else load_function(name)
+            if function is None:
+                continue
+            singles = [documents[i : i + 1] for i in range(LATENCY_CALLS)]
+            seconds = time_calls(
+                lambda: [function(single) for single in singles],
+                min_time,
+            )
+            results[f"{name}/{length}"] = {"seconds": seconds / LATENCY_CALLS}
+    return results
+
+
+def print_result(name, length, n_rows, results):
+    result = results[f"{name}/{length}/{n_rows}"]
+    print(
+        (
+            f"{name:<32}{length:<8}{n_rows:>8}{result['seconds']:>10.3f}"
+            f"{result['rows_per_second']:>12.0f}{result['mb_per_second']:>8.2f}"
+        ),
+    )
+
+
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "nlp_primitives": nlp_primitives.__version__,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print the change in time of every result found in ``baseline``, and
+    return the names of those slower by more than ``tolerance``."""
+    regressions = []
+    print(f"\n{'benchmark':<56}{'baseline (s)':>14}{'now (s)':>10}{'change':>9}")
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        before = baseline[key]["seconds"]
+        change = result["seconds"] / before - 1
+        flag = ""
+        if change > tolerance:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(
+            f"{key:<56}{before:>14.4f}{result['seconds']:>10.4f}{change:>+9.1%}{flag}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument(
+        "--lengths",
+        nargs="+",
+        choices=list(LENGTHS),
+        default=list(LENGTHS),
+    )
+    parser.add_argument(
+        "--primitives",
+        nargs="+",
+        choices=list(PRIMITIVES) + ["lsa[fit]"],
+        default=list(PRIMITIVES) + ["lsa[fit]"],
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="least number of seconds each timing calls the primitive for",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="store the results as the new baseline",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with an error if any benchmark regressed",
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        (
+            f"{'benchmark':<32}{'length':<8}{'rows':>8}{'time (s)':>10}"
+            f"{'rows/s':>12}{'MB/s':>8}"
+        ),
+    )
+    results = run_benchmarks(
+        args.primitives,
+        args.rows,
+        args.lengths,
+        args.repeat,
+        args.min_time,
+    )
+
+    latency = run_latency(args.primitives, args.lengths, args.min_time)
+    print(f"\n{'single document latency':<40}{'time (ms)':>10}")
+    for key, result in latency.items():
+        print(f"{key:<40}{result['seconds'] * 1e3:>10.2f}")
+    results.update({f"{key}/latency": result for key, result in latency.items()})
+
+    regressions = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["machine"] != machine_info():
+            print("\nThe baseline was recorded on a different machine")
+            if args.check:
+                raise SystemExit(1)
+        regressions = compare(results, baseline["results"], args.tolerance)
+        print(f"\n{len(regressions)} regressions")
+    elif args.check:
+        print(f"\nNo baseline at {args.baseline}, save one with --save first")
+        raise SystemExit(1)
+    if SKIPPED:
+        print(f"\nSkipped {', '.join(SKIPPED)}: their data is not installed")
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump({"machine": machine_info(), "results": results}, f, indent=2)
+            f.write("\n")
+        print(f"\nSaved the baseline to {args.baseline}")
+
+    if args.check and (regressions or SKIPPED):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Compares the sentence splitters available to ``NumberOfSentences``.
+
+For each splitter, reports the throughput of counting the sentences in
+paragraphs of the NLTK Gutenberg corpus shipped with nlp_primitives, and how
+often the fast splitter's counts agree with Punkt's. The paragraphs where the
+counts differ the most are printed to show where the two splitters disagree.
+
+Usage::
+
+    python -m benchmarks.sentence_splitter [--rows 20000] [--examples 5]
+"""
+import argparse
+import time
+
+import nltk
+import numpy as np
+import pandas as pd
+from nlp_primitives import NumberOfSentences
+from nlp_primitives.segmentation import SPLITTERS, sentence_cache
+from nlp_primitives.utilities import add_nltk_data_path
+
+
+def load_paragraphs(rows):
+    add_nltk_data_path()
+    paragraphs = []
+    for fileid in nltk.corpus.gutenberg.fileids():
+        for paragraph in nltk.corpus.gutenberg.raw(fileid).split("\n\n"):
+            paragraph = paragraph.strip()
+            if paragraph:
+                paragraphs.append(paragraph)
+            if len(paragraphs) == rows:
+                return pd.Series(paragraphs)
+    return pd.Series(paragraphs)
+
+
+def time_splitter(name, paragraphs):
+    """Return the sentence counts and the seconds taken to compute them."""
+    sentence_cache.clear()
+    function = NumberOfSentences(splitter=name).get_function()
+    start = time.perf_counter()
+    counts = function(paragraphs)
+    return np.asarray(counts, dtype=float), time.perf_counter() - start
+
+
+def agreement(reference, counts):
+    """Return the fraction of rows with the same count, and the mean absolute
+    difference in counts."""
+    return np.mean(reference == counts), np.mean(np.abs(reference - counts))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--examples", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    paragraphs = load_paragraphs(args.rows)
+    n_chars = paragraphs.str.len().sum()
+    print(f"{len(paragraphs)} paragraphs, {n_chars} characters\n")
+
+    results = {name: time_splitter(name, paragraphs) for name in SPLITTERS}
+    reference = results["punkt"][0]
+
+    print(
+        (
+            f"{'splitter':<12}{'time (s)':>10}{'rows/s':>12}{'MB/s':>10}"
+            f"{'row agr.':>10}{'mean abs. diff.':>17}"
+        ),
+    )
+    for name, (counts, seconds) in results.items():
+        rows, difference = agreement(reference, counts)
+        print(
+            (
+                f"{name:<12}{seconds:>10.2f}{len(paragraphs) / seconds:>12.0f}"
+                f"{n_chars / seconds / 1e6:>10.2f}{rows:>10.1%}{difference:>17.3f}"
+            ),
+        )
+
+    difference = results["fast"][0] - reference
+    print(
+        (
+            f"\nfast splitter finds more sentences in {np.mean(difference > 0):.1%}"
+            f" of rows and fewer in {np.mean(difference < 0):.1%}"
+        ),
+    )
+    for i in np.argsort(-np.abs(difference), kind="stable")[: args.examples]:
+        if difference[i] == 0:
+            break
+        print(f"\npunkt: {reference[i]:.0f}, fast: {results['fast'][0][i]:.0f}")
+        print(f"  {paragraphs[i][:200]!r}")
+
+
+if __name__ == "__main__":
+    main()
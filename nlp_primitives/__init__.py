@@ -1,34 +1,73 @@
 # flake8: noqa
 from nlp_primitives.version import __version__  # isort:skip
 
-import inspect
+import sys
+from functools import lru_cache
+from importlib import import_module
+from importlib.resources import files
 from importlib.util import find_spec
 
-import nltk.data
-import pkg_resources
-from featuretools.primitives import AggregationPrimitive, TransformPrimitive
-
-from nlp_primitives.diversity_score import DiversityScore
-from nlp_primitives.lsa import LSA
-from nlp_primitives.mean_characters_per_sentence import MeanCharactersPerSentence
-from nlp_primitives.number_of_sentences import NumberOfSentences
-from nlp_primitives.part_of_speech_count import PartOfSpeechCount
-from nlp_primitives.polarity_score import PolarityScore
-from nlp_primitives.stopword_count import StopwordCount
-
-if find_spec("tensorflow") and find_spec("tensorflow_hub"):
-    from nlp_primitives.tensorflow import Elmo, UniversalSentenceEncoder
-
-NLP_PRIMITIVES = [
-    obj
-    for obj in globals().values()
-    if (
-        inspect.isclass(obj)
-        and obj is not AggregationPrimitive
-        and obj is not TransformPrimitive
-        and issubclass(obj, (AggregationPrimitive, TransformPrimitive))
-    )
-]
-
-nltk_data_path = pkg_resources.resource_filename("nlp_primitives", "data/nltk-data/")
-nltk.data.path.insert(0, nltk_data_path)
+# The primitives are imported the first time they are used, so that importing
+# nlp_primitives, which featuretools does through its entry points, does not
+# import featuretools, NLTK or scikit-learn.
+_PRIMITIVE_MODULES = {
+    "DiversityScore": "nlp_primitives.diversity_score",
+    "LSA": "nlp_primitives.lsa",
+    "MeanCharactersPerSentence": "nlp_primitives.mean_characters_per_sentence",
+    "NumberOfSentences": "nlp_primitives.number_of_sentences",
+    "PartOfSpeechCount": "nlp_primitives.part_of_speech_count",
+    "PolarityScore": "nlp_primitives.polarity_score",
+    "StopwordCount": "nlp_primitives.stopword_count",
+    "TextStatistics": "nlp_primitives.text_statistics",
+    "Elmo": "nlp_primitives.tensorflow",
+    "UniversalSentenceEncoder": "nlp_primitives.tensorflow",
+}
+_TENSORFLOW_PRIMITIVES = ["Elmo", "UniversalSentenceEncoder"]
+_FUNCTION_MODULES = {"warmup": "nlp_primitives.resources"}
+
+nltk_data_path = str(files(__name__) / "data" / "nltk-data")
+
+
+@lru_cache(maxsize=None)
+def _has_tensorflow():
+    return bool(find_spec("tensorflow") and find_spec("tensorflow_hub"))
+
+
+def _primitive_names():
+    if _has_tensorflow():
+        return list(_PRIMITIVE_MODULES)
+    return [name for name in _PRIMITIVE_MODULES if name not in _TENSORFLOW_PRIMITIVES]
+
+
+def __getattr__(name):
+    if name == "__all__":
+        # The names exported by ``from nlp_primitives import *``, which imports
+        # them through __getattr__. Listed on first use, so that TensorFlow is
+        # only looked for when the primitives are requested.
+        value = _primitive_names() + ["NLP_PRIMITIVES"] + list(_FUNCTION_MODULES)
+        globals()[name] = value
+        return value
+    if name == "NLP_PRIMITIVES":
+        return [__getattr__(primitive) for primitive in _primitive_names()]
+    if name in _FUNCTION_MODULES:
+        module = _FUNCTION_MODULES[name]
+    elif name in _primitive_names():
+        module = _PRIMITIVE_MODULES[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    names = set(_primitive_names()) | set(_FUNCTION_MODULES) | {"NLP_PRIMITIVES"}
+    return sorted(set(globals()) | names)
+
+
+if "nltk.data" in sys.modules:
+    # NLTK is already imported, so the bundled data can be added to its path
+    # right away instead of the first time a primitive loads data
+    from nlp_primitives.utilities import add_nltk_data_path
+
+    add_nltk_data_path()
@@ -3,6 +3,20 @@ import pytest
 from nlp_primitives.tensorflow.universal_sentence_encoder import (
     UniversalSentenceEncoder,
 )
+from nlp_primitives.utilities import add_nltk_data_path
+
+
+def pytest_configure(config):
+    # Some tests load NLTK data directly rather than through a primitive
+    add_nltk_data_path()
+
+
+@pytest.fixture(autouse=True)
+def model_cache_dir(tmp_path_factory, monkeypatch):
+    # Keep fitted models written during the tests out of the user cache
+    cache_dir = tmp_path_factory.getbasetemp() / "model_cache"
+    monkeypatch.setenv("NLP_PRIMITIVES_CACHE_DIR", str(cache_dir))
+    return cache_dir
 
 
 @pytest.fixture(scope="session")
@@ -4,10 +4,12 @@ from featuretools.primitives.base import TransformPrimitive
 from woodwork.column_schema import ColumnSchema
 from woodwork.logical_types import Double, NaturalLanguage
 
-from nlp_primitives.utilities import clean_tokens
+from nlp_primitives.execution import ExecutionMixin, check_n_jobs
+from nlp_primitives.instrumentation import stage
+from nlp_primitives.utilities import get_clean_tokens
 
 
-class DiversityScore(TransformPrimitive):
+class DiversityScore(ExecutionMixin, TransformPrimitive):
     """Calculates the overall complexity of the text based on the total
        number of words used in the text
 
@@ -20,6 +22,14 @@ class DiversityScore(TransformPrimitive):
 
         If a string is missing, return `NaN`
 
+    Args:
+        n_jobs (int, optional): The number of processes to compute the primitive
+            with. Negative values count back from the number of CPUs, so -1 uses
+            all of them. Defaults to 1.
+        deduplicate (bool, optional): Compute the primitive only once for each
+            distinct string, and copy the results to the rows repeating it.
+            Speeds up columns with many repeated values. Defaults to False.
+
     Examples:
         >>> diversity_score = DiversityScore()
         >>> diversity_score(["hi hi hi", "hello its me", "hey what hey what", "a dog ate a basket"]).tolist()
@@ -30,19 +40,26 @@ class DiversityScore(TransformPrimitive):
     input_types = [ColumnSchema(logical_type=NaturalLanguage)]
     return_type = ColumnSchema(logical_type=Double, semantic_tags={"numeric"})
     default_value = 0
+    cost_per_character = 2e-7
+    resources = ["stopwords", "wordnet"]
+
+    def __init__(self, n_jobs=1, deduplicate=False):
+        self.n_jobs = check_n_jobs(n_jobs)
+        self.deduplicate = deduplicate
 
     def get_function(self):
         def diversity_score(x):
-            li = []
-            for el in x:
-                if pd.isnull(el):
-                    li.append(np.nan)
-                else:
-                    el = clean_tokens(el)
-                    if len(el) < 1:
+            with stage("tokenize", len(x)):
+                tokens = [None if pd.isnull(el) else get_clean_tokens(el) for el in x]
+            with stage("score", len(x)):
+                li = []
+                for el in tokens:
+                    if el is None:
+                        li.append(np.nan)
+                    elif len(el) < 1:
                         li.append(0.0)
                     else:
                         li.append(float(len(set(el))) / float(len(el)))
             return pd.Series(li)
 
-        return diversity_score
+        return self._execute(diversity_score)
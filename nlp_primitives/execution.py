@@ -0,0 +1,478 @@
+"""Parallel execution of primitive functions over chunks of a column.
+
+Primitives that accept an ``n_jobs`` argument are computed by a small scheduler
+which estimates the time the primitive will take on a column from the length of
+its strings and a per character cost declared by the primitive. The column is
+computed serially when the time saved by running in parallel would not cover
+the cost of starting workers and moving data to them. Otherwise it is split
+into chunks holding about the same number of characters, so that a few very
+long strings do not hold up a single worker, and the chunks are computed in a
+pool of processes. The work of every primitive holds the GIL, so threads would
+not compute chunks in parallel.
+
+The pools are shared by every primitive in the process. Each worker process
+preloads the NLTK resources the primitives need when it starts, and rebuilds
+the serial function of a primitive once, the first time it is given a chunk for
+it. The results of the chunks are put back together in the order of the input
+column.
+
+Primitives created with ``deduplicate=True`` are only computed once for each
+distinct string in a column, and the results are copied to the rows holding the
+same string.
+
+Dask Series are computed partition by partition in the same way. The primitive
+class and its arguments are put in the task graph once and shared by every
+partition, so that a custom LSA corpus is not copied into each task, and heavy
+models such as fitted LSA trainers and the VADER lexicon are loaded once by each
+Dask worker process, the first time it computes a partition.
+"""
+import math
+import os
+import sys
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from inspect import signature
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from nlp_primitives.instrumentation import (
+    annotate,
+    is_enabled,
+    primitive_call,
+    register_cache,
+)
+from nlp_primitives.utilities import AnalysisCache
+
+try:
+    from featuretools.utils.gen_utils import Library
+except ImportError:
+    # Versions of featuretools without Dask support
+    Library = None
+
+EXECUTORS = ["serial", "process"]
+
+# Number of chunks given to each worker, so that workers which finish early can
+# pick up the remaining chunks of the others
+CHUNKS_PER_JOB = 4
+# Smallest estimated time worth sending to a worker as a chunk, in seconds
+MIN_CHUNK_SECONDS = 0.05
+# Fixed work of computing any row, expressed as a number of characters
+ROW_CHARACTERS = 32
+
+# Rough costs of parallel execution, in seconds
+PROCESS_START_SECONDS = 1.0  # starting a pool and preloading resources
+PROCESS_TASK_SECONDS = 1e-3  # sending a chunk to a process and back
+TRANSFER_SECONDS_PER_CHARACTER = 5e-9  # pickling strings and results
+
+# Resources loaded by every worker process when it starts
+PRELOADED_RESOURCES = ["stopwords", "wordnet", "punkt", "vader_lexicon"]
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+# Serial functions built in a worker process, by primitive class and arguments.
+# Bounded, since functions hold on to their models, e.g. the fitted trainer and
+# custom corpus of LSA, and a long-lived worker may see many argument sets.
+_worker_functions = AnalysisCache(maxsize=8)
+register_cache(
+    "worker_functions",
+    lambda: (_worker_functions.hits, _worker_functions.misses),
+)
+
+
+def check_n_jobs(n_jobs):
+    """Return ``n_jobs`` if it is a valid number of jobs, raising a ValueError
+    otherwise."""
+    if isinstance(n_jobs, bool) or not isinstance(n_jobs, int) or n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer")
+    return n_jobs
+
+
+def effective_n_jobs(n_jobs):
+    """Return the number of processes to use for ``n_jobs``, where -1 means
+    one per CPU, -2 all CPUs but one, and so on."""
+    if n_jobs < 0:
+        return max(os.cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def preload_resources():
+    """Load the NLTK resources used by the primitives into this process.
+
+    Resources that are not installed are skipped, so that the primitives that
+    need them raise the usual ``LookupError`` when they are computed.
+    """
+    from nlp_primitives.resources import load_resources
+
+    load_resources(PRELOADED_RESOURCES)
+
+
+def get_process_pool(n_jobs):
+    """Return the shared pool of ``n_jobs`` worker processes, starting it if
+    needed."""
+    with _pools_lock:
+        pool = _pools.get(("process", n_jobs))
+        if pool is None:
+            pool = _pools[("process", n_jobs)] = ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=preload_resources,
+            )
+        return pool
+
+
+def _has_pool(executor, n_jobs):
+    with _pools_lock:
+        return (executor, n_jobs) in _pools
+
+
+def shutdown_pools():
+    """Stop the workers of every shared pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+def _serial_arguments(primitive):
+    # The arguments to rebuild ``primitive`` with in a worker, which computes
+    # its chunks serially
+    arguments = dict(primitive.get_arguments())
+    if "n_jobs" in signature(type(primitive)).parameters:
+        arguments["n_jobs"] = 1
+    return arguments
+
+
+def _compute_chunk(primitive_class, arguments, chunk, key=None):
+    key = (primitive_class, repr(arguments) if key is None else key)
+    function = _worker_functions.get_or_compute(
+        key,
+        lambda _: primitive_class(**arguments).get_function(),
+    )
+    return function(chunk)
+
+
+def text_lengths(series):
+    """Return the number of characters in each value of ``series``, counting
+    values that are not strings as empty."""
+    return np.fromiter(
+        (len(value) if isinstance(value, str) else 0 for value in series),
+        dtype=np.int64,
+        count=len(series),
+    )
+
+
+def split_by_characters(lengths, n_chunks):
+    """Return the bounds of at most ``n_chunks`` consecutive chunks of rows
+    holding about the same number of characters.
+
+    Args:
+        lengths (np.ndarray): The number of characters in each row.
+        n_chunks (int): The number of chunks to split the rows into.
+
+    Returns:
+        np.ndarray: The first row of each chunk, followed by the number of rows.
+    """
+    weights = np.cumsum(np.asarray(lengths, dtype=np.int64) + ROW_CHARACTERS)
+    if len(weights) == 0:
+        return np.array([0])
+    targets = weights[-1] * np.arange(1, n_chunks) / n_chunks
+    # Each chunk ends with the row that takes it past its share of characters
+    cuts = np.searchsorted(weights, targets, side="left") + 1
+    bounds = np.concatenate([[0], cuts, [len(weights)]])
+    return np.unique(np.clip(bounds, 0, len(weights)))
+
+
+class ExecutionPlan(NamedTuple):
+    """How to compute a primitive on a column."""
+
+    #: One of ``EXECUTORS``
+    executor: str
+    #: The first row of each chunk, followed by the number of rows
+    bounds: np.ndarray
+    #: The estimated seconds taken to compute the column serially
+    serial_seconds: float
+    #: The estimated seconds taken to compute the column with ``executor``
+    seconds: float
+
+
+def plan_execution(lengths, n_jobs, cost_per_character):
+    """Choose how to compute a primitive on a column from an estimate of the
+    time each way would take.
+
+    Args:
+        lengths (np.ndarray): The number of characters in each row.
+        n_jobs (int): The largest number of workers to use.
+        cost_per_character (float): The estimated seconds the primitive takes
+            per character.
+
+    Returns:
+        ExecutionPlan: The chosen plan.
+    """
+    n_rows = len(lengths)
+    characters = int(np.sum(lengths)) + ROW_CHARACTERS * n_rows
+    serial_seconds = cost_per_character * characters
+    serial = ExecutionPlan(
+        "serial",
+        np.array([0, n_rows]),
+        serial_seconds,
+        serial_seconds,
+    )
+    n_chunks = min(
+        n_rows,
+        n_jobs * CHUNKS_PER_JOB,
+        math.ceil(serial_seconds / MIN_CHUNK_SECONDS),
+    )
+    if n_jobs == 1 or n_chunks < 2:
+        return serial
+
+    bounds = split_by_characters(lengths, n_chunks)
+    n_chunks = len(bounds) - 1
+    seconds = (
+        serial_seconds / min(n_jobs, n_chunks)
+        + n_chunks * PROCESS_TASK_SECONDS
+        + characters * TRANSFER_SECONDS_PER_CHARACTER
+    )
+    if not _has_pool("process", n_jobs):
+        seconds += PROCESS_START_SECONDS
+
+    if seconds >= serial_seconds:
+        return serial
+    return ExecutionPlan("process", bounds, serial_seconds, seconds)
+
+
+def combine_results(results, index):
+    """Put the results of consecutive chunks of a column back together.
+
+    Args:
+        results (list): The result of each chunk, either Series or arrays with
+            one column per row of the chunk.
+        index (pd.Index): The index of the whole column.
+    """
+    if isinstance(results[0], pd.Series):
+        combined = pd.concat(results, ignore_index=True)
+        combined.index = index
+        return combined
+    return np.concatenate(results, axis=-1)
+
+
+def _chunks(series, bounds):
+    return [series.iloc[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def run_in_processes(primitive, series, bounds, n_jobs):
+    """Compute the function of ``primitive`` on chunks of ``series`` in a pool
+    of ``n_jobs`` worker processes.
+
+    Args:
+        primitive (PrimitiveBase): A primitive accepting an ``n_jobs`` argument.
+        series (pd.Series): The column to compute the primitive on.
+        bounds (np.ndarray): The first row of each chunk, followed by the
+            number of rows.
+        n_jobs (int): The number of worker processes.
+    """
+    arguments = _serial_arguments(primitive)
+    # The chunks of a deduplicated column are already distinct
+    arguments.pop("deduplicate", None)
+    pool = get_process_pool(n_jobs)
+    try:
+        futures = [
+            pool.submit(_compute_chunk, type(primitive), arguments, chunk)
+            for chunk in _chunks(series, bounds)
+        ]
+        results = [future.result() for future in futures]
+    except BrokenProcessPool:
+        # Start a new pool next time, e.g. after a worker ran out of memory
+        with _pools_lock:
+            if _pools.get(("process", n_jobs)) is pool:
+                del _pools[("process", n_jobs)]
+        raise
+    return combine_results(results, series.index)
+
+
+def factorize_text(series):
+    """Return the position of each value of ``series`` in a Series of its
+    distinct values.
+
+    The distinct values of categorical Series are their categories. Missing
+    values are given the position of a single missing value added at the end
+    of the distinct values.
+
+    Returns:
+        tuple(np.ndarray, pd.Series): The positions and the distinct values.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        uniques = series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series)
+    uniques = pd.Series(uniques).reindex(range(len(uniques) + 1))
+    codes = np.where(codes < 0, len(uniques) - 1, codes)
+    return codes, uniques
+
+
+def run_deduplicated(function, series):
+    """Compute ``function`` on the distinct values of ``series`` only, and copy
+    the results to each row.
+
+    Args:
+        function (callable): A primitive function returning a Series, or an
+            array with one column per row.
+        series (pd.Series): The column to compute the function on.
+    """
+    series = pd.Series(series)
+    codes, uniques = factorize_text(series)
+    if len(uniques) > len(series):
+        # Every value is distinct
+        return function(series)
+
+    annotate(distinct=len(uniques))
+    results = function(uniques)
+    if isinstance(results, pd.Series):
+        results = results.iloc[codes]
+        results.index = series.index
+        return results
+    return np.take(results, codes, axis=-1)
+
+
+def is_dask_series(series):
+    """Return whether ``series`` is a Dask Series, without importing Dask."""
+    dd = sys.modules.get("dask.dataframe")
+    return dd is not None and isinstance(series, dd.Series)
+
+
+def _compute_partition(partition, worker_primitive, n_outputs):
+    primitive_class, arguments, key = worker_primitive
+    values = _compute_chunk(primitive_class, arguments, partition, key=key)
+    values = np.asarray(values, dtype="float64").reshape(n_outputs, -1)
+    return pd.DataFrame(values.T, index=partition.index)
+
+
+def run_on_partitions(primitive, series):
+    """Compute ``primitive`` on each partition of the Dask Series ``series``.
+
+    The outputs are returned as float Series with the partitions of ``series``,
+    a single one for primitives with one output and a list of them otherwise.
+    """
+    from dask import delayed
+    from dask.base import tokenize
+
+    arguments = _serial_arguments(primitive)
+    for name, value in arguments.items():
+        if isinstance(value, Iterator):
+            # It would be consumed by the first worker to read it
+            raise ValueError(
+                (
+                    f"{name} must be a list or a path, not an iterator, to compute"
+                    " the primitive on a Dask Series"
+                ),
+            )
+    # A single object in the graph, sent once to each worker instead of with
+    # every partition, and identified by a hash of the arguments computed once
+    worker_primitive = delayed(
+        (type(primitive), arguments, tokenize(arguments)),
+        pure=True,
+        traverse=False,
+    )
+    n_outputs = primitive.number_output_features
+    meta = pd.DataFrame({i: pd.Series(dtype="float64") for i in range(n_outputs)})
+    frame = series.map_partitions(
+        _compute_partition,
+        worker_primitive,
+        n_outputs,
+        meta=meta,
+    )
+    if n_outputs == 1:
+        return frame[0]
+    return [frame[i] for i in range(n_outputs)]
+
+
+class ExecutionMixin:
+    """Adds parallel execution to a primitive with an ``n_jobs`` argument.
+
+    Primitives set ``cost_per_character`` to a rough estimate of the seconds
+    they take per character of text, and ``resources`` to the names of the
+    resources they load, from ``nlp_primitives.resources.RESOURCES``.
+
+    The arguments listed in ``execution_arguments``, by default ``n_jobs`` and
+    ``deduplicate``, only change how the primitive is computed, not its
+    results, so they are left out of the names of the features. Primitives
+    without an ``n_jobs`` argument are always computed serially, but like the
+    others can be computed on Dask Series.
+    """
+
+    if Library is not None:
+        compatibility = [Library.PANDAS, Library.DASK]
+    n_jobs = 1
+    deduplicate = False
+    cost_per_character = 1e-6
+    resources = []
+    execution_arguments = ["n_jobs", "deduplicate"]
+
+    def get_args_string(self):
+        arguments = [
+            (name, value)
+            for name, value in self.get_arguments()
+            if name not in self.execution_arguments
+        ]
+        if len(arguments) == 0:
+            return ""
+        return ", " + ", ".join(f"{name}={value}" for name, value in arguments)
+
+    def load_resources(self):
+        """Load the resources this primitive needs into this process.
+
+        Returns:
+            WarmupReport: The resources loaded and those whose NLTK data is
+            missing.
+        """
+        from nlp_primitives.resources import load_resources
+
+        return load_resources(self.resources)
+
+    def plan_execution(self, series):
+        """Return the ``ExecutionPlan`` used to compute this primitive on
+        ``series``."""
+        return plan_execution(
+            text_lengths(series),
+            effective_n_jobs(self.n_jobs),
+            self.cost_per_character,
+        )
+
+    def _execute(self, function):
+        """Wrap the serial ``function`` of this primitive so that it runs on
+        each partition of Dask Series, on distinct values only when
+        ``deduplicate`` is set, and may run in parallel when ``n_jobs`` is not
+        1."""
+        n_jobs = effective_n_jobs(self.n_jobs)
+
+        def execute(series):
+            if is_dask_series(series):
+                return run_on_partitions(self, series)
+            if not is_enabled():
+                return run(series)
+            with primitive_call(self.name, len(series)):
+                return run(series)
+
+        def run(series):
+            if self.deduplicate:
+                return run_deduplicated(compute, series)
+            return compute(series)
+
+        def compute(series):
+            if n_jobs == 1:
+                annotate(executor="serial")
+                return function(series)
+            series = pd.Series(series)
+            plan = self.plan_execution(series)
+            annotate(executor=plan.executor)
+            if plan.executor == "process":
+                return run_in_processes(self, series, plan.bounds, n_jobs)
+            return function(series)
+
+        execute.__name__ = function.__name__
+        return execute
@@ -0,0 +1,204 @@
+"""Opt-in timing of the stages of primitive calls.
+
+Instrumentation is off until a listener is registered, for instance by
+recording calls with :func:`record`::
+
+    with record() as recorder:
+        PolarityScore()(texts)
+    recorder.to_dict()
+
+While it is on, each call of a primitive function is described by a dict
+holding the name of the primitive, the number of rows, the total seconds
+taken, the seconds and rows of each stage of the computation, such as
+``"tokenize"``, ``"tag"``, ``"score"`` or ``"transform"``, and the hits and
+misses of the shared caches during the call. The ``"lemmatize"`` stage is
+timed within the ``"tokenize"`` stage, so its time is also counted there, and
+the cache of lemmas is reported as ``"lemmas"``. The dict is handed to every
+listener once the call returns. :func:`log_call` is a listener writing each
+call as a JSON structured log record.
+
+When no listener is registered, each stage costs a single context variable
+lookup. Stages computed in worker processes are not recorded, and the cache
+counts are shared by calls running at the same time in several threads.
+"""
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+logger = logging.getLogger(__name__)
+
+_listeners = []
+_listeners_lock = threading.Lock()
+
+# Functions returning the hits and misses of each shared cache, by name
+_caches = {}
+
+# The record of the primitive call running in the current context, if any
+_current_call = ContextVar("nlp_primitives_call", default=None)
+
+_NO_STAGE = nullcontext()
+
+
+def add_listener(callback):
+    """Call ``callback`` with the record of every primitive call from now on."""
+    with _listeners_lock:
+        _listeners.append(callback)
+
+
+def remove_listener(callback):
+    """Stop calling ``callback`` with the records of primitive calls."""
+    with _listeners_lock:
+        _listeners.remove(callback)
+
+
+def is_enabled():
+    """Return whether any listener is registered."""
+    return bool(_listeners)
+
+
+def register_cache(name, get_counts):
+    """Report the hits and misses of a shared cache with each call.
+
+    Args:
+        name (str): The name the cache is reported under.
+        get_counts (callable): Returns the total number of hits and of misses
+            of the cache so far.
+    """
+    _caches[name] = get_counts
+
+
+def _cache_counts():
+    return {name: get_counts() for name, get_counts in _caches.items()}
+
+
+class _Stage:
+    __slots__ = ("_call", "_name", "_rows", "_start")
+
+    def __init__(self, call, name, rows):
+        self._call = call
+        self._name = name
+        self._rows = rows
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self._start
+        with self._call["lock"]:
+            stage = self._call["stages"].setdefault(
+                self._name,
+                {"seconds": 0.0, "rows": 0},
+            )
+            stage["seconds"] += seconds
+            if self._rows is not None:
+                stage["rows"] += self._rows
+
+
+def stage(name, rows=None):
+    """Return a context manager timing the stage ``name`` of the primitive call
+    running in the current context, if it is being recorded.
+
+    Args:
+        name (str): The name of the stage. The times of stages with the same
+            name are added up.
+        rows (int, optional): The number of rows the stage computes.
+    """
+    call = _current_call.get()
+    if call is None:
+        return _NO_STAGE
+    return _Stage(call, name, rows)
+
+
+def annotate(**fields):
+    """Add ``fields`` to the record of the primitive call running in the
+    current context, if it is being recorded."""
+    call = _current_call.get()
+    if call is not None:
+        with call["lock"]:
+            call.update(fields)
+
+
+@contextmanager
+def primitive_call(name, rows):
+    """Record a call of the primitive ``name`` on ``rows`` rows, and hand the
+    record to the listeners once it returns."""
+    call = {
+        "primitive": name,
+        "rows": rows,
+        "seconds": 0.0,
+        "stages": {},
+        "caches": {},
+        "lock": threading.Lock(),
+    }
+    counts = _cache_counts()
+    token = _current_call.set(call)
+    start = time.perf_counter()
+    try:
+        yield call
+    finally:
+        call["seconds"] = time.perf_counter() - start
+        _current_call.reset(token)
+        del call["lock"]
+        for cache, (hits, misses) in _cache_counts().items():
+            hits -= counts[cache][0]
+            misses -= counts[cache][1]
+            lookups = hits + misses
+            call["caches"][cache] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / lookups if lookups else None,
+            }
+        for listener in list(_listeners):
+            listener(call)
+
+
+class Recorder:
+    """Keeps the records of the primitive calls made while it is active.
+
+    Use :func:`record` to create one.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, call):
+        self.calls.append(call)
+
+    def __enter__(self):
+        add_listener(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        remove_listener(self)
+
+    def totals(self):
+        """Return the seconds spent in each stage, added up over the calls of
+        each primitive."""
+        totals = {}
+        for call in self.calls:
+            stages = totals.setdefault(call["primitive"], {})
+            for name, stage in call["stages"].items():
+                stages[name] = stages.get(name, 0.0) + stage["seconds"]
+        return totals
+
+    def to_dict(self):
+        """Return the records of the calls and the time spent in each stage."""
+        return {"calls": list(self.calls), "totals": self.totals()}
+
+
+def record():
+    """Return a context manager recording the primitive calls made while it is
+    active in a :class:`Recorder`."""
+    return Recorder()
+
+
+def log_call(call):
+    """Log the record of a primitive call as JSON at the ``INFO`` level.
+
+    The record is also attached to the log record as its ``nlp_primitives``
+    attribute. Register with ``add_listener(log_call)``.
+    """
+    logger.info(json.dumps(call), extra={"nlp_primitives": call})
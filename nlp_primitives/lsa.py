@@ -1,31 +1,53 @@
-import nltk
+import os
+from collections.abc import Sequence
+
 import numpy as np
 import pandas as pd
 from featuretools.primitives.base import TransformPrimitive
-from nltk.tokenize.treebank import TreebankWordDetokenizer
-from sklearn.decomposition import TruncatedSVD
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.pipeline import make_pipeline
 from woodwork.column_schema import ColumnSchema
 from woodwork.logical_types import Double, NaturalLanguage
 
-from nlp_primitives.utilities import clean_tokens
+from nlp_primitives.execution import ExecutionMixin
+from nlp_primitives.instrumentation import stage
+from nlp_primitives.lsa_streaming import fit_streaming_trainer, iter_documents
+from nlp_primitives.model_store import corpus_hash, get_trainer, path_hash
+from nlp_primitives.utilities import add_nltk_data_path, get_clean_tokens
 
 
-class LSA(TransformPrimitive):
+class LSA(ExecutionMixin, TransformPrimitive):
     """Calculates the Latent Semantic Analysis Values of NaturalLanguage Input
 
     Description:
         Given a list of strings, transforms those strings using tf-idf and single
-        value decomposition to go from a sparse matrix to a compact matrix with two
-        values for each string. These values represent that Latent Semantic Analysis
-        of each string. By default these values will represent their context with respect to
+        value decomposition to go from a sparse matrix to a compact matrix with
+        ``n_components`` (two by default) values for each string. These values
+        represent that Latent Semantic Analysis of each string. By default these
+        values will represent their context with respect to
         `nltk's gutenberg corpus. <https://www.nltk.org/book/ch02.html#gutenberg-corpus>`_
         Users can optionally pass in a custom corpus when initializing the primitive
-        by specifying the corpus values in a list with the corpus parameter.
+        by specifying the corpus values in a list with the corpus parameter, or the
+        path to a text file containing one document per line.
+
+        Corpora too large to fit in memory can be fit with ``streaming=True``. The
+        corpus, which may then also be any iterable of strings, is read in chunks
+        of ``chunk_size`` documents and hashed into a fixed number of term columns,
+        and the SVD is updated incrementally from each chunk, so memory use does not
+        grow with the size of the corpus. Streaming always uses the randomized SVD
+        and its output approximates that of the regular fit.
 
         If a string is missing, return `NaN`.
 
+        Fitted models are shared by all instances in a process and cached on disk,
+        and a prefit model is shipped for the default configuration, so the corpus
+        only needs to be fit the first time a configuration is used. See
+        :mod:`nlp_primitives.model_store` for details. Fitting time and memory can be
+        traded against fidelity with ``n_components``, ``dtype``, ``max_features``,
+        ``min_df`` and ``n_iter``.
+
+        On Dask Series the primitive is computed partition by partition, and each
+        worker process loads or fits the trainer once, so custom corpora should be
+        a list or a path that the workers can read.
+
         Note: If a small custom corpus is used, the output of the primitive may vary
         depending on the computer architecture being used (Linux, MacOS, Windows). This
         is especially true when using the default "randomized" algorithm for the
@@ -34,10 +56,28 @@ class LSA(TransformPrimitive):
     Args:
         random_seed (int, optional): The random seed value to use for the call to TruncatedSVD.
             Will default to 0 if not specified.
-        custom_corpus (list[str], optional): A list of strings to use as a custom corpus. Will
-            default to the NLTK Gutenberg corpus if not specified.
+        custom_corpus (list[str] or str, optional): A list of strings, or the path to a text file
+            with one document per line, to use as a custom corpus. When streaming, any iterable
+            of strings may be used. Will default to the NLTK Gutenberg corpus if not specified.
         algorithm (str, optional): The algorithm to use for the call to TruncatedSVD. Should be either
             "randomized" or "arpack". Will default to "randomized" if not specified.
+        streaming (bool, optional): Fit the custom corpus out-of-core in a single pass over it
+            with hashed term features. Will default to False if not specified.
+        chunk_size (int, optional): Number of documents processed at a time when streaming.
+            Will default to 10000 if not specified.
+        n_components (int, optional): The number of LSA values calculated for each string.
+            Will default to 2 if not specified.
+        dtype (str, optional): The floating point type used to fit the model and for the output,
+            either "float64" or "float32". Will default to "float64" if not specified.
+        max_features (int, optional): Only keep the most frequent terms of the corpus, or the
+            number of hashed term columns when streaming. Will default to no limit, or
+            2**18 columns when streaming, if not specified.
+        min_df (int or float, optional): Ignore terms found in fewer documents, or a smaller
+            proportion of documents, than this. Will default to 1 if not specified.
+        n_iter (int, optional): The number of iterations of the randomized SVD. Will default to 5,
+            or 2 per chunk when streaming, if not specified.
+        deduplicate (bool, optional): Transform each distinct string only once, and copy the
+            results to the rows repeating it. Will default to False if not specified.
 
     Examples:
         >>> lsa = LSA()
@@ -77,56 +117,166 @@ class LSA(TransformPrimitive):
     input_types = [ColumnSchema(logical_type=NaturalLanguage)]
     return_type = ColumnSchema(logical_type=Double, semantic_tags={"numeric"})
     default_value = 0
+    resources = ["stopwords", "wordnet"]
 
-    def __init__(self, random_seed=0, corpus=None, algorithm="randomized"):
-        self.number_output_features = 2
-        self.n = 2
+    def __init__(
+        self,
+        random_seed=0,
+        corpus=None,
+        algorithm="randomized",
+        streaming=False,
+        chunk_size=10000,
+        n_components=2,
+        dtype="float64",
+        max_features=None,
+        min_df=1,
+        n_iter=None,
+        deduplicate=False,
+    ):
+        self.number_output_features = n_components
+        self.n = n_components
         self.trainer = None
         self.random_seed = random_seed
         self.corpus = corpus
         self.algorithm = algorithm
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self.n_components = n_components
+        self.dtype = dtype
+        self.max_features = max_features
+        self.min_df = min_df
+        self.n_iter = n_iter
+        self.deduplicate = deduplicate
         if self.algorithm not in ["randomized", "arpack"]:
             raise ValueError(
                 "TruncatedSVD algorithm must be either 'randomized' or 'arpack'",
             )
+        if self.streaming and self.corpus is None:
+            raise ValueError("A custom corpus is required when streaming is True")
+        if self.chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        if self.n_components < 1:
+            raise ValueError("n_components must be a positive integer")
+        if self.dtype not in ["float64", "float32"]:
+            raise ValueError("dtype must be either 'float64' or 'float32'")
+
+    def load_resources(self):
+        report = super().load_resources()
+        if self.trainer is None:
+            try:
+                self._create_trainer()
+            except LookupError:
+                # The Gutenberg corpus is needed to fit the default trainer
+                # when the prefit one cannot be used
+                return report._replace(missing=report.missing + ["gutenberg"])
+        return report
+
+    def _corpus_id(self):
+        if self.corpus is None:
+            return "gutenberg"
+        if isinstance(self.corpus, (str, os.PathLike)):
+            return path_hash(self.corpus)
+        if isinstance(self.corpus, Sequence):
+            return corpus_hash(self.corpus)
+        # Other iterables can only be read once, so they cannot be identified
+        # without consuming them
+        return None
 
     def _create_trainer(self):
+        corpus_id = self._corpus_id()
+        if corpus_id is None:
+            self.trainer = self._fit_trainer()
+            return
+        config = {
+            "corpus": corpus_id,
+            "random_seed": self.random_seed,
+            "algorithm": self.algorithm,
+            "n_components": self.n_components,
+            "dtype": self.dtype,
+            "max_features": self.max_features,
+            "min_df": self.min_df,
+            "n_iter": self.n_iter,
+        }
+        if self.streaming:
+            config.update(streaming=True, chunk_size=self.chunk_size)
+        self.trainer = get_trainer(config, self._fit_trainer)
+
+    def _fit_trainer(self):
+        if self.streaming:
+            kwargs = {}
+            if self.max_features is not None:
+                kwargs["n_features"] = self.max_features
+            if self.n_iter is not None:
+                kwargs["n_iter"] = self.n_iter
+            return fit_streaming_trainer(
+                self.corpus,
+                n_components=self.n_components,
+                random_seed=self.random_seed,
+                chunk_size=self.chunk_size,
+                min_df=self.min_df,
+                dtype=self.dtype,
+                **kwargs,
+            )
+        from sklearn.decomposition import TruncatedSVD
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.pipeline import make_pipeline
+
         if self.corpus is None:
-            gutenberg = nltk.corpus.gutenberg.sents()
-            corpus = [" ".join(sent) for sent in gutenberg]
+            add_nltk_data_path()
+            from nltk.corpus import gutenberg
+
+            corpus = [" ".join(sent) for sent in gutenberg.sents()]
         else:
-            corpus = self.corpus
-        svd = TruncatedSVD(random_state=self.random_seed, algorithm=self.algorithm)
+            corpus = list(iter_documents(self.corpus))
+        svd = TruncatedSVD(
+            n_components=self.n_components,
+            random_state=self.random_seed,
+            algorithm=self.algorithm,
+            n_iter=5 if self.n_iter is None else self.n_iter,
+        )
+        vectorizer = TfidfVectorizer(
+            dtype=np.dtype(self.dtype),
+            max_features=self.max_features,
+            min_df=self.min_df,
+        )
 
-        self.trainer = make_pipeline(TfidfVectorizer(), svd)
-        self.trainer.fit(corpus)
+        trainer = make_pipeline(vectorizer, svd)
+        trainer.fit(corpus)
+        return trainer
 
     def get_function(self):
+        from nltk.tokenize.treebank import TreebankWordDetokenizer
+
         if self.trainer is None:
             self._create_trainer()
         dtk = TreebankWordDetokenizer()
+        dtype = np.dtype(self.dtype)
 
         def lsa(array):
-            array = pd.Series(array, index=pd.Series(array.index), name="array")
-            copy = array.dropna()
-            copy = copy.apply(lambda x: dtk.detokenize(clean_tokens(x)))
-            li = self.trainer.transform(copy)
-            lsa1 = pd.Series(li[:, 0], index=copy.index)
-            lsa2 = pd.Series(li[:, 1], index=copy.index)
-            array = pd.DataFrame(array)
-            array["l1"] = lsa1
-            array["l2"] = lsa2
-
-            arr = ((np.array(array[["l1", "l2"]])).T).tolist()
-            return pd.Series(arr)
+            array = pd.Series(array)
+            values = np.full((self.n_components, len(array)), np.nan, dtype=dtype)
+            not_null = array.notna().to_numpy()
+            if not_null.any():
+                with stage("tokenize", int(not_null.sum())):
+                    documents = [
+                        dtk.detokenize(list(get_clean_tokens(x)))
+                        for x in array[not_null]
+                    ]
+                with stage("transform", len(documents)):
+                    values[:, not_null] = self.trainer.transform(documents).T
+            if self.n_components == 1:
+                return values[0]
+            return values
 
-        return lsa
+        return self._execute(lsa)
 
     def get_args_string(self):
         # Override base class method to prevent full custom corpus from being
         # displayed in primitive arguments
         strings = []
         for name, value in self.get_arguments():
+            if name in self.execution_arguments:
+                continue
             # format arg to string
             if name == "corpus":
                 value = "user_defined"
@@ -0,0 +1,127 @@
+"""Out-of-core fitting of LSA trainers on corpora too large to hold in memory.
+
+Documents are read in chunks and hashed with a stateless ``HashingVectorizer``,
+so no vocabulary has to be built. Each chunk updates the document frequencies
+and is merged into a small dense sketch of the corpus by a truncated SVD of the
+previous sketch stacked on top of the chunk. Peak memory therefore depends on
+``chunk_size`` and ``n_features`` only, never on the size of the corpus.
+
+Since the inverse document frequencies are only known once the whole corpus has
+been read, the sketch is built from l2 normalized term frequencies and the idf
+weights are applied to the sketch at the end. This makes the fitted components
+an approximation of the ones a one shot TF-IDF and SVD fit would produce.
+"""
+import os
+from itertools import islice
+
+import numpy as np
+
+
+def iter_documents(corpus):
+    """Yield the documents of ``corpus``, which is either an iterable of strings
+    or the path to a text file containing one document per line."""
+    if isinstance(corpus, (str, os.PathLike)):
+        with open(corpus, encoding="utf-8") as f:
+            for line in f:
+                yield line.rstrip("\n")
+    else:
+        yield from corpus
+
+
+def _iter_chunks(documents, chunk_size):
+    documents = iter(documents)
+    while True:
+        chunk = list(islice(documents, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def fit_streaming_trainer(
+    corpus,
+    n_components=2,
+    random_seed=0,
+    chunk_size=10000,
+    n_features=2**18,
+    n_oversamples=10,
+    n_iter=2,
+    min_df=1,
+    dtype="float64",
+):
+    """Fit a hashing TF-IDF and SVD pipeline in a single pass over ``corpus``.
+
+    Args:
+        corpus (iterable[str] or path): The training documents, or the path to a
+            text file with one document per line.
+        n_components (int): Number of LSA components to fit.
+        random_seed (int): Seed for the randomized SVD of each chunk.
+        chunk_size (int): Number of documents read and processed at a time.
+        n_features (int): Number of hashed term columns.
+        n_oversamples (int): Number of extra directions kept in the sketch to
+            limit the error of repeatedly truncating it.
+        n_iter (int): Number of power iterations of each chunk's randomized SVD.
+            The sketch is refined with every chunk, so few are needed.
+        min_df (int or float): Ignore term columns found in fewer documents, or
+            a smaller proportion of documents, than this.
+        dtype (str): The floating point type of the fitted pipeline.
+
+    Returns:
+        sklearn.pipeline.Pipeline: A fitted ``HashingVectorizer``,
+        ``TfidfTransformer`` and ``TruncatedSVD`` pipeline.
+    """
+    import scipy.sparse as sp
+    from sklearn.decomposition import TruncatedSVD
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import normalize
+    from sklearn.utils.extmath import randomized_svd, svd_flip
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    dtype = np.dtype(dtype)
+    hasher = HashingVectorizer(
+        n_features=n_features,
+        alternate_sign=False,
+        norm=None,
+        dtype=dtype,
+    )
+    sketch_size = n_components + n_oversamples
+    document_frequency = np.zeros(n_features, dtype=np.int64)
+    n_documents = 0
+    sketch = sp.csr_matrix((0, n_features), dtype=dtype)
+
+    for chunk in _iter_chunks(iter_documents(corpus), chunk_size):
+        counts = hasher.transform(chunk)
+        document_frequency += np.bincount(counts.indices, minlength=n_features)
+        n_documents += counts.shape[0]
+
+        stacked = sp.vstack([sketch, normalize(counts)], format="csr")
+        _, singular_values, vt = randomized_svd(
+            stacked,
+            min(sketch_size, min(stacked.shape)),
+            n_iter=n_iter,
+            random_state=random_seed,
+        )
+        sketch = sp.csr_matrix(singular_values[:, np.newaxis] * vt)
+
+    # Same smoothed idf as TfidfTransformer(smooth_idf=True)
+    idf = np.log((1 + n_documents) / (1 + document_frequency)) + 1
+    if isinstance(min_df, float):
+        min_df = min_df * n_documents
+    idf[document_frequency < min_df] = 0
+    idf = idf.astype(dtype)
+    weighted = sketch.toarray() * idf
+    components = np.zeros((n_components, n_features), dtype=dtype)
+    if weighted.shape[0]:
+        u, _, vt = np.linalg.svd(weighted, full_matrices=False)
+        _, vt = svd_flip(u, vt)
+        rank = min(n_components, vt.shape[0])
+        components[:rank] = vt[:rank]
+
+    tfidf = TfidfTransformer()
+    tfidf.idf_ = idf
+    svd = TruncatedSVD(n_components=n_components, random_state=random_seed)
+    svd.components_ = components
+    svd.n_features_in_ = n_features
+    return make_pipeline(hasher, tfidf, svd)
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+import pandas as pd
 from featuretools.primitives.base import TransformPrimitive
-from nltk.tokenize import sent_tokenize
 from woodwork.column_schema import ColumnSchema
 from woodwork.logical_types import Double, NaturalLanguage
 
+from nlp_primitives.execution import ExecutionMixin, check_n_jobs
+from nlp_primitives.segmentation import segment_sentences
 
-class MeanCharactersPerSentence(TransformPrimitive):
+
+class MeanCharactersPerSentence(ExecutionMixin, TransformPrimitive):
     """Determines the mean count of characters per sentence in a given string.
 
     Description:
@@ -15,6 +18,14 @@ class MeanCharactersPerSentence(TransformPrimitive):
 
         If a string is missing, return `NaN`.
 
+    Args:
+        n_jobs (int, optional): The number of processes to compute the primitive
+            with. Negative values count back from the number of CPUs, so -1 uses
+            all of them. Defaults to 1.
+        deduplicate (bool, optional): Compute the primitive only once for each
+            distinct string, and copy the results to the rows repeating it.
+            Speeds up columns with many repeated values. Defaults to False.
+
     Examples:
         >>> x = ['This.', 'Yay! Yay!', 'Dog cat.']
         >>> mean_characters_per_sentence = MeanCharactersPerSentence()
@@ -26,18 +37,28 @@ class MeanCharactersPerSentence(TransformPrimitive):
     input_types = [ColumnSchema(logical_type=NaturalLanguage)]
     return_type = ColumnSchema(logical_type=Double, semantic_tags={"numeric"})
     default_value = 0
+    cost_per_character = 2e-7
+    resources = ["punkt"]
 
-    def get_function(self):
-        def _mean_characters_per_sentence(text):
-            if not isinstance(text, str):
-                return np.nan
-            sentences = sent_tokenize(text)
-            if not len(sentences):
-                return 0.0
-            total = sum(len(s) for s in sentences)
-            return total / len(sentences)
+    def __init__(self, n_jobs=1, deduplicate=False):
+        self.n_jobs = check_n_jobs(n_jobs)
+        self.deduplicate = deduplicate
 
+    def get_function(self):
         def mean_characters_per_sentence(array):
-            return array.apply(_mean_characters_per_sentence)
+            spans = segment_sentences(array)
+            totals = np.bincount(
+                spans.rows(),
+                weights=spans.lengths(),
+                minlength=len(spans.counts),
+            )
+            means = np.divide(
+                totals,
+                spans.counts,
+                out=np.zeros(len(totals)),
+                where=spans.counts > 0,
+            )
+            means[~spans.valid] = np.nan
+            return pd.Series(means, index=array.index)
 
-        return mean_characters_per_sentence
+        return self._execute(mean_characters_per_sentence)
@@ -0,0 +1,205 @@
+"""Storage for the fitted trainers used by the ``LSA`` primitive.
+
+Fitting a trainer on the Gutenberg corpus takes several seconds, so fitted
+trainers are kept at three levels:
+
+* in memory, shared by every ``LSA`` instance in the process,
+* in an on-disk cache, keyed by the trainer configuration and the installed
+  scikit-learn version, and
+* as prefit models shipped with the package for the default configurations.
+
+The on-disk cache lives in ``$NLP_PRIMITIVES_CACHE_DIR`` if set, and in
+``nlp_primitives`` under the user cache directory otherwise.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from importlib.resources import files
+from pathlib import Path
+
+import numpy as np
+
+# Bump whenever the layout of cached or exported trainers changes
+FORMAT_VERSION = 1
+
+# Configurations with a prefit trainer shipped in nlp_primitives/data/lsa. The
+# prefit arrays are cast to the requested dtype, so any dtype matches.
+PREFIT_TRAINERS = [
+    (
+        {
+            "corpus": "gutenberg",
+            "random_seed": 0,
+            "algorithm": "randomized",
+            "n_components": 2,
+            "max_features": None,
+            "min_df": 1,
+            "n_iter": None,
+        },
+        "data/lsa/gutenberg.npz",
+    ),
+]
+
+_trainers = {}
+_lock = threading.Lock()
+
+
+def get_cache_dir():
+    """Return the directory used to cache fitted trainers."""
+    cache_dir = os.environ.get("NLP_PRIMITIVES_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "nlp_primitives"
+
+
+def corpus_hash(corpus):
+    """Return a hex digest identifying the contents of ``corpus``."""
+    digest = hashlib.sha256()
+    for document in corpus:
+        digest.update(str(document).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def path_hash(path):
+    """Return a hex digest identifying the file at ``path`` by its location,
+    size and modification time."""
+    stat = os.stat(path)
+    digest = hashlib.sha256()
+    digest.update(os.path.realpath(path).encode("utf-8"))
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _cache_key(config):
+    import sklearn
+
+    items = sorted(config.items())
+    items += [("format_version", FORMAT_VERSION), ("sklearn", sklearn.__version__)]
+    return tuple(items)
+
+
+def _cache_path(key):
+    digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+    return get_cache_dir() / "lsa" / f"{digest}.joblib"
+
+
+def _find_prefit(config):
+    config = {key: value for key, value in config.items() if key != "dtype"}
+    for prefit_config, filename in PREFIT_TRAINERS:
+        if prefit_config == config:
+            return str(files("nlp_primitives") / filename)
+    return None
+
+
+def _load_cached(path):
+    import joblib
+
+    try:
+        return joblib.load(path)
+    except Exception:
+        # A missing, partially written or incompatible file is treated as a
+        # cache miss and will be overwritten with a freshly fitted trainer.
+        return None
+
+
+def _save_cached(path, trainer):
+    import joblib
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            joblib.dump(trainer, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Caching is an optimization only, e.g. the cache may be read-only
+        pass
+
+
+def get_trainer(config, fit):
+    """Return a fitted trainer for ``config``, calling ``fit()`` only if no
+    trainer for this configuration is found in memory, in the package data or
+    in the on-disk cache.
+
+    Args:
+        config (dict): The values identifying the trainer. The ``corpus`` entry
+            should identify the training corpus, e.g. with :func:`corpus_hash`.
+        fit (callable): Function taking no arguments that returns a newly
+            fitted trainer.
+    """
+    key = _cache_key(config)
+    with _lock:
+        trainer = _trainers.get(key)
+    if trainer is not None:
+        return trainer
+
+    prefit_path = _find_prefit(config)
+    if prefit_path is not None:
+        trainer = load_exported_trainer(
+            prefit_path,
+            random_seed=config["random_seed"],
+            algorithm=config["algorithm"],
+            dtype=config.get("dtype", "float64"),
+        )
+    else:
+        path = _cache_path(key)
+        trainer = _load_cached(path)
+        if trainer is None:
+            trainer = fit()
+            _save_cached(path, trainer)
+
+    with _lock:
+        return _trainers.setdefault(key, trainer)
+
+
+def clear_memory_cache():
+    """Forget all trainers held in memory by this process."""
+    with _lock:
+        _trainers.clear()
+
+
+def export_trainer(trainer, path):
+    """Save the fitted arrays of a TF-IDF and TruncatedSVD pipeline to ``path``.
+
+    Unlike a pickle, the exported file does not depend on the scikit-learn
+    version, which makes it suitable for shipping as package data.
+    """
+    vectorizer = trainer.steps[0][1]
+    svd = trainer.steps[1][1]
+    np.savez_compressed(
+        path,
+        format_version=FORMAT_VERSION,
+        terms="\n".join(vectorizer.get_feature_names_out()),
+        idf=vectorizer.idf_,
+        components=svd.components_,
+    )
+
+
+def load_exported_trainer(path, random_seed=0, algorithm="randomized", dtype="float64"):
+    """Rebuild a fitted pipeline from a file written by :func:`export_trainer`."""
+    from sklearn.decomposition import TruncatedSVD
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.pipeline import make_pipeline
+
+    with np.load(path) as data:
+        if int(data["format_version"]) != FORMAT_VERSION:
+            raise ValueError(f"Unsupported exported trainer format in {path}")
+        terms = str(data["terms"]).split("\n")
+        idf = data["idf"]
+        components = data["components"].astype(dtype)
+
+    vectorizer = TfidfVectorizer(
+        vocabulary={term: i for i, term in enumerate(terms)},
+        dtype=np.dtype(dtype),
+    )
+    vectorizer.idf_ = idf
+    svd = TruncatedSVD(
+        n_components=components.shape[0],
+        random_state=random_seed,
+        algorithm=algorithm,
+    )
+    svd.components_ = components
+    svd.n_features_in_ = components.shape[1]
+    return make_pipeline(vectorizer, svd)
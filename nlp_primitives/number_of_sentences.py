@@ -1,12 +1,24 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+import pandas as pd
 from featuretools.primitives.base import TransformPrimitive
-from nltk.tokenize import sent_tokenize
 from woodwork.column_schema import ColumnSchema
 from woodwork.logical_types import IntegerNullable, NaturalLanguage
 
+from nlp_primitives.execution import ExecutionMixin, check_n_jobs
+from nlp_primitives.segmentation import (
+    SPLITTERS,
+    count_sentences_fast,
+    segment_sentences,
+)
 
-class NumberOfSentences(TransformPrimitive):
+# Rough seconds taken per character of text by each splitter
+_COST_PER_CHARACTER = {"punkt": 2e-7, "fast": 2e-8}
+# Resources loaded by each splitter
+_RESOURCES = {"punkt": ["punkt"], "fast": []}
+
+
+class NumberOfSentences(ExecutionMixin, TransformPrimitive):
     """Determines number of sentences in a string.
 
     Description:
@@ -15,11 +27,31 @@ class NumberOfSentences(TransformPrimitive):
 
         If a string is missing, return `NaN`.
 
+        By default sentences are found with NLTK's Punkt sentence tokenizer.
+        The ``"fast"`` splitter instead ends a sentence at every ``.``, ``!``
+        or ``?`` followed by whitespace, except after a few common
+        abbreviations. It is many times faster on large columns, but unlike
+        Punkt it splits after abbreviations and initials it does not know.
+
+    Args:
+        splitter (str): The sentence splitter to use, either ``"punkt"`` or
+            ``"fast"``. Defaults to ``"punkt"``.
+        n_jobs (int, optional): The number of processes to compute the primitive
+            with. Negative values count back from the number of CPUs, so -1 uses
+            all of them. Defaults to 1.
+        deduplicate (bool, optional): Compute the primitive only once for each
+            distinct string, and copy the results to the rows repeating it.
+            Speeds up columns with many repeated values. Defaults to False.
+
     Examples:
         >>> x = ['This is a test string.', 'This is second string! This is a second string', 'third string.']
         >>> number_of_sentences = NumberOfSentences()
         >>> number_of_sentences(x).tolist()
         [1, 2, 1]
+
+        >>> number_of_sentences = NumberOfSentences(splitter="fast")
+        >>> number_of_sentences(x).tolist()
+        [1, 2, 1]
     """
 
     name = "number_of_sentences"
@@ -27,16 +59,24 @@ class NumberOfSentences(TransformPrimitive):
     return_type = ColumnSchema(logical_type=IntegerNullable, semantic_tags={"numeric"})
     default_value = 0
 
+    def __init__(self, splitter="punkt", n_jobs=1, deduplicate=False):
+        if splitter not in SPLITTERS:
+            raise ValueError(f"splitter must be one of {SPLITTERS}")
+        self.splitter = splitter
+        self.n_jobs = check_n_jobs(n_jobs)
+        self.deduplicate = deduplicate
+        self.cost_per_character = _COST_PER_CHARACTER[splitter]
+        self.resources = _RESOURCES[splitter]
+
     def get_function(self):
-        def _number_of_sentences(text):
-            if not isinstance(text, str):
-                return np.nan
-            if len(text) == 0:
-                return 0
-            sentences = sent_tokenize(text)
-            return len(sentences)
+        if self.splitter == "fast":
+            return self._execute(count_sentences_fast)
 
         def number_of_sentences(array):
-            return array.apply(_number_of_sentences)
+            spans = segment_sentences(array)
+            counts = spans.counts
+            if not spans.valid.all():
+                counts = np.where(spans.valid, counts, np.nan)
+            return pd.Series(counts, index=array.index)
 
-        return number_of_sentences
+        return self._execute(number_of_sentences)
@@ -1,14 +1,24 @@
-import nltk
 import numpy as np
 import pandas as pd
 from featuretools.primitives.base import TransformPrimitive
 from woodwork.column_schema import ColumnSchema
 from woodwork.logical_types import Double, NaturalLanguage
 
-from nlp_primitives.utilities import clean_tokens
+from nlp_primitives.execution import ExecutionMixin, check_n_jobs
+from nlp_primitives.instrumentation import stage
+from nlp_primitives.pos_tagging import POS_TYPES, TAGGERS, count_tags, get_tagger
+from nlp_primitives.utilities import get_clean_tokens
 
+# Rough seconds taken per character of text by each tagger
+_COST_PER_CHARACTER = {"perceptron": 2e-6, "lexicon": 5e-7}
+# Resources loaded by each tagger, besides those used to clean the text
+_TAGGER_RESOURCES = {
+    "perceptron": ["averaged_perceptron_tagger"],
+    "lexicon": ["pos_lexicon"],
+}
 
-class PartOfSpeechCount(TransformPrimitive):
+
+class PartOfSpeechCount(ExecutionMixin, TransformPrimitive):
     """Calculates the occurences of each different part of speech.
 
     Description:
@@ -21,11 +31,31 @@ class PartOfSpeechCount(TransformPrimitive):
 
         If a string is missing, return `NaN`.
 
+        By default words are tagged with NLTK's averaged perceptron tagger. The much
+        faster "lexicon" tagger instead tags each word with its most likely part of
+        speech in a lexicon shipped with nlp_primitives, ignoring its context. Run
+        ``python -m benchmarks.pos_tagger`` from the repository root to compare the
+        speed and agreement of the two on your own data.
+
+    Args:
+        tagger (str, optional): The part of speech tagger to use, either "perceptron"
+            or "lexicon". Will default to "perceptron" if not specified.
+        n_jobs (int, optional): The number of processes to compute the primitive
+            with. Negative values count back from the number of CPUs, so -1 uses
+            all of them. Defaults to 1.
+        deduplicate (bool, optional): Compute the primitive only once for each
+            distinct string, and copy the results to the rows repeating it.
+            Speeds up columns with many repeated values. Defaults to False.
+
     Examples:
         >>> x = ['He was eating cheese', '']
         >>> part_of_speech_count = PartOfSpeechCount()
         >>> part_of_speech_count(x).tolist()
         [[0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [1.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [1.0, 0.0], [0.0, 0.0]]
+
+        >>> part_of_speech_count = PartOfSpeechCount(tagger="lexicon")
+        >>> part_of_speech_count(x).tolist()
+        [[0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [1.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [1.0, 0.0], [0.0, 0.0]]
     """
 
     name = "part_of_speech_count"
@@ -33,40 +63,32 @@ class PartOfSpeechCount(TransformPrimitive):
     return_type = ColumnSchema(logical_type=Double, semantic_tags={"numeric"})
     default_value = 0
 
-    def __init__(self):
+    def __init__(self, tagger="perceptron", n_jobs=1, deduplicate=False):
         self.number_output_features = 15
         self.n = 15
+        self.tagger = tagger
+        if self.tagger not in TAGGERS:
+            raise ValueError(f"tagger must be one of {TAGGERS}")
+        self.n_jobs = check_n_jobs(n_jobs)
+        self.deduplicate = deduplicate
+        self.cost_per_character = _COST_PER_CHARACTER[tagger]
+        self.resources = ["stopwords", "wordnet"] + _TAGGER_RESOURCES[tagger]
 
     def get_function(self):
-        # For more info about the different parts of speech, see here: https://www.ling.upenn.edu/courses/Fall_2003/ling001/penn_treebank_pos.html
-        types = [
-            "C",  # cardinal digits
-            "D",  # determiner
-            "E",  # existential there
-            "F",  # foreign word
-            "I",  # preposition/subordinating conjunction
-            "J",  # adjective
-            "L",  # list marker
-            "M",  # modal
-            "N",  # noun
-            "P",  # pronoun
-            "R",  # adverb
-            "T",  # to
-            "U",  # interjection
-            "V",  # verb
-            "W",  # "wh"-pronoun
-        ]
+        tagger = get_tagger(self.tagger)
 
         def part_of_speech_count(series):
-            result = []
-            for element in series:
-                if pd.isnull(element):
-                    result.append([np.nan] * 15)
-                else:
-                    tags = nltk.pos_tag(clean_tokens(element))
-                    freq_dist = nltk.FreqDist(freq[0] for _, freq in tags)
-                    result.append([float(freq_dist[t]) for t in types])
-            result = (np.array(result).T).tolist()
-            return pd.Series(result)
-
-        return part_of_speech_count
+            series = pd.Series(series)
+            result = np.zeros((len(POS_TYPES), len(series)))
+            not_null = series.notna().to_numpy()
+            result[:, ~not_null] = np.nan
+
+            columns = np.flatnonzero(not_null)
+            with stage("tokenize", len(columns)):
+                tokens = [list(get_clean_tokens(el)) for el in series[not_null]]
+            with stage("tag", len(columns)):
+                tagged = tagger.tag_sents(tokens)
+            with stage("count", len(columns)):
+                return count_tags(tagged, columns, result)
+
+        return self._execute(part_of_speech_count)
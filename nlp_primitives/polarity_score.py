@@ -1,15 +1,15 @@
 import numpy as np
 import pandas as pd
 from featuretools.primitives.base import TransformPrimitive
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-from nltk.tokenize.treebank import TreebankWordDetokenizer
 from woodwork.column_schema import ColumnSchema
 from woodwork.logical_types import Double, NaturalLanguage
 
-from nlp_primitives.utilities import clean_tokens
+from nlp_primitives.execution import ExecutionMixin, check_n_jobs
+from nlp_primitives.instrumentation import stage
+from nlp_primitives.utilities import get_clean_tokens
 
 
-class PolarityScore(TransformPrimitive):
+class PolarityScore(ExecutionMixin, TransformPrimitive):
     """Calculates the polarity of a text on a scale from -1 (negative) to 1 (positive)
 
     Description:
@@ -17,6 +17,14 @@ class PolarityScore(TransformPrimitive):
         to 0 (neutral text), to 1 (positive text). The functions returns a score
         for every given piece of text. If a string is missing, return 'NaN'
 
+    Args:
+        n_jobs (int, optional): The number of processes to compute the primitive
+            with. Negative values count back from the number of CPUs, so -1 uses
+            all of them. Defaults to 1.
+        deduplicate (bool, optional): Compute the primitive only once for each
+            distinct string, and copy the results to the rows repeating it.
+            Speeds up columns with many repeated values. Defaults to False.
+
     Examples:
         >>> x = ['He loves dogs', 'She hates cats', 'There is a dog', '']
         >>> polarity_score = PolarityScore()
@@ -28,29 +36,28 @@ class PolarityScore(TransformPrimitive):
     input_types = [ColumnSchema(logical_type=NaturalLanguage)]
     return_type = ColumnSchema(logical_type=Double, semantic_tags={"numeric"})
     default_value = 0
+    resources = ["stopwords", "wordnet", "vader_lexicon"]
+    cost_per_character = 4e-7
+
+    def __init__(self, n_jobs=1, deduplicate=False):
+        self.n_jobs = check_n_jobs(n_jobs)
+        self.deduplicate = deduplicate
 
     def get_function(self):
-        dtk = TreebankWordDetokenizer()
+        from nlp_primitives.sentiment import get_polarity_engine
+
+        engine = get_polarity_engine()
 
         def polarity_score(x):
-            vader = SentimentIntensityAnalyzer()
-            li = []
-
-            def vader_pol(sentence):
-                return (
-                    vader.polarity_scores(sentence)["pos"]
-                    - vader.polarity_scores(sentence)["neg"]
-                )
-
-            for el in x:
-                if pd.isnull(el):
-                    li.append(np.nan)
-                else:
-                    el = clean_tokens(el)
-                    if len(el) < 1:
-                        li.append(0.0)
+            with stage("tokenize", len(x)):
+                tokens = [None if pd.isnull(el) else get_clean_tokens(el) for el in x]
+            with stage("score", len(x)):
+                li = []
+                for el in tokens:
+                    if el is None:
+                        li.append(np.nan)
                     else:
-                        li.append(vader_pol(dtk.detokenize(el)))
+                        li.append(engine.score_tokens(el))
             return pd.Series(li)
 
-        return polarity_score
+        return self._execute(polarity_score)
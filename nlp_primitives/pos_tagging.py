@@ -0,0 +1,152 @@
+import gzip
+from functools import lru_cache
+from importlib.resources import files
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from nlp_primitives.utilities import add_nltk_data_path
+
+# For more info about the different parts of speech, see here: https://www.ling.upenn.edu/courses/Fall_2003/ling001/penn_treebank_pos.html
+POS_TYPES = [
+    "C",  # cardinal digits
+    "D",  # determiner
+    "E",  # existential there
+    "F",  # foreign word
+    "I",  # preposition/subordinating conjunction
+    "J",  # adjective
+    "L",  # list marker
+    "M",  # modal
+    "N",  # noun
+    "P",  # pronoun
+    "R",  # adverb
+    "T",  # to
+    "U",  # interjection
+    "V",  # verb
+    "W",  # "wh"-pronoun
+]
+TAG_INDEX = {tag: i for i, tag in enumerate(POS_TYPES)}
+
+TAGGERS = ["perceptron", "lexicon"]
+
+# Lexicon of the "lexicon" tagger, built by ``benchmarks.pos_lexicon``
+LEXICON_PATH = "data/pos/lexicon.tsv.gz"
+
+# Used for numbers and for words that are not in the lexicon
+FALLBACK_PATTERNS = [
+    (r"^-?[0-9]+([.,][0-9]+)*$", "CD"),
+    (r".*ing$", "VBG"),
+    (r".*ed$", "VBD"),
+    (r".*ly$", "RB"),
+    (r".*(able|ible|ful|ous|ive|less|ish|ical)$", "JJ"),
+    (r".*", "NN"),
+]
+
+
+@lru_cache(maxsize=None)
+def get_perceptron_tagger():
+    """Return the averaged perceptron tagger shared by the whole process.
+
+    ``nltk.pos_tag`` loads the tagger model from disk on every call, which
+    takes far longer than tagging a short text.
+    """
+    add_nltk_data_path()
+    from nltk.tag import PerceptronTagger
+
+    return PerceptronTagger()
+
+
+def load_lexicon(path=None) -> Dict[str, str]:
+    """Return the most likely tag of each lowercase word in the lexicon at
+    ``path``, a gzipped file of tab separated words and tags. Defaults to the
+    lexicon shipped with nlp_primitives."""
+    if path is None:
+        path = files("nlp_primitives") / LEXICON_PATH
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return dict(line.rstrip("\n").split("\t") for line in f)
+
+
+class LexiconTagger:
+    """Tags each token with its most likely part of speech, ignoring context.
+
+    The lexicon maps lowercase words to the tag they are most often given in
+    a tagged corpus, and covers the closed-class words, e.g. determiners,
+    pronouns, prepositions and modals, along with the content words that a few
+    suffix rules would tag wrongly. Numbers, and the other words, are tagged
+    with those suffix rules, falling back to a noun.
+
+    The tags are only precise to their first letter, which is all
+    ``PartOfSpeechCount`` uses. The tagger is much cheaper than the averaged
+    perceptron tagger since it ignores context, and the suffix rules are only
+    applied once to each of the most recent distinct words.
+
+    Args:
+        lexicon (dict[str, str], optional): The tag of each lowercase word.
+            Defaults to the lexicon shipped with nlp_primitives.
+    """
+
+    def __init__(self, lexicon=None):
+        from nltk.tag import RegexpTagger
+
+        self._lexicon = load_lexicon() if lexicon is None else lexicon
+        fallback = RegexpTagger(FALLBACK_PATTERNS)
+        self._fallback = lru_cache(maxsize=2**16)(
+            lambda word: fallback.tag([word])[0][1],
+        )
+
+    def tag(self, tokens):
+        lexicon = self._lexicon
+        tagged = []
+        for token in tokens:
+            word = token.lower()
+            tag = lexicon.get(word)
+            if tag is None:
+                tag = self._fallback(word)
+            tagged.append((token, tag))
+        return tagged
+
+    def tag_sents(self, sentences):
+        return [self.tag(tokens) for tokens in sentences]
+
+
+@lru_cache(maxsize=None)
+def get_lexicon_tagger():
+    """Return the lexicon tagger shared by the whole process."""
+    return LexiconTagger()
+
+
+def get_tagger(name):
+    """Return the shared tagger called ``name``, one of ``TAGGERS``."""
+    if name == "perceptron":
+        return get_perceptron_tagger()
+    if name == "lexicon":
+        return get_lexicon_tagger()
+    raise ValueError(f"tagger must be one of {TAGGERS}")
+
+
+def count_tags(
+    tagged_sents: Sequence[List[Tuple[str, str]]],
+    columns: Sequence[int],
+    out: np.ndarray,
+) -> np.ndarray:
+    """Add the number of tags of each of the ``POS_TYPES`` categories to ``out``.
+
+    Args:
+        tagged_sents (list): The tagged tokens of each text.
+        columns (list[int]): The column of ``out`` for each text.
+        out (np.ndarray): Array of shape ``(len(POS_TYPES), N)`` to add the
+            counts to.
+
+    Returns:
+        np.ndarray: ``out``
+    """
+    lengths = [len(sent) for sent in tagged_sents]
+    rows = np.fromiter(
+        (TAG_INDEX.get(tag[:1], -1) for sent in tagged_sents for _, tag in sent),
+        dtype=np.intp,
+        count=sum(lengths),
+    )
+    cols = np.repeat(np.asarray(columns, dtype=np.intp), lengths)
+    known = rows >= 0
+    np.add.at(out, (rows[known], cols[known]), 1)
+    return out
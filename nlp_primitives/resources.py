@@ -0,0 +1,149 @@
+"""Loading the NLTK data and models the primitives need ahead of time.
+
+The primitives load their NLTK data and models the first time they are
+computed, which makes the first call in every process slow. :func:`warmup`
+loads everything a set of primitives needs up front, and reports the NLTK data
+that is not installed. Calling it in a server before it forks its workers lets
+the workers share the loaded data instead of each loading it again.
+"""
+from typing import List, NamedTuple
+
+from nlp_primitives.utilities import add_nltk_data_path
+
+
+class WarmupReport(NamedTuple):
+    """The resources loaded by :func:`warmup`, and those that could not be
+    loaded because their NLTK data is not installed."""
+
+    loaded: List[str]
+    missing: List[str]
+
+    def combine(self, other):
+        """Return the resources of this report followed by the new resources
+        of ``other``."""
+        return WarmupReport(
+            loaded=self.loaded + [r for r in other.loaded if r not in self.loaded],
+            missing=self.missing + [r for r in other.missing if r not in self.missing],
+        )
+
+
+def _load_stopwords():
+    from nlp_primitives.utilities import get_stopwords
+
+    get_stopwords()
+
+
+def _load_wordnet():
+    from nlp_primitives.utilities import _default_tokenizer
+
+    add_nltk_data_path()
+    from nltk.corpus import wordnet
+
+    wordnet.ensure_loaded()
+    _default_tokenizer()
+
+
+def _load_punkt():
+    from nlp_primitives.segmentation import get_sentence_tokenizer
+
+    get_sentence_tokenizer()
+
+
+def _load_perceptron_tagger():
+    from nlp_primitives.pos_tagging import get_perceptron_tagger
+
+    get_perceptron_tagger()
+
+
+def _load_pos_lexicon():
+    from nlp_primitives.pos_tagging import get_lexicon_tagger
+
+    get_lexicon_tagger()
+
+
+def _load_vader_lexicon():
+    from nlp_primitives.sentiment import get_polarity_engine
+
+    get_polarity_engine()
+
+
+# Loads each resource into the process. The names are those of the NLTK data
+# to download, except for the part of speech lexicon, shipped with nlp_primitives.
+RESOURCES = {
+    "stopwords": _load_stopwords,
+    "wordnet": _load_wordnet,
+    "punkt": _load_punkt,
+    "averaged_perceptron_tagger": _load_perceptron_tagger,
+    "pos_lexicon": _load_pos_lexicon,
+    "vader_lexicon": _load_vader_lexicon,
+}
+
+
+def load_resources(names):
+    """Load the resources called ``names`` into this process.
+
+    Args:
+        names (list[str]): Names of ``RESOURCES``.
+
+    Returns:
+        WarmupReport: The resources loaded and those whose NLTK data is missing.
+    """
+    loaded, missing = [], []
+    for name in names:
+        try:
+            RESOURCES[name]()
+        except LookupError:
+            missing.append(name)
+        else:
+            loaded.append(name)
+    return WarmupReport(loaded=loaded, missing=missing)
+
+
+def _as_instance(primitive):
+    import nlp_primitives
+
+    if isinstance(primitive, str):
+        by_name = {p.name: p for p in nlp_primitives.NLP_PRIMITIVES}
+        if primitive not in by_name:
+            raise ValueError(f"primitive must be one of {sorted(by_name)}")
+        primitive = by_name[primitive]
+    if isinstance(primitive, type):
+        primitive = primitive()
+    return primitive
+
+
+def warmup(primitives=None):
+    """Load the NLTK data and models needed by ``primitives``.
+
+    Primitives created with different arguments may need different resources,
+    e.g. ``PartOfSpeechCount(tagger="lexicon")`` does not need the perceptron
+    tagger, so instances should be passed for primitives that are not used
+    with their default arguments.
+
+    Args:
+        primitives (list, optional): The primitives to load the resources of, as
+            primitive instances, classes or names. Defaults to every primitive
+            in nlp_primitives, which when TensorFlow is installed includes
+            ``UniversalSentenceEncoder`` and ``Elmo``, whose models are
+            downloaded from TF Hub if they are not cached.
+
+    Returns:
+        WarmupReport: The resources loaded, and those whose NLTK data is missing
+        or whose model could not be downloaded or loaded.
+
+    Examples:
+        >>> from nlp_primitives import NumberOfSentences
+        >>> warmup([NumberOfSentences(), "stopword_count"])
+        WarmupReport(loaded=['punkt', 'stopwords'], missing=[])
+    """
+    if primitives is None:
+        import nlp_primitives
+
+        primitives = nlp_primitives.NLP_PRIMITIVES
+    report = WarmupReport(loaded=[], missing=[])
+    for primitive in primitives:
+        primitive = _as_instance(primitive)
+        load = getattr(primitive, "load_resources", None)
+        if load is not None:
+            report = report.combine(load())
+    return report
@@ -0,0 +1,158 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from nlp_primitives.instrumentation import register_cache, stage
+from nlp_primitives.utilities import AnalysisCache, add_nltk_data_path
+
+SPLITTERS = ["punkt", "fast"]
+
+# Abbreviations whose trailing period does not end a sentence
+_ABBREVIATIONS = ["mr", "mrs", "ms", "dr", "st", "jr", "sr", "vs", "etc", "e.g", "i.e"]
+# One or more terminators, optionally followed by closing quotes or brackets,
+# followed by whitespace or the end of the string, e.g. "end." or 'end?!")'.
+# The abbreviations are only checked once a terminator has been found.
+_SENTENCE_END = re.compile(
+    r"[.!?]"
+    + "".join(rf"(?<!\b{re.escape(abbr)}\.)" for abbr in _ABBREVIATIONS)
+    + r"[.!?]*[\"')\]]*(?=\s|$)",
+    flags=re.IGNORECASE,
+)
+# Matched against the reversed string, finds a last sentence that is missing
+# its terminator. Searching the string itself for r"\w[^.!?]*$" would be
+# quadratic in the length of the string.
+_UNTERMINATED_REVERSED = re.compile(r"[^.!?\w]*\w")
+_WORD = re.compile(r"\w")
+
+_NO_SPANS = np.empty((0, 2), dtype=np.intp)
+_NO_SPANS.flags.writeable = False
+
+
+@lru_cache(maxsize=None)
+def get_sentence_tokenizer():
+    """Return the English Punkt sentence tokenizer shared by the whole process.
+
+    This is the model ``nltk.sent_tokenize`` uses, which looks it up again on
+    every call.
+    """
+    add_nltk_data_path()
+    import nltk.data
+
+    return nltk.data.load("tokenizers/punkt/english.pickle")
+
+
+def _find_sentence_spans(text: str) -> np.ndarray:
+    spans = list(get_sentence_tokenizer().span_tokenize(text))
+    if not spans:
+        return _NO_SPANS
+    spans = np.array(spans, dtype=np.intp)
+    spans.flags.writeable = False
+    return spans
+
+
+# Shared by every primitive that splits text into sentences, so a column used
+# by several primitives in the same feature matrix calculation is only split
+# once.
+sentence_cache = AnalysisCache()
+register_cache("sentences", lambda: (sentence_cache.hits, sentence_cache.misses))
+
+
+def get_sentence_spans(text: str) -> np.ndarray:
+    """Return the sentence boundaries in ``text``, using the shared sentence cache.
+
+    The boundaries are returned as a read-only array of shape ``(k, 2)`` holding
+    the start and end offset of each of the ``k`` sentences, so that
+    ``text[start:end]`` is the sentence ``nltk.sent_tokenize`` would return.
+    """
+    return sentence_cache.get_or_compute(text, _find_sentence_spans)
+
+
+class SentenceSpans(NamedTuple):
+    """The sentence boundaries of every string in a column.
+
+    The boundaries of all rows are stored one after the other, so that the
+    sentences of row ``i`` are found at ``offsets[i]:offsets[i + 1]`` in
+    ``starts`` and ``ends``. Rows that are not strings have no sentences.
+    """
+
+    #: Whether each row is a string
+    valid: np.ndarray
+    #: Number of sentences in each row
+    counts: np.ndarray
+    #: Position of the first sentence of each row, followed by the total
+    offsets: np.ndarray
+    #: Start offset of each sentence within its string
+    starts: np.ndarray
+    #: End offset of each sentence within its string
+    ends: np.ndarray
+
+    def lengths(self) -> np.ndarray:
+        """Return the number of characters in each sentence."""
+        return self.ends - self.starts
+
+    def rows(self) -> np.ndarray:
+        """Return the row of each sentence."""
+        return np.repeat(np.arange(len(self.counts)), self.counts)
+
+
+def segment_sentences(array) -> SentenceSpans:
+    """Split every string in ``array`` into sentences.
+
+    Args:
+        array (iterable): The strings to split. Values that are not strings,
+            such as missing values, are marked as not valid.
+
+    Returns:
+        SentenceSpans: The sentence boundaries of every row.
+    """
+    valid = []
+    spans = []
+    with stage("segment", len(array)):
+        for text in array:
+            is_text = isinstance(text, str)
+            valid.append(is_text)
+            spans.append(get_sentence_spans(text) if is_text else _NO_SPANS)
+
+    counts = np.fromiter((len(s) for s in spans), dtype=np.intp, count=len(spans))
+    offsets = np.zeros(len(counts) + 1, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+    flat = np.concatenate(spans) if spans else _NO_SPANS
+    return SentenceSpans(
+        valid=np.array(valid, dtype=bool),
+        counts=counts,
+        offsets=offsets,
+        starts=flat[:, 0],
+        ends=flat[:, 1],
+    )
+
+
+def count_sentences_fast(array: pd.Series) -> pd.Series:
+    """Count the sentences in every string in ``array`` with a few rules.
+
+    A sentence ends at a run of ``.``, ``!`` or ``?`` that is followed by
+    whitespace or the end of the string, unless it is the period of a common
+    abbreviation such as "Mr.". Text left after the last sentence end, or any
+    text without a sentence end, counts as one more sentence. The rules run
+    over the whole column with pandas string methods, which is far faster than
+    Punkt, but they miss the abbreviations, initials and ellipses Punkt has
+    learned to handle.
+
+    Returns:
+        pd.Series: The number of sentences in each string, and ``NaN`` for
+        values that are not strings.
+    """
+    if not pd.api.types.is_string_dtype(array.dtype):
+        # e.g. a column of only missing values
+        array = array.astype(object)
+    with stage("segment", len(array)):
+        ends = array.str.count(_SENTENCE_END)
+        unterminated = array.str[::-1].str.match(_UNTERMINATED_REVERSED, na=False)
+        unterminated |= ends.eq(0) & array.str.contains(_WORD, na=False)
+        counts = ends + unterminated
+    if counts.dtype == object:
+        # pandas leaves the counts of a column with no strings as objects
+        counts = counts.astype(float)
+    return counts
@@ -0,0 +1,45 @@
+from functools import lru_cache
+from typing import Sequence
+
+from nlp_primitives.utilities import add_nltk_data_path
+
+
+class PolarityEngine:
+    """Scores the polarity of cleaned token lists with VADER.
+
+    The VADER lexicon is loaded once when the engine is created, and each
+    token list is scored exactly once with the public
+    ``SentimentIntensityAnalyzer.polarity_scores``, so that the scores follow
+    those of the installed NLTK release.
+
+    Examples:
+        >>> engine = PolarityEngine()
+        >>> engine.score_tokens(["love", "dog"])
+        0.808
+        >>> engine.score_tokens(["hate", "cat"])
+        -0.787
+    """
+
+    def __init__(self):
+        add_nltk_data_path()
+        from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+        self._analyzer = SentimentIntensityAnalyzer()
+
+    def polarity_scores(self, tokens: Sequence[str]) -> dict:
+        """Return the VADER ``neg``, ``neu``, ``pos`` and ``compound`` scores of
+        a list of tokens."""
+        return self._analyzer.polarity_scores(" ".join(tokens))
+
+    def score_tokens(self, tokens: Sequence[str]) -> float:
+        """Return the positive minus the negative score of a list of tokens."""
+        if len(tokens) < 1:
+            return 0.0
+        scores = self.polarity_scores(tokens)
+        return scores["pos"] - scores["neg"]
+
+
+@lru_cache(maxsize=None)
+def get_polarity_engine() -> PolarityEngine:
+    """Return the polarity engine shared by the whole process."""
+    return PolarityEngine()
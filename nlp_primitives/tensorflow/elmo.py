@@ -2,14 +2,38 @@ from featuretools.primitives.base import TransformPrimitive
 from woodwork.column_schema import ColumnSchema
 from woodwork.logical_types import Double, NaturalLanguage
 
+from nlp_primitives.execution import ExecutionMixin
+from nlp_primitives.tensorflow.embedding_cache import get_embedding_cache
+from nlp_primitives.tensorflow.hub_model import (
+    HubModelMixin,
+    check_batch_size,
+    check_cache_size,
+    embed_in_batches,
+    order_by_length,
+)
 
-class Elmo(TransformPrimitive):
+
+class Elmo(HubModelMixin, ExecutionMixin, TransformPrimitive):
     """Transforms a sentence or short paragraph using deep
     contextualized langauge representations. Usese the following
     pre-trained model [tfhub model](https://tfhub.dev/google/elmo/2)
 
+    Description:
+        The cost of a batch grows with its longest string, so strings are
+        sorted by their number of words and fed to the model in batches of at
+        most ``batch_size`` strings of similar lengths. The embeddings are
+        returned in the order of the input. The model is loaded and kept as
+        described in ``nlp_primitives.tensorflow.hub_model``.
+
     Args:
-        None
+        batch_size (int, optional): The largest number of strings embedded at
+            once. Defaults to 64.
+        cache (bool, optional): If True, store the embeddings in the on-disk
+            cache of ``nlp_primitives.tensorflow.embedding_cache``, and only
+            embed the strings missing from it. Defaults to False.
+        cache_size (float, optional): The largest size of the on-disk cache in
+            megabytes, beyond which the least recently used embeddings are
+            evicted. Defaults to 1024.
 
     Examples:
         >>> Elmo = Elmo()
@@ -29,35 +53,42 @@ class Elmo(TransformPrimitive):
     name = "elmo"
     input_types = [ColumnSchema(logical_type=NaturalLanguage)]
     return_type = ColumnSchema(logical_type=Double, semantic_tags="numeric")
+    execution_arguments = ExecutionMixin.execution_arguments + [
+        "batch_size",
+        "cache",
+        "cache_size",
+    ]
+    handle = "https://tfhub.dev/google/elmo/2"
 
-    def __init__(self):
-        self.handle = "https://tfhub.dev/google/elmo/2"
+    def __init__(self, batch_size=64, cache=False, cache_size=1024):
+        self.batch_size = check_batch_size(batch_size)
+        self.cache = cache
+        self.cache_size = check_cache_size(cache_size)
         self.number_output_features = 1024
         self.n = 1024
 
     def install(self):
-        import tensorflow_hub as hub
+        """Load the model into this process, if it is not loaded yet."""
+        return self.load_model()
 
-        import tensorflow as tf
+    def get_function(self):
+        def embed(texts):
+            return embed_in_batches(
+                self.load_model(),
+                texts,
+                self.batch_size,
+                order=order_by_length(texts),
+            )
 
-        with tf.compat.v1.Session():
-            tf.compat.v1.global_variables_initializer().run()
-            self.embed = hub.Module(self.handle)
+        if self.cache:
+            cache = get_embedding_cache(int(self.cache_size * 2**20))
 
-    def get_function(self):
-        self.install()
-
-        def elmo(col):
-            import tensorflow as tf
-
-            with tf.compat.v1.Session() as session:
-                session.run(
-                    [
-                        tf.compat.v1.global_variables_initializer(),
-                        tf.compat.v1.tables_initializer(),
-                    ],
-                )
-                embeddings = session.run(self.embed(col.tolist()))
-            return embeddings.transpose()
-
-        return elmo
+            def elmo(col):
+                return cache.embed(self.handle, list(col), embed)
+
+        else:
+
+            def elmo(col):
+                return embed(list(col))
+
+        return self._execute(elmo)
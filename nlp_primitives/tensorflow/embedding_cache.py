@@ -0,0 +1,227 @@
+"""An on-disk cache of the embeddings computed by the TensorFlow primitives.
+
+Embedding a string with ``UniversalSentenceEncoder`` or ``Elmo`` is far more
+expensive than reading its embedding back from disk, and feature matrices are
+often recomputed on the same text. The cache is a SQLite database holding one
+row per embedded string, keyed by the model handle and the SHA-256 digest of
+the string, so that only the strings missing from the cache are fed to the
+model. The database is shared by every process using the same file.
+
+Once the embeddings stored take more than ``max_bytes``, the least recently
+used ones are evicted until they take at most ``EVICT_TO`` of the limit.
+
+The database lives in ``embeddings.sqlite`` in the directory returned by
+:func:`nlp_primitives.model_store.get_cache_dir`.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from nlp_primitives.instrumentation import register_cache, stage
+from nlp_primitives.model_store import get_cache_dir
+
+# Bump whenever the layout of the database changes
+FORMAT_VERSION = 1
+
+# Fraction of the size limit the cache is brought back to when evicting, so
+# that writing a few more embeddings does not evict again right away
+EVICT_TO = 0.9
+
+# The caches created by this process, whatever their location and size limit
+_caches = weakref.WeakSet()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    handle TEXT NOT NULL,
+    digest BLOB NOT NULL,
+    vector BLOB NOT NULL,
+    used REAL NOT NULL,
+    PRIMARY KEY (handle, digest)
+);
+CREATE INDEX IF NOT EXISTS embeddings_used ON embeddings (used);
+"""
+
+
+def text_digest(text):
+    """Return the SHA-256 digest identifying ``text`` in the cache."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Embeddings stored in a SQLite database, evicting the least recently
+    used ones beyond a size limit.
+
+    Any error reading or writing the database is treated as a cache miss, since
+    caching is an optimization only, e.g. the cache may be read-only.
+
+    Args:
+        path (str or Path): The SQLite database to store the embeddings in.
+        max_bytes (int): The largest total size of the stored embeddings.
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+        _caches.add(self)
+
+    def _connect(self):
+        # A connection must not be used by both sides of a fork
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.path),
+                timeout=30,
+                check_same_thread=False,
+            )
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != FORMAT_VERSION:
+                connection.executescript("DROP TABLE IF EXISTS embeddings;")
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version = {FORMAT_VERSION}")
+            connection.commit()
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, handle, digests):
+        """Return the stored embeddings of ``digests`` for the model ``handle``,
+        keyed by digest, and mark them as used."""
+        found = {}
+        try:
+            with self._lock:
+                connection = self._connect()
+                for start in range(0, len(digests), 500):
+                    batch = digests[start : start + 500]
+                    rows = connection.execute(
+                        (
+                            "SELECT digest, vector FROM embeddings WHERE handle = ?"
+                            f" AND digest IN ({', '.join('?' * len(batch))})"
+                        ),
+                        [handle, *batch],
+                    )
+                    found.update(rows)
+                connection.executemany(
+                    "UPDATE embeddings SET used = ? WHERE handle = ? AND digest = ?",
+                    [(time.time(), handle, digest) for digest in found],
+                )
+                connection.commit()
+        except (sqlite3.Error, OSError):
+            return {}
+        return {
+            digest: np.frombuffer(vector, dtype=np.float32)
+            for digest, vector in found.items()
+        }
+
+    def put(self, handle, embeddings):
+        """Store ``embeddings``, a dict of vectors keyed by digest, for the
+        model ``handle``, evicting old embeddings beyond the size limit."""
+        now = time.time()
+        rows = [
+            (handle, digest, np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for digest, vector in embeddings.items()
+        ]
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._evict(connection)
+                connection.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _evict(self, connection):
+        size = connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings",
+        ).fetchone()[0]
+        if size <= self.max_bytes:
+            return
+        excess = size - int(self.max_bytes * EVICT_TO)
+        evicted = []
+        for rowid, length in connection.execute(
+            "SELECT rowid, LENGTH(vector) FROM embeddings ORDER BY used",
+        ):
+            if excess <= 0:
+                break
+            evicted.append((rowid,))
+            excess -= length
+        connection.executemany("DELETE FROM embeddings WHERE rowid = ?", evicted)
+
+    def embed(self, handle, texts, embed):
+        """Return the embeddings of ``texts``, only calling ``embed`` on the
+        distinct strings whose embeddings are not stored yet.
+
+        Args:
+            handle (str): The handle of the model computing the embeddings.
+            texts (list[str]): The strings to embed.
+            embed (callable): Takes a list of strings and returns their
+                embeddings, one column per string.
+
+        Returns:
+            np.ndarray: The embeddings, one column per string in the order of
+            ``texts``.
+        """
+        if not texts:
+            return embed([])
+        digests = [text_digest(text) for text in texts]
+        distinct = list(dict.fromkeys(digests))
+        with stage("cache", len(distinct)):
+            stored = self.get(handle, distinct)
+        new_texts = {}
+        for text, digest in zip(texts, digests):
+            if digest not in stored:
+                new_texts.setdefault(digest, text)
+        self.hits += len(stored)
+        self.misses += len(new_texts)
+        if new_texts:
+            new = embed(list(new_texts.values()))
+            new = dict(zip(new_texts, new.T))
+            self.put(handle, new)
+            stored.update(new)
+        return np.stack([stored[digest] for digest in digests], axis=1)
+
+    def clear(self):
+        """Remove every stored embedding."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM embeddings")
+            connection.commit()
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+@lru_cache(maxsize=None)
+def _get_embedding_cache(path, max_bytes):
+    return EmbeddingCache(path, max_bytes)
+
+
+def get_embedding_cache(max_bytes):
+    """Return the ``EmbeddingCache`` in the cache directory, shared by the
+    whole process."""
+    return _get_embedding_cache(get_cache_dir() / "embeddings.sqlite", max_bytes)
+
+
+def _cache_counts():
+    caches = list(_caches)
+    return sum(c.hits for c in caches), sum(c.misses for c in caches)
+
+
+register_cache("embeddings", _cache_counts)
@@ -0,0 +1,178 @@
+"""TensorFlow Hub text embedding modules kept loaded between calls.
+
+Each module is loaded once per process into a graph of its own, with a
+placeholder for the strings to embed, and a session is kept open on that graph.
+Embedding a batch of strings then only feeds the placeholder and runs the
+embedding op, instead of building the module and running its initializers
+again on every call.
+
+Primitives only load their module the first time they are computed, so that
+creating them, e.g. when featuretools lists primitives or deserializes feature
+definitions, neither imports TensorFlow nor loads a module.
+"""
+from functools import lru_cache
+from importlib.util import find_spec
+
+import numpy as np
+
+from nlp_primitives.instrumentation import stage
+
+
+def check_tensorflow(message):
+    """Raise an ImportError with ``message`` if TensorFlow or TensorFlow Hub is
+    not installed, without importing them."""
+    for name in ("tensorflow", "tensorflow_hub"):
+        if find_spec(name) is None:
+            raise ImportError(message)
+
+
+def check_batch_size(batch_size):
+    """Return ``batch_size`` if it is a valid batch size, raising a ValueError
+    otherwise."""
+    if (
+        isinstance(batch_size, bool)
+        or not isinstance(batch_size, int)
+        or batch_size < 1
+    ):
+        raise ValueError("batch_size must be a positive integer")
+    return batch_size
+
+
+class HubModel:
+    """A TensorFlow Hub module embedding strings, with an open session.
+
+    Args:
+        handle (str): The handle or URL of the TF1 Hub module.
+    """
+
+    def __init__(self, handle):
+        import tensorflow_hub as hub
+
+        import tensorflow as tf
+
+        self.handle = handle
+        # The module is built in graph mode inside its own graph, so eager
+        # execution does not need to be disabled for the whole process
+        graph = tf.Graph()
+        with graph.as_default():
+            self._text = tf.compat.v1.placeholder(tf.string, shape=[None])
+            self._embeddings = hub.Module(handle)(self._text)
+            initialize = tf.group(
+                tf.compat.v1.global_variables_initializer(),
+                tf.compat.v1.tables_initializer(),
+            )
+        # Nothing is added to the graph after this, so ops built by mistake on
+        # every call raise an error instead of slowly growing the graph
+        graph.finalize()
+        self._session = tf.compat.v1.Session(graph=graph)
+        self._session.run(initialize)
+
+    @property
+    def n_outputs(self):
+        return int(self._embeddings.shape[-1])
+
+    def embed(self, texts):
+        """Return the embeddings of a batch of strings, one row per string."""
+        return self._session.run(self._embeddings, {self._text: texts})
+
+    def close(self):
+        self._session.close()
+
+
+@lru_cache(maxsize=None)
+def get_hub_model(handle):
+    """Return the ``HubModel`` for ``handle`` shared by the whole process."""
+    return HubModel(handle)
+
+
+class HubModelMixin:
+    """Loads the ``HubModel`` of a primitive the first time it is computed.
+
+    The model is shared by the whole process and never stored on the primitive,
+    so pickling a primitive, e.g. to send it to Dask workers, only ships its
+    arguments, and each worker loads the model once.
+    """
+
+    # The handle of the TF Hub module computing the primitive
+    handle = None
+
+    def load_model(self):
+        """Return the model of this primitive, loading it if needed."""
+        return get_hub_model(self.handle)
+
+    def load_resources(self):
+        """Load the model of this primitive into this process, downloading it
+        if it is not in the TF Hub cache.
+
+        Returns:
+            WarmupReport: The model handle, as loaded or as missing if the model
+            could not be downloaded or loaded.
+        """
+        from nlp_primitives.resources import WarmupReport
+
+        try:
+            self.load_model()
+        except Exception:
+            # e.g. no network access, or an error from TensorFlow
+            return WarmupReport(loaded=[], missing=[self.handle])
+        return WarmupReport(loaded=[self.handle], missing=[])
+
+    def __getstate__(self):
+        # Anything private, such as a loaded model, is not part of the
+        # configuration and is loaded again where the primitive is unpickled
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if not name.startswith("_")
+        }
+
+
+def check_cache_size(cache_size):
+    """Return ``cache_size`` if it is a valid cache size in megabytes, raising
+    a ValueError otherwise."""
+    if (
+        isinstance(cache_size, bool)
+        or not isinstance(cache_size, (int, float))
+        or cache_size <= 0
+    ):
+        raise ValueError("cache_size must be a positive number")
+    return cache_size
+
+
+def order_by_length(texts):
+    """Return the positions of ``texts`` sorted by their number of words.
+
+    Batches of strings taken in this order hold strings of similar lengths,
+    so models whose cost grows with the longest string in a batch waste
+    little time on padding.
+    """
+    lengths = np.fromiter(
+        (len(t.split()) for t in texts), dtype=np.intp, count=len(texts)
+    )
+    return np.argsort(lengths, kind="stable")
+
+
+def embed_in_batches(model, texts, batch_size, order=None):
+    """Embed ``texts`` in batches of at most ``batch_size`` strings.
+
+    Args:
+        model (HubModel): The model to embed the strings with.
+        texts (list[str]): The strings to embed.
+        batch_size (int): The largest number of strings fed to the model at
+            once, which bounds the memory used by the model.
+        order (np.ndarray, optional): The order to feed the strings in, e.g.
+            to batch strings of similar lengths together. Defaults to the order
+            of ``texts``.
+
+    Returns:
+        np.ndarray: The embeddings, one column per string in the order of
+        ``texts``.
+    """
+    if order is None:
+        order = np.arange(len(texts))
+    embeddings = np.empty((model.n_outputs, len(texts)), dtype=np.float32)
+    with stage("embed", len(texts)):
+        for start in range(0, len(texts), batch_size):
+            batch = order[start : start + batch_size]
+            embeddings[:, batch] = model.embed([texts[i] for i in batch]).T
+    return embeddings
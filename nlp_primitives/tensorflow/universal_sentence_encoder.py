@@ -1,15 +1,37 @@
 from featuretools.primitives.base import TransformPrimitive
-from featuretools.utils.gen_utils import import_or_raise
 from woodwork.column_schema import ColumnSchema
 from woodwork.logical_types import Double, NaturalLanguage
 
+from nlp_primitives.execution import ExecutionMixin
+from nlp_primitives.tensorflow.embedding_cache import get_embedding_cache
+from nlp_primitives.tensorflow.hub_model import (
+    HubModelMixin,
+    check_batch_size,
+    check_cache_size,
+    check_tensorflow,
+    embed_in_batches,
+)
 
-class UniversalSentenceEncoder(TransformPrimitive):
+
+class UniversalSentenceEncoder(HubModelMixin, ExecutionMixin, TransformPrimitive):
     """Transforms a sentence or short paragraph to a vector using [tfhub
     model](https://tfhub.dev/google/universal-sentence-encoder/2)
 
+    Description:
+        Strings are fed to the model in batches of ``batch_size``, so that the
+        memory used by the model does not grow with the length of the column.
+        The model is loaded and kept as described in
+        ``nlp_primitives.tensorflow.hub_model``.
+
     Args:
-        None
+        batch_size (int, optional): The largest number of strings embedded at
+            once. Defaults to 256.
+        cache (bool, optional): If True, store the embeddings in the on-disk
+            cache of ``nlp_primitives.tensorflow.embedding_cache``, and only
+            embed the strings missing from it. Defaults to False.
+        cache_size (float, optional): The largest size of the on-disk cache in
+            megabytes, beyond which the least recently used embeddings are
+            evicted. Defaults to 1024.
 
     Examples:
         >>> sentences = ["I like to eat pizza", "The roller coaster was built in 1885.", ""]
@@ -27,30 +49,39 @@ class UniversalSentenceEncoder(TransformPrimitive):
     name = "universal_sentence_encoder"
     input_types = [ColumnSchema(logical_type=NaturalLanguage)]
     return_type = ColumnSchema(logical_type=Double, semantic_tags={"numeric"})
+    execution_arguments = ExecutionMixin.execution_arguments + [
+        "batch_size",
+        "cache",
+        "cache_size",
+    ]
+    handle = "https://tfhub.dev/google/universal-sentence-encoder/2"
+    module_url = handle
 
-    def __init__(self):
+    def __init__(self, batch_size=256, cache=False, cache_size=1024):
         message = (
             "In order to use the UniversalSentenceEncoder primitive install"
             " 'nlp_primitives[complete]'"
         )
-        self.tf = import_or_raise("tensorflow", message)
-        hub = import_or_raise("tensorflow_hub", message)
-        self.tf.compat.v1.disable_eager_execution()
-        self.module_url = "https://tfhub.dev/google/universal-sentence-encoder/2"
-        self.embed = hub.Module(self.module_url)
+        self.batch_size = check_batch_size(batch_size)
+        self.cache = cache
+        self.cache_size = check_cache_size(cache_size)
+        check_tensorflow(message)
         self.number_output_features = 512
         self.n = 512
 
     def get_function(self):
-        def universal_sentence_encoder(col):
-            with self.tf.compat.v1.Session() as session:
-                session.run(
-                    [
-                        self.tf.compat.v1.global_variables_initializer(),
-                        self.tf.compat.v1.tables_initializer(),
-                    ],
-                )
-                embeddings = session.run(self.embed(col.tolist()))
-            return embeddings.transpose()
-
-        return universal_sentence_encoder
+        def embed(texts):
+            return embed_in_batches(self.load_model(), texts, self.batch_size)
+
+        if self.cache:
+            cache = get_embedding_cache(int(self.cache_size * 2**20))
+
+            def universal_sentence_encoder(col):
+                return cache.embed(self.handle, list(col), embed)
+
+        else:
+
+            def universal_sentence_encoder(col):
+                return embed(list(col))
+
+        return self._execute(universal_sentence_encoder)
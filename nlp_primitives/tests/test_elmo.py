@@ -1,7 +1,9 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from nlp_primitives.tensorflow.elmo import Elmo
+from nlp_primitives.tensorflow.hub_model import get_hub_model
 from nlp_primitives.tests.test_utils import (
     PrimitiveT,
     find_applicable_primitives,
@@ -45,6 +47,48 @@ class TestElmo(PrimitiveT):
         np.testing.assert_allclose(correct3, answer3, rtol=1e-04)
         np.testing.assert_allclose(correct4, answer4, rtol=1e-04)
 
+    def test_batches_match(self):
+        words = pd.Series(
+            [
+                "Mitochondria is the powerhouse of the cell",
+                "",
+                "I like to eat pizza",
+                "The roller coaster was built in 1885.",
+                "Hi",
+                "When will humans go to mars?",
+            ],
+            index=[5, 3, 1, 0, 2, 4],
+        )
+        expected = np.stack(
+            [self.primitive().get_function()([word])[:, 0] for word in words],
+            axis=1,
+        )
+        actual = self.primitive(batch_size=2).get_function()(words)
+        assert actual.shape == (1024, 6)
+        np.testing.assert_allclose(actual, expected, rtol=1e-4, atol=1e-5)
+
+    def test_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("NLP_PRIMITIVES_CACHE_DIR", str(tmp_path))
+        words = ["I like to eat pizza", "Hi", "I like to eat pizza"]
+        expected = self.primitive().get_function()(words)
+        function = self.primitive(cache=True).get_function()
+        np.testing.assert_allclose(function(words), expected, rtol=1e-4, atol=1e-5)
+        np.testing.assert_allclose(function(words), expected, rtol=1e-4, atol=1e-5)
+        assert (tmp_path / "embeddings.sqlite").exists()
+
+    def test_model_loaded_once(self):
+        self.primitive().get_function()(["I like to eat pizza"])
+        misses = get_hub_model.cache_info().misses
+        self.primitive(batch_size=1).get_function()(["Hi there", "Hello"])
+        assert get_hub_model.cache_info().misses == misses
+
+    def test_batch_size_not_in_args_string(self):
+        assert self.primitive(batch_size=8).get_args_string() == ""
+
+    def test_bad_batch_size(self):
+        with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+            self.primitive(batch_size=0)
+
     def test_with_featuretools(self, es):
         transform, aggregation = find_applicable_primitives(self.primitive)
         primitive_instance = self.primitive()
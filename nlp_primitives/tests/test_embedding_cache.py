@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from nlp_primitives.instrumentation import primitive_call, record
+from nlp_primitives.tensorflow.elmo import Elmo
+from nlp_primitives.tensorflow.embedding_cache import (
+    EmbeddingCache,
+    get_embedding_cache,
+)
+
+
+class FakeEmbed:
+    """Embeds each string as its length and its number of words."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return np.array(
+            [[len(t) for t in texts], [len(t.split()) for t in texts]],
+            dtype=np.float32,
+        ).reshape(2, len(texts))
+
+
+TEXTS = ["a b c", "", "hello", "a b c", "x y"]
+EXPECTED = np.array([[5, 0, 5, 5, 3], [3, 0, 1, 3, 2]], dtype=np.float32)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite", max_bytes=2**20)
+    yield cache
+    cache.close()
+
+
+def test_only_misses_embedded(cache):
+    embed = FakeEmbed()
+    np.testing.assert_array_equal(cache.embed("model", TEXTS, embed), EXPECTED)
+    assert embed.calls == [["a b c", "", "hello", "x y"]]
+
+    embeddings = cache.embed("model", ["hello", "new text", "a b c"], embed)
+    np.testing.assert_array_equal(embeddings, [[5, 8, 5], [1, 2, 3]])
+    assert embed.calls[1:] == [["new text"]]
+    assert (cache.hits, cache.misses) == (2, 5)
+
+
+def test_keyed_by_handle(cache):
+    embed = FakeEmbed()
+    cache.embed("first", ["hello"], embed)
+    cache.embed("second", ["hello"], embed)
+    assert embed.calls == [["hello"], ["hello"]]
+
+
+def test_shared_between_instances(cache):
+    cache.embed("model", TEXTS, FakeEmbed())
+    embed = FakeEmbed()
+    other = EmbeddingCache(cache.path, max_bytes=2**20)
+    np.testing.assert_array_equal(other.embed("model", TEXTS, embed), EXPECTED)
+    assert embed.calls == []
+    other.close()
+
+
+def test_embed_nothing(cache):
+    embed = FakeEmbed()
+    assert cache.embed("model", [], embed).shape == (2, 0)
+    assert embed.calls == [[]]
+
+
+def test_evicts_least_recently_used(tmp_path):
+    # Each embedding takes 8 bytes, so the cache holds at most 4 of them
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite", max_bytes=32)
+    cache.embed("model", ["a", "b", "c", "d"], FakeEmbed())
+    cache.embed("model", ["a"], FakeEmbed())
+    cache.embed("model", ["e"], FakeEmbed())
+
+    embed = FakeEmbed()
+    cache.embed("model", ["a", "b", "c", "d", "e"], embed)
+    # Evicting down to 90% of the limit removes the two oldest embeddings
+    assert embed.calls == [["b", "c"]]
+    cache.close()
+
+
+def test_unwritable_cache_is_a_miss(tmp_path):
+    (tmp_path / "file").write_text("")
+    cache = EmbeddingCache(tmp_path / "file" / "embeddings.sqlite", max_bytes=2**20)
+    embed = FakeEmbed()
+    np.testing.assert_array_equal(cache.embed("model", TEXTS, embed), EXPECTED)
+    np.testing.assert_array_equal(cache.embed("model", TEXTS, embed), EXPECTED)
+    assert len(embed.calls) == 2
+
+
+def test_get_embedding_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("NLP_PRIMITIVES_CACHE_DIR", str(tmp_path))
+    cache = get_embedding_cache(2**20)
+    assert cache is get_embedding_cache(2**20)
+    assert cache.path == tmp_path / "embeddings.sqlite"
+
+
+def test_cache_hit_rate(cache):
+    with record() as recorder:
+        with primitive_call("embedding", len(TEXTS)):
+            cache.embed("model", TEXTS, FakeEmbed())
+    [call] = recorder.calls
+    assert call["caches"]["embeddings"]["misses"] == 4
+    assert call["stages"]["cache"]["rows"] == 4
+
+
+def test_cache_not_in_args_string():
+    assert Elmo(cache=True, cache_size=10).get_args_string() == ""
+
+
+@pytest.mark.parametrize("cache_size", [0, -1, "10", True])
+def test_bad_cache_size(cache_size):
+    with pytest.raises(ValueError, match="cache_size must be a positive number"):
+        Elmo(cache_size=cache_size)
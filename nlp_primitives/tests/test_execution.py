@@ -0,0 +1,380 @@
+import numpy as np
+import pandas as pd
+import pytest
+from featuretools.primitives import TransformPrimitive
+from featuretools.tests.testing_utils import make_ecommerce_entityset
+
+from nlp_primitives import (
+    LSA,
+    DiversityScore,
+    MeanCharactersPerSentence,
+    NumberOfSentences,
+    PartOfSpeechCount,
+    PolarityScore,
+    StopwordCount,
+    TextStatistics,
+)
+from nlp_primitives.execution import (
+    ExecutionMixin,
+    Library,
+    _compute_chunk,
+    _worker_functions,
+    check_n_jobs,
+    combine_results,
+    effective_n_jobs,
+    factorize_text,
+    plan_execution,
+    run_deduplicated,
+    shutdown_pools,
+    split_by_characters,
+    text_lengths,
+)
+from nlp_primitives.tests.test_utils import find_applicable_primitives, valid_dfs
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pools():
+    yield
+    shutdown_pools()
+
+
+@pytest.fixture(scope="module")
+def es():
+    return make_ecommerce_entityset()
+
+
+@pytest.fixture
+def text():
+    return pd.Series(
+        [
+            "The dogs were running in the park. It was sunny!",
+            np.nan,
+            "",
+            "I love this movie, it is great.",
+            "Mr. Smith hates waiting. He left early?",
+            "hi hi hi",
+            "This is a test string.",
+        ],
+        index=[10, 3, 7, 0, 1, 2, 20],
+    )
+
+
+@pytest.mark.parametrize("n_jobs", [0, 1.5, "2", True])
+def test_bad_n_jobs(n_jobs):
+    with pytest.raises(ValueError, match="n_jobs must be a non-zero integer"):
+        check_n_jobs(n_jobs)
+
+
+def test_effective_n_jobs(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 8)
+    assert effective_n_jobs(3) == 3
+    assert effective_n_jobs(-1) == 8
+    assert effective_n_jobs(-2) == 7
+    assert effective_n_jobs(-20) == 1
+
+
+def test_combine_series_results():
+    results = [pd.Series([1.0, 2.0]), pd.Series([3.0], index=[5])]
+    index = pd.Index([7, 8, 9])
+    combined = combine_results(results, index)
+    pd.testing.assert_series_equal(combined, pd.Series([1.0, 2.0, 3.0], index=index))
+
+
+def test_combine_array_results():
+    results = [np.array([[1, 2], [3, 4]]), np.array([[5], [6]])]
+    combined = combine_results(results, pd.RangeIndex(3))
+    np.testing.assert_array_equal(combined, [[1, 2, 5], [3, 4, 6]])
+
+
+def test_text_lengths():
+    x = pd.Series(["abc", np.nan, "", None, "hi"])
+    np.testing.assert_array_equal(text_lengths(x), [3, 0, 0, 0, 2])
+
+
+def test_split_by_characters():
+    lengths = np.array([1000, 1, 1, 1, 1000, 1])
+    np.testing.assert_array_equal(split_by_characters(lengths, 2), [0, 3, 6])
+    np.testing.assert_array_equal(
+        split_by_characters(np.full(8, 5), 4), [0, 2, 4, 6, 8]
+    )
+
+
+def test_split_by_characters_long_row():
+    # A row longer than a chunk's share gets a chunk of its own
+    lengths = np.array([100000, 0, 0, 0])
+    np.testing.assert_array_equal(split_by_characters(lengths, 4), [0, 1, 4])
+
+
+def test_split_by_characters_no_rows():
+    np.testing.assert_array_equal(split_by_characters(np.array([]), 3), [0])
+
+
+def test_plan_serial_for_small_columns():
+    plan = plan_execution(np.full(10, 100), n_jobs=4, cost_per_character=2e-7)
+    assert plan.executor == "serial"
+    np.testing.assert_array_equal(plan.bounds, [0, 10])
+
+
+def test_plan_serial_for_one_job():
+    plan = plan_execution(np.full(100000, 1000), n_jobs=1, cost_per_character=1e-6)
+    assert plan.executor == "serial"
+
+
+def test_plan_process_for_large_columns():
+    plan = plan_execution(np.full(100000, 1000), n_jobs=4, cost_per_character=1e-6)
+    assert plan.executor == "process"
+    assert plan.seconds < plan.serial_seconds
+    assert len(plan.bounds) == 17
+    assert plan.bounds[0] == 0
+    assert plan.bounds[-1] == 100000
+
+
+def test_primitive_plan():
+    x = pd.Series(["a" * 1000] * 100000)
+    assert StopwordCount(n_jobs=4).plan_execution(x).executor == "process"
+    assert StopwordCount(n_jobs=4).plan_execution(x[:10]).executor == "serial"
+    assert StopwordCount().plan_execution(x).executor == "serial"
+
+
+@pytest.mark.parametrize(
+    "primitive,kwargs",
+    [
+        (DiversityScore, {}),
+        (PolarityScore, {}),
+        (PartOfSpeechCount, {"tagger": "lexicon"}),
+        (StopwordCount, {}),
+        (StopwordCount, {"tokenizer": "fast"}),
+        (NumberOfSentences, {}),
+        (NumberOfSentences, {"splitter": "fast"}),
+        (MeanCharactersPerSentence, {}),
+    ],
+)
+def test_parallel_matches_serial(primitive, kwargs, text):
+    serial = primitive(**kwargs).get_function()(text)
+    parallel_primitive = primitive(n_jobs=2, **kwargs)
+    # Make the column look expensive enough to compute in parallel
+    parallel_primitive.cost_per_character = 1.0
+    assert parallel_primitive.plan_execution(text).executor == "process"
+    parallel = parallel_primitive.get_function()(text)
+
+    if isinstance(serial, pd.Series):
+        pd.testing.assert_index_equal(parallel.index, text.index)
+    np.testing.assert_array_equal(
+        np.asarray(parallel, dtype=float),
+        np.asarray(serial, dtype=float),
+    )
+
+
+def test_parallel_single_row():
+    x = pd.Series(["hi hi hi"])
+    actual = DiversityScore(n_jobs=2).get_function()(x)
+    np.testing.assert_array_equal(actual, [1 / 3])
+
+
+def test_n_jobs_not_in_args_string():
+    assert DiversityScore(n_jobs=4).get_args_string() == ""
+    primitive = StopwordCount(tokenizer="fast", n_jobs=-1)
+    assert primitive.get_args_string() == ", tokenizer=fast"
+    assert dict(primitive.get_arguments()) == {"tokenizer": "fast", "n_jobs": -1}
+
+
+def test_with_featuretools(es):
+    transform, aggregation = find_applicable_primitives(DiversityScore)
+    transform.append(DiversityScore(n_jobs=2))
+    valid_dfs(es, aggregation, transform, DiversityScore.name.upper())
+
+
+@pytest.mark.parametrize(
+    "primitive,kwargs",
+    [
+        (DiversityScore, {}),
+        (PolarityScore, {}),
+        (StopwordCount, {"tokenizer": "fast"}),
+        (NumberOfSentences, {}),
+        (MeanCharactersPerSentence, {"n_jobs": 2}),
+    ],
+)
+def test_dask_partitions(primitive, kwargs, text):
+    dd = pytest.importorskip("dask.dataframe")
+    function = primitive(**kwargs).get_function()
+    expected = function(text)
+
+    actual = function(dd.from_pandas(text, npartitions=3, sort=False))
+    assert isinstance(actual, dd.Series)
+    actual = actual.compute()
+    pd.testing.assert_index_equal(actual.index, text.index)
+    np.testing.assert_array_equal(actual, np.asarray(expected, dtype=float))
+
+
+@pytest.mark.parametrize(
+    "primitive,kwargs",
+    [
+        (PartOfSpeechCount, {"tagger": "lexicon"}),
+        (LSA, {}),
+        (LSA, {"n_components": 1}),
+    ],
+)
+def test_dask_partitions_multiple_outputs(primitive, kwargs, text):
+    dd = pytest.importorskip("dask.dataframe")
+    instance = primitive(**kwargs)
+    function = instance.get_function()
+    expected = np.asarray(function(text)).reshape(
+        instance.number_output_features,
+        len(text),
+    )
+
+    actual = function(dd.from_pandas(text, npartitions=3, sort=False))
+    if instance.number_output_features == 1:
+        actual = [actual]
+    assert len(actual) == instance.number_output_features
+    for values, expected_values in zip(actual, expected):
+        values = values.compute()
+        pd.testing.assert_index_equal(values.index, text.index)
+        np.testing.assert_allclose(values, expected_values)
+
+
+def test_dask_partitions_build_function_once(text):
+    dd = pytest.importorskip("dask.dataframe")
+    _worker_functions.clear()
+    function = DiversityScore().get_function()
+    function(dd.from_pandas(text, npartitions=3, sort=False)).compute(scheduler="sync")
+    assert len(_worker_functions) == 1
+    assert (_worker_functions.hits, _worker_functions.misses) == (2, 1)
+
+
+def test_worker_functions_are_bounded(monkeypatch, text):
+    monkeypatch.setattr(_worker_functions, "maxsize", 2)
+    _worker_functions.clear()
+    for key in range(3):
+        _compute_chunk(DiversityScore, {}, text, key=key)
+    assert len(_worker_functions) == 2
+    assert (DiversityScore, 0) not in _worker_functions
+
+
+def test_dask_partitions_share_arguments(text):
+    dd = pytest.importorskip("dask.dataframe")
+    corpus = ["dogs ate food", "she ate pineapple", "hello"] * 100
+    function = LSA(corpus=corpus, algorithm="arpack").get_function()
+    expected = function(text)
+
+    actual = function(dd.from_pandas(text, npartitions=3, sort=False))
+    # The arguments, with the corpus, are a single task of the graph
+    graph = actual[0].__dask_graph__()
+    shared = [key for key in graph if "tuple-" in str(key)]
+    assert len(shared) == 1
+    for values, expected_values in zip(actual, expected):
+        np.testing.assert_allclose(values.compute(), expected_values)
+
+
+def test_dask_partitions_reject_iterator(text):
+    dd = pytest.importorskip("dask.dataframe")
+    corpus = iter(["dogs ate food", "she ate pineapple", "hello"])
+    function = LSA(corpus=corpus, streaming=True, chunk_size=2).get_function()
+    with pytest.raises(ValueError, match="corpus must be a list or a path"):
+        function(dd.from_pandas(text, npartitions=3, sort=False))
+
+
+def test_dask_compatibility():
+    if Library is None:
+        pytest.skip("featuretools does not support Dask")
+    for primitive in [DiversityScore, LSA, PartOfSpeechCount, StopwordCount]:
+        assert Library.DASK in primitive.compatibility
+
+
+def test_factorize_text():
+    x = pd.Series(["a", "b", "a", None, np.nan])
+    codes, uniques = factorize_text(x)
+    np.testing.assert_array_equal(codes, [0, 1, 0, 2, 2])
+    assert uniques.tolist()[:2] == ["a", "b"]
+    assert pd.isna(uniques[2])
+
+
+def test_factorize_text_categorical():
+    x = pd.Series(["b", None, "b"], dtype=pd.CategoricalDtype(["a", "b"]))
+    codes, uniques = factorize_text(x)
+    np.testing.assert_array_equal(codes, [1, 2, 1])
+    assert uniques.tolist()[:2] == ["a", "b"]
+    assert pd.isna(uniques[2])
+
+
+def test_run_deduplicated_computes_distinct_values():
+    calls = []
+
+    def lengths(series):
+        calls.append(series.tolist())
+        return series.str.len()
+
+    x = pd.Series(["aa", "b", "aa", None, "b"], index=[5, 4, 3, 2, 1])
+    actual = run_deduplicated(lengths, x)
+    assert len(calls) == 1
+    assert calls[0][:2] == ["aa", "b"]
+    assert pd.isna(calls[0][2])
+    expected = pd.Series([2, 1, 2, np.nan, 1], index=x.index)
+    pd.testing.assert_series_equal(actual, expected)
+
+
+def test_run_deduplicated_distinct_values():
+    calls = []
+
+    def lengths(series):
+        calls.append(series.tolist())
+        return series.str.len()
+
+    run_deduplicated(lengths, pd.Series(["a", "bb"]))
+    assert calls == [["a", "bb"]]
+
+
+@pytest.mark.parametrize("dtype", [object, "string", "category"])
+@pytest.mark.parametrize(
+    "primitive,kwargs",
+    [
+        (DiversityScore, {}),
+        (PolarityScore, {}),
+        (PartOfSpeechCount, {"tagger": "lexicon"}),
+        (StopwordCount, {}),
+        (StopwordCount, {"tokenizer": "fast"}),
+        (NumberOfSentences, {}),
+        (NumberOfSentences, {"splitter": "fast"}),
+        (MeanCharactersPerSentence, {}),
+        (TextStatistics, {}),
+        (LSA, {}),
+    ],
+)
+def test_deduplicated_matches(primitive, kwargs, dtype, text):
+    text = pd.concat([text, text.iloc[::-1], text.iloc[:2]]).astype(dtype)
+    expected = primitive(**kwargs).get_function()(text)
+    actual = primitive(deduplicate=True, **kwargs).get_function()(text)
+
+    if isinstance(expected, pd.Series):
+        pd.testing.assert_index_equal(actual.index, text.index)
+    np.testing.assert_array_equal(
+        np.asarray(actual, dtype=float),
+        np.asarray(expected, dtype=float),
+    )
+
+
+def test_deduplicated_in_parallel(text):
+    text = pd.concat([text] * 3)
+    expected = PartOfSpeechCount(tagger="lexicon").get_function()(text)
+    primitive = PartOfSpeechCount(tagger="lexicon", n_jobs=2, deduplicate=True)
+    primitive.cost_per_character = 1.0
+    np.testing.assert_array_equal(primitive.get_function()(text), expected)
+
+
+def test_execution_arguments_are_per_class():
+    class Batched(ExecutionMixin, TransformPrimitive):
+        name = "batched"
+
+        def __init__(self, batch_size=1, n_jobs=1):
+            self.batch_size = batch_size
+            self.n_jobs = n_jobs
+
+    assert Batched(batch_size=8, n_jobs=2).get_args_string() == ", batch_size=8"
+    assert "batch_size" not in ExecutionMixin.execution_arguments
+
+
+def test_deduplicate_not_in_args_string():
+    assert DiversityScore(deduplicate=True).get_args_string() == ""
+    primitive = NumberOfSentences(splitter="fast", deduplicate=True)
+    assert primitive.get_args_string() == ", splitter=fast"
+    assert LSA(deduplicate=True, n_components=3).get_args_string() == ", n_components=3"
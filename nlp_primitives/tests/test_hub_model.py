@@ -0,0 +1,126 @@
+import pickle
+import sys
+
+import numpy as np
+import pytest
+
+from nlp_primitives import warmup
+from nlp_primitives.resources import WarmupReport
+from nlp_primitives.tensorflow import hub_model
+from nlp_primitives.tensorflow.elmo import Elmo
+from nlp_primitives.tensorflow.hub_model import (
+    check_batch_size,
+    check_tensorflow,
+    embed_in_batches,
+    order_by_length,
+)
+
+
+class FakeModel:
+    """Embeds each string as its length and its number of words."""
+
+    n_outputs = 2
+
+    def __init__(self):
+        self.batches = []
+
+    def embed(self, texts):
+        self.batches.append(list(texts))
+        return np.array([[len(t), len(t.split())] for t in texts], dtype=np.float32)
+
+
+TEXTS = ["a b c", "", "hello", "one two three four", "x y"]
+EXPECTED = np.array([[5, 0, 5, 18, 3], [3, 0, 1, 4, 2]], dtype=np.float32)
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 5, 100])
+def test_embed_in_batches(batch_size):
+    model = FakeModel()
+    embeddings = embed_in_batches(model, TEXTS, batch_size)
+    np.testing.assert_array_equal(embeddings, EXPECTED)
+    assert embeddings.dtype == np.float32
+    assert max(len(batch) for batch in model.batches) <= batch_size
+    assert sum(model.batches, []) == TEXTS
+
+
+def test_embed_in_batches_order():
+    model = FakeModel()
+    order = np.array([1, 4, 2, 0, 3])
+    embeddings = embed_in_batches(model, TEXTS, 2, order=order)
+    np.testing.assert_array_equal(embeddings, EXPECTED)
+    assert model.batches == [["", "x y"], ["hello", "a b c"], ["one two three four"]]
+
+
+def test_order_by_length():
+    order = order_by_length(TEXTS)
+    np.testing.assert_array_equal(order, [1, 2, 4, 0, 3])
+
+
+def test_embed_by_length():
+    model = FakeModel()
+    embeddings = embed_in_batches(model, TEXTS, 2, order=order_by_length(TEXTS))
+    np.testing.assert_array_equal(embeddings, EXPECTED)
+    lengths = [[len(t.split()) for t in batch] for batch in model.batches]
+    assert lengths == [[0, 1], [2, 3], [4]]
+
+
+def test_embed_nothing():
+    model = FakeModel()
+    assert embed_in_batches(model, [], 4).shape == (2, 0)
+    assert model.batches == []
+
+
+@pytest.mark.parametrize("batch_size", [0, -1, 1.5, "8", True])
+def test_bad_batch_size(batch_size):
+    with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+        check_batch_size(batch_size)
+
+
+@pytest.fixture
+def loaded(monkeypatch):
+    loaded = []
+
+    def get_hub_model(handle):
+        loaded.append(handle)
+        return FakeModel()
+
+    monkeypatch.setattr(hub_model, "get_hub_model", get_hub_model)
+    return loaded
+
+
+def test_model_loaded_on_first_call(loaded):
+    function = Elmo(batch_size=2).get_function()
+    assert loaded == []
+    embeddings = function(TEXTS)
+    np.testing.assert_array_equal(embeddings, EXPECTED)
+    assert loaded == [Elmo.handle]
+
+
+def test_pickle_ships_configuration(loaded):
+    primitive = Elmo(batch_size=8, cache=True)
+    primitive._model = FakeModel()
+    unpickled = pickle.loads(pickle.dumps(primitive))
+    assert unpickled.get_arguments() == primitive.get_arguments()
+    assert not hasattr(unpickled, "_model")
+    assert loaded == []
+
+
+def test_warmup_loads_model(loaded):
+    report = warmup([Elmo()])
+    assert report.loaded == [Elmo.handle]
+    assert loaded == [Elmo.handle]
+
+
+def test_warmup_reports_model_errors(monkeypatch):
+    def get_hub_model(handle):
+        raise OSError("Name or service not known")
+
+    monkeypatch.setattr(hub_model, "get_hub_model", get_hub_model)
+    report = warmup([Elmo()])
+    assert report == WarmupReport(loaded=[], missing=[Elmo.handle])
+
+
+def test_check_tensorflow(monkeypatch):
+    monkeypatch.setitem(sys.modules, "tensorflow_hub", None)
+    with pytest.raises(ImportError, match="install tensorflow"):
+        check_tensorflow("install tensorflow")
@@ -0,0 +1,97 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from featuretools.primitives import TransformPrimitive
+
+import nlp_primitives
+
+
+def run_python(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+def test_import_is_lazy():
+    loaded = run_python(
+        (
+            "import sys, nlp_primitives; print(*[m for m in ['featuretools', 'nltk',"
+            " 'sklearn'] if m in sys.modules])"
+        ),
+    )
+    assert loaded == []
+
+
+def test_primitive_does_not_import_nltk():
+    loaded = run_python(
+        (
+            "import sys; from nlp_primitives import LSA, PolarityScore, StopwordCount; "
+            "print(*[m for m in ['featuretools', 'nltk'] if m in sys.modules])"
+        ),
+    )
+    assert loaded == ["featuretools"]
+
+
+def test_primitives():
+    primitives = nlp_primitives.NLP_PRIMITIVES
+    assert nlp_primitives.LSA in primitives
+    assert nlp_primitives.TextStatistics in primitives
+    assert all(issubclass(primitive, TransformPrimitive) for primitive in primitives)
+    assert {p.__name__ for p in primitives} <= set(dir(nlp_primitives))
+
+
+def test_functions():
+    from nlp_primitives.resources import warmup
+
+    assert nlp_primitives.warmup is warmup
+    assert "warmup" in dir(nlp_primitives)
+
+
+def test_star_import():
+    names = run_python(
+        (
+            "from nlp_primitives import *; "
+            "print(LSA.__name__, TextStatistics.__name__, warmup.__name__, "
+            "len(NLP_PRIMITIVES))"
+        ),
+    )
+    assert names == [
+        "LSA",
+        "TextStatistics",
+        "warmup",
+        str(len(nlp_primitives.NLP_PRIMITIVES)),
+    ]
+
+
+def test_all_is_lazy():
+    checked = run_python(
+        (
+            "import nlp_primitives; print(nlp_primitives._has_tensorflow.cache_info()"
+            ".currsize); nlp_primitives.__all__; print(nlp_primitives._has_tensorflow"
+            ".cache_info().currsize)"
+        ),
+    )
+    assert checked == ["0", "1"]
+
+
+def test_all():
+    names = {p.__name__ for p in nlp_primitives.NLP_PRIMITIVES}
+    assert set(nlp_primitives.__all__) == names | {"NLP_PRIMITIVES", "warmup"}
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        nlp_primitives.Missing
+
+
+def test_nltk_data_path():
+    import nltk.data
+
+    assert os.path.isdir(nlp_primitives.nltk_data_path)
+    assert nltk.data.path[0] == nlp_primitives.nltk_data_path
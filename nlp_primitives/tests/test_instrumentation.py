@@ -0,0 +1,167 @@
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nlp_primitives import (
+    LSA,
+    DiversityScore,
+    NumberOfSentences,
+    PartOfSpeechCount,
+    PolarityScore,
+    StopwordCount,
+    TextStatistics,
+)
+from nlp_primitives.instrumentation import (
+    add_listener,
+    annotate,
+    is_enabled,
+    log_call,
+    primitive_call,
+    record,
+    remove_listener,
+    stage,
+)
+from nlp_primitives.segmentation import sentence_cache
+from nlp_primitives.utilities import _default_tokenizer, token_cache
+
+
+@pytest.fixture(autouse=True)
+def caches():
+    token_cache.clear()
+    sentence_cache.clear()
+
+
+@pytest.fixture
+def text():
+    return pd.Series(
+        [
+            "The dogs were running in the park. It was sunny!",
+            np.nan,
+            "I love this movie, it is great.",
+            "I love this movie, it is great.",
+        ],
+    )
+
+
+def test_disabled():
+    assert not is_enabled()
+    with stage("tokenize", 10) as entered:
+        assert entered is None
+    annotate(executor="serial")
+
+
+def test_record_stages(text):
+    with record() as recorder:
+        assert is_enabled()
+        PolarityScore().get_function()(text)
+    assert not is_enabled()
+
+    [call] = recorder.calls
+    assert call["primitive"] == "polarity_score"
+    assert call["rows"] == 4
+    assert call["executor"] == "serial"
+    assert set(call["stages"]) == {"tokenize", "lemmatize", "score"}
+    assert call["stages"]["tokenize"]["rows"] == 4
+    assert call["stages"]["lemmatize"]["rows"] == 2
+    # Lemmatizing is timed within tokenizing
+    stages = call["stages"]
+    assert stages["tokenize"]["seconds"] >= stages["lemmatize"]["seconds"]
+    assert call["seconds"] >= stages["tokenize"]["seconds"] + stages["score"]["seconds"]
+    assert "lock" not in call
+
+
+@pytest.mark.parametrize(
+    "primitive,stages",
+    [
+        (DiversityScore(), {"tokenize", "lemmatize", "score"}),
+        (
+            PartOfSpeechCount(tagger="lexicon"),
+            {"tokenize", "lemmatize", "tag", "count"},
+        ),
+        (NumberOfSentences(), {"segment"}),
+        (NumberOfSentences(splitter="fast"), {"segment"}),
+        (StopwordCount(), {"segment", "count"}),
+        (StopwordCount(tokenizer="fast"), {"tokenize", "count"}),
+        (TextStatistics(), {"segment", "count", "tokenize", "lemmatize", "score"}),
+        (LSA(), {"tokenize", "lemmatize", "transform"}),
+    ],
+)
+def test_primitive_stages(primitive, stages, text):
+    with record() as recorder:
+        primitive.get_function()(text)
+    [call] = recorder.calls
+    assert call["primitive"] == primitive.name
+    assert set(call["stages"]) == stages
+
+
+def test_cache_hit_rates(text):
+    function = DiversityScore().get_function()
+    with record() as recorder:
+        function(text)
+        function(text)
+    first, second = recorder.calls
+    assert first["caches"]["tokens"] == {"hits": 1, "misses": 2, "hit_rate": 1 / 3}
+    assert second["caches"]["tokens"] == {"hits": 3, "misses": 0, "hit_rate": 1.0}
+    assert first["caches"]["sentences"]["hit_rate"] is None
+    assert set(first["caches"]) >= {"tokens", "lemmas", "sentences"}
+
+
+def test_deduplicated(text):
+    with record() as recorder:
+        DiversityScore(deduplicate=True).get_function()(text)
+    [call] = recorder.calls
+    assert call["rows"] == 4
+    assert call["distinct"] == 3
+    assert call["stages"]["tokenize"]["rows"] == 3
+
+
+def test_totals(text):
+    function = DiversityScore().get_function()
+    with record() as recorder:
+        function(text)
+        function(text)
+    result = recorder.to_dict()
+    assert len(result["calls"]) == 2
+    totals = result["totals"]["diversity_score"]
+    expected = sum(c["stages"]["score"]["seconds"] for c in result["calls"])
+    assert totals["score"] == pytest.approx(expected)
+
+
+def test_listener():
+    calls = []
+    add_listener(calls.append)
+    try:
+        with primitive_call("custom", 5):
+            with stage("step", 5):
+                pass
+            annotate(note="value")
+    finally:
+        remove_listener(calls.append)
+    [call] = calls
+    assert call["primitive"] == "custom"
+    assert call["note"] == "value"
+    assert call["stages"]["step"]["rows"] == 5
+
+
+def test_log_call(caplog, text):
+    add_listener(log_call)
+    try:
+        with caplog.at_level(logging.INFO, logger="nlp_primitives.instrumentation"):
+            DiversityScore().get_function()(text)
+    finally:
+        remove_listener(log_call)
+    [log] = caplog.records
+    assert json.loads(log.getMessage()) == log.nlp_primitives
+    assert log.nlp_primitives["primitive"] == "diversity_score"
+
+
+def test_lemma_counts_do_not_create_tokenizer(text):
+    _default_tokenizer.cache_clear()
+    with record() as recorder:
+        NumberOfSentences().get_function()(text)
+    [call] = recorder.calls
+    assert call["caches"]["lemmas"] == {"hits": 0, "misses": 0, "hit_rate": None}
+    assert _default_tokenizer.cache_info().currsize == 0
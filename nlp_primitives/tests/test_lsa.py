@@ -83,6 +83,123 @@ class TestLSA(PrimitiveT):
             decimal=2,
         )
 
+    def test_streaming(self, tmp_path):
+        x = pd.Series(["The dogs ate food.", "She ate a pineapple", np.nan, ".,/"])
+        gutenberg = nltk.corpus.gutenberg.sents()
+        corpus = [" ".join(sent) for sent in gutenberg][:5000]
+        path = tmp_path / "corpus.txt"
+        path.write_text("\n".join(corpus), encoding="utf-8")
+
+        from_list = self.primitive(corpus=corpus, streaming=True, chunk_size=1000)
+        from_iterator = self.primitive(
+            corpus=iter(corpus),
+            streaming=True,
+            chunk_size=1000,
+        )
+        from_file = self.primitive(corpus=str(path), streaming=True, chunk_size=1000)
+
+        expected = from_list.get_function()(x)
+        assert len(expected) == 2
+        assert np.isnan(expected[0][2]) and np.isnan(expected[1][2])
+        assert expected[0][3] == 0 and expected[1][3] == 0
+        for primitive in [from_iterator, from_file]:
+            results = primitive.get_function()(x)
+            np.testing.assert_array_almost_equal(
+                np.array(list(expected)),
+                np.array(list(results)),
+            )
+
+        # A consumed iterator is not read again
+        np.testing.assert_array_almost_equal(
+            np.array(list(expected)),
+            np.array(list(from_iterator.get_function()(x))),
+        )
+
+    def test_streaming_uses_hashed_features(self):
+        corpus = ["dogs ate food", "she ate pineapple", "hello"] * 10
+        primitive = self.primitive(corpus=corpus, streaming=True, chunk_size=4)
+        primitive.get_function()
+        assert primitive.trainer.steps[0][0] == "hashingvectorizer"
+        assert primitive.trainer.steps[-1][1].components_.shape == (2, 2**18)
+
+    def test_corpus_file(self, tmp_path):
+        corpus = ["dogs ate food", "she ate pineapple", "hello"]
+        path = tmp_path / "corpus.txt"
+        path.write_text("\n".join(corpus), encoding="utf-8")
+        x = pd.Series(["The dogs ate food.", "Hello"])
+
+        expected = self.primitive(corpus=corpus, algorithm="arpack").get_function()(x)
+        results = self.primitive(corpus=path, algorithm="arpack").get_function()(x)
+        np.testing.assert_array_almost_equal(
+            np.array(list(expected)),
+            np.array(list(results)),
+        )
+
+    def test_bad_streaming_input_values(self):
+        with pytest.raises(ValueError, match="A custom corpus is required"):
+            LSA(streaming=True)
+        with pytest.raises(ValueError, match="chunk_size must be a positive integer"):
+            LSA(corpus=["a b"], streaming=True, chunk_size=0)
+
+    def test_n_components_and_dtype(self):
+        x = pd.Series(["The dogs ate food.", np.nan, "She ate a pineapple"])
+        primitive = self.primitive(n_components=3, dtype="float32")
+        assert primitive.number_output_features == 3
+        results = primitive.get_function()(x)
+        assert results.shape == (3, 3)
+        assert results.dtype == np.float32
+        assert np.isnan(results[:, 1]).all()
+
+        single = self.primitive(
+            corpus=["dogs ate food", "she ate pineapple", "hello"],
+            n_components=1,
+            algorithm="arpack",
+        )
+        assert single.get_function()(x).shape == (3,)
+
+    def test_float32_default_corpus_matches_float64(self):
+        x = pd.Series(["The dogs ate food.", "the earth is round"])
+        expected = self.primitive().get_function()(x)
+        results = self.primitive(dtype="float32").get_function()(x)
+        assert results.dtype == np.float32
+        np.testing.assert_allclose(expected, results, rtol=1e-4, atol=1e-7)
+
+    def test_bounded_vocabulary(self):
+        corpus = ["dogs ate food", "she ate pineapple", "hello dogs", "dogs ate"]
+        primitive = self.primitive(
+            corpus=corpus,
+            max_features=3,
+            min_df=2,
+            n_iter=2,
+        )
+        primitive.get_function()
+        vectorizer, svd = primitive.trainer.steps[0][1], primitive.trainer.steps[1][1]
+        assert sorted(vectorizer.vocabulary_) == ["ate", "dogs"]
+        assert svd.n_iter == 2
+
+    def test_streaming_bounded_features(self):
+        corpus = ["dogs ate food", "she ate pineapple", "hello dogs", "dogs ate"]
+        primitive = self.primitive(
+            corpus=corpus,
+            streaming=True,
+            max_features=2**10,
+            min_df=2,
+            n_components=3,
+            dtype="float32",
+        )
+        results = primitive.get_function()(pd.Series(["dogs ate", "pineapple"]))
+        assert results.shape == (3, 2)
+        assert results.dtype == np.float32
+        assert primitive.trainer.steps[-1][1].components_.shape == (3, 2**10)
+        # "pineapple" only occurs once so it is ignored
+        np.testing.assert_array_equal(results[:, 1], 0)
+
+    def test_bad_dimension_input_values(self):
+        with pytest.raises(ValueError, match="n_components must be a positive integer"):
+            LSA(n_components=0)
+        with pytest.raises(ValueError, match="dtype must be either"):
+            LSA(dtype="int64")
+
     def test_seed(self):
         prim = self.primitive(random_seed=1)
         # trigger trainer creation via get_function
@@ -103,6 +220,18 @@ class TestLSA(PrimitiveT):
             multi_output=True,
         )
 
+    def test_with_featuretools_n_components(self, es):
+        transform, aggregation = find_applicable_primitives(self.primitive)
+        primitive_instance = self.primitive(n_components=3)
+        transform.append(primitive_instance)
+        valid_dfs(
+            es,
+            aggregation,
+            transform,
+            self.primitive.name.upper(),
+            multi_output=True,
+        )
+
     def test_bad_algorithm_input_value(self):
         err_message = "TruncatedSVD algorithm must be either 'randomized' or 'arpack'"
         with pytest.raises(ValueError, match=err_message):
@@ -129,3 +258,10 @@ class TestLSA(PrimitiveT):
             algorithm="arpack",
         ).get_args_string()
         assert args_string == ", random_seed=100, corpus=user_defined, algorithm=arpack"
+
+        args_string = self.primitive(
+            corpus=custom_corpus,
+            streaming=True,
+            chunk_size=10,
+        ).get_args_string()
+        assert args_string == ", corpus=user_defined, streaming=True, chunk_size=10"
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from nlp_primitives import model_store
+from nlp_primitives.lsa import LSA
+
+
+@pytest.fixture(autouse=True)
+def clear_trainers():
+    model_store.clear_memory_cache()
+    yield
+    model_store.clear_memory_cache()
+
+
+def test_corpus_hash():
+    digest = model_store.corpus_hash(["a b", "c"])
+    assert digest == model_store.corpus_hash(["a b", "c"])
+    assert digest != model_store.corpus_hash(["a", "b c"])
+
+
+def test_get_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("NLP_PRIMITIVES_CACHE_DIR", str(tmp_path))
+    assert model_store.get_cache_dir() == tmp_path
+
+    monkeypatch.delenv("NLP_PRIMITIVES_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert model_store.get_cache_dir() == tmp_path / "nlp_primitives"
+
+
+def test_get_trainer_fits_once(monkeypatch, tmp_path):
+    monkeypatch.setenv("NLP_PRIMITIVES_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def fit():
+        calls.append(1)
+        return LSA(corpus=["dogs ate food", "she ate pineapple"])._fit_trainer()
+
+    config = {"corpus": "test", "random_seed": 0, "algorithm": "arpack"}
+    first = model_store.get_trainer(config, fit)
+    assert model_store.get_trainer(config, fit) is first
+    assert len(calls) == 1
+
+    # After clearing the memory cache the trainer is loaded from disk
+    model_store.clear_memory_cache()
+    from_disk = model_store.get_trainer(config, fit)
+    assert from_disk is not first
+    assert len(calls) == 1
+    assert len(list((tmp_path / "lsa").glob("*.joblib"))) == 1
+
+    docs = ["dogs ate", "pineapple"]
+    np.testing.assert_array_equal(first.transform(docs), from_disk.transform(docs))
+
+
+def test_get_trainer_refits_corrupt_cache_file(model_cache_dir):
+    corpus = ["dogs ate food", "she ate pineapple"]
+    config = {"corpus": "corrupt", "random_seed": 0, "algorithm": "arpack"}
+    path = model_store._cache_path(model_store._cache_key(config))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"not a trainer")
+
+    trainer = model_store.get_trainer(config, LSA(corpus=corpus)._fit_trainer)
+    assert trainer.transform(["dogs"]).shape == (1, 2)
+
+
+def test_export_and_load_trainer(tmp_path):
+    corpus = ["dogs ate food", "she ate pineapple", "hello there"]
+    trainer = LSA(corpus=corpus, algorithm="arpack")._fit_trainer()
+    path = tmp_path / "trainer.npz"
+    model_store.export_trainer(trainer, path)
+    loaded = model_store.load_exported_trainer(path, algorithm="arpack")
+
+    docs = ["The dogs ate food.", "hello", ""]
+    np.testing.assert_allclose(trainer.transform(docs), loaded.transform(docs))
+    assert loaded.steps[1][1].algorithm == "arpack"
+
+
+def test_prefit_trainer_matches_fitted_trainer():
+    primitive = LSA()
+    primitive._create_trainer()
+    fitted = primitive._fit_trainer()
+
+    docs = ["the earth is round", "the dogs ate food", "the sentence doth long"]
+    np.testing.assert_allclose(
+        primitive.trainer.transform(docs),
+        fitted.transform(docs),
+        atol=1e-10,
+    )
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from nlp_primitives.number_of_sentences import NumberOfSentences
 from nlp_primitives.tests.test_utils import (
@@ -48,8 +49,52 @@ class TestNumberOfSentences(PrimitiveT):
         expected = [np.nan, np.nan, np.nan, 0.0]
         np.testing.assert_array_equal(actual, expected)
 
+    def test_fast_splitter(self):
+        x = pd.Series(
+            [
+                "Hello. Hello! Hello? Hello.",
+                "and?",
+                "yes no",
+                "Ángel is here áèí! I am not.",
+                "Yes\n, this is true!",
+                'Mr. Smith said "hi." Then e.g. he left',
+                "It costs 3.5 dollars... Really?!",
+                np.nan,
+                "",
+                "   ",
+            ],
+        )
+        expected = [4.0, 1.0, 1.0, 2.0, 1.0, 2.0, 2.0, np.nan, 0.0, 0.0]
+        actual = self.primitive(splitter="fast").get_function()(x)
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_fast_splitter_string_dtype(self):
+        x = pd.Series(["One. Two", None], dtype="string")
+        actual = self.primitive(splitter="fast").get_function()(x)
+        assert actual.tolist() == [2, pd.NA]
+
+    def test_fast_splitter_all_null(self):
+        x = pd.Series([np.nan, np.nan])
+        actual = self.primitive(splitter="fast").get_function()(x)
+        np.testing.assert_array_equal(actual, [np.nan, np.nan])
+
+    def test_bad_splitter_input_value(self):
+        with pytest.raises(ValueError, match="splitter must be one of"):
+            self.primitive(splitter="bad_splitter")
+
+    def test_args_string(self):
+        assert self.primitive().get_args_string() == ""
+        args_string = self.primitive(splitter="fast").get_args_string()
+        assert args_string == ", splitter=fast"
+
     def test_with_featuretools(self, es):
         transform, aggregation = find_applicable_primitives(self.primitive)
         primitive_instance = self.primitive()
         transform.append(primitive_instance)
         valid_dfs(es, aggregation, transform, self.primitive.name.upper())
+
+    def test_with_featuretools_fast_splitter(self, es):
+        transform, aggregation = find_applicable_primitives(self.primitive)
+        primitive_instance = self.primitive(splitter="fast")
+        transform.append(primitive_instance)
+        valid_dfs(es, aggregation, transform, self.primitive.name.upper())
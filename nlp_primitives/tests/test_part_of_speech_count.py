@@ -1,7 +1,18 @@
+import gzip
+
 import numpy as np
 import pandas as pd
+import pytest
 
 from nlp_primitives.part_of_speech_count import PartOfSpeechCount
+from nlp_primitives.pos_tagging import (
+    POS_TYPES,
+    LexiconTagger,
+    count_tags,
+    get_perceptron_tagger,
+    get_tagger,
+    load_lexicon,
+)
 from nlp_primitives.tests.test_utils import (
     PrimitiveT,
     find_applicable_primitives,
@@ -38,7 +49,7 @@ class TestPartOfSpeechCount(PrimitiveT):
             ],
         )
 
-        pd.testing.assert_series_equal(primitive_func(x), answers, check_names=False)
+        np.testing.assert_array_equal(primitive_func(x), np.array(answers.tolist()))
 
     def test_nan(self):
         x = pd.Series([np.nan, "", "This IS a STRING."])
@@ -63,7 +74,92 @@ class TestPartOfSpeechCount(PrimitiveT):
                 [np.nan, 0.0, 0.0],
             ],
         )
-        pd.testing.assert_series_equal(primitive_func(x), answers, check_names=False)
+        np.testing.assert_array_equal(primitive_func(x), np.array(answers.tolist()))
+
+    def test_lexicon_tagger(self):
+        x = pd.Series(
+            [
+                "He was eating cheese",
+                "The dogs ate 3 apples quickly",
+                np.nan,
+                "Xyzzying",
+            ],
+        )
+        primitive_func = self.primitive(tagger="lexicon").get_function()
+        results = primitive_func(x)
+
+        expected = np.zeros((len(POS_TYPES), 4))
+        expected[:, 2] = np.nan
+        expected[POS_TYPES.index("N"), [0, 1]] = [1, 2]
+        expected[POS_TYPES.index("V"), [0, 1, 3]] = 1
+        expected[POS_TYPES.index("C"), 1] = 1
+        expected[POS_TYPES.index("R"), 1] = 1
+        np.testing.assert_array_equal(results, expected)
+
+    def test_lexicon_tagger_tags(self):
+        tagger = get_tagger("lexicon")
+        assert tagger is get_tagger("lexicon")
+        tags = tagger.tag(["dog", "ate", "0", "beautiful", "quickly", "Cats"])
+        assert tags == [
+            ("dog", "NN"),
+            ("ate", "VB"),
+            ("0", "CD"),
+            ("beautiful", "JJ"),
+            ("quickly", "RB"),
+            ("Cats", "NN"),
+        ]
+
+    def test_lexicon_tagger_closed_class(self):
+        tagger = get_tagger("lexicon")
+        sentence = "I saw a man in the park and he was with her because it is"
+        tags = dict(tagger.tag(sentence.split()))
+        for word in ["a", "the"]:
+            assert tags[word][:1] == "D"
+        for word in ["I", "he", "her", "it"]:
+            assert tags[word][:1] == "P"
+        for word in ["in", "with", "because"]:
+            assert tags[word][:1] == "I"
+        assert tags["was"][:1] == tags["is"][:1] == "V"
+
+    def test_lexicon_tagger_custom_lexicon(self):
+        tagger = LexiconTagger({"running": "NN"})
+        tags = tagger.tag(["Running", "jumping", "12"])
+        assert tags == [("Running", "NN"), ("jumping", "VBG"), ("12", "CD")]
+
+    def test_load_lexicon(self, tmp_path):
+        path = tmp_path / "lexicon.tsv.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write("the\tDT\nof\tIN\n")
+        assert load_lexicon(path) == {"the": "DT", "of": "IN"}
+        assert load_lexicon()["the"] == "DT"
+
+    def test_bad_tagger_input_value(self):
+        with pytest.raises(ValueError, match="tagger must be one of"):
+            self.primitive(tagger="bad_tagger")
+
+    def test_args_string(self):
+        assert self.primitive().get_args_string() == ""
+        args_string = self.primitive(tagger="lexicon").get_args_string()
+        assert args_string == ", tagger=lexicon"
+
+    def test_tagger_is_shared(self):
+        assert get_perceptron_tagger() is get_perceptron_tagger()
+
+    def test_count_tags(self):
+        tagged = [
+            [("dog", "NN"), ("ran", "VBD"), ("quickly", "RB")],
+            [],
+            [("5", "CD"), ("$", "$"), ("cats", "NNS")],
+        ]
+        out = np.zeros((len(POS_TYPES), 4))
+        count_tags(tagged, [0, 2, 3], out)
+
+        expected = np.zeros((len(POS_TYPES), 4))
+        expected[POS_TYPES.index("N"), [0, 3]] = 1
+        expected[POS_TYPES.index("V"), 0] = 1
+        expected[POS_TYPES.index("R"), 0] = 1
+        expected[POS_TYPES.index("C"), 3] = 1
+        np.testing.assert_array_equal(out, expected)
 
     def test_with_featuretools(self, es):
         transform, aggregation = find_applicable_primitives(self.primitive)
@@ -0,0 +1,106 @@
+import pytest
+
+import nlp_primitives
+from nlp_primitives import (
+    LSA,
+    NumberOfSentences,
+    PartOfSpeechCount,
+    PolarityScore,
+    StopwordCount,
+)
+from nlp_primitives.execution import PRELOADED_RESOURCES, preload_resources
+from nlp_primitives.resources import (
+    RESOURCES,
+    WarmupReport,
+    load_resources,
+    warmup,
+)
+
+
+@pytest.fixture
+def missing_tagger(monkeypatch):
+    def load():
+        raise LookupError("Resource averaged_perceptron_tagger not found.")
+
+    monkeypatch.setitem(RESOURCES, "averaged_perceptron_tagger", load)
+
+
+def test_load_resources(missing_tagger):
+    report = load_resources(["stopwords", "averaged_perceptron_tagger", "punkt"])
+    assert report == WarmupReport(
+        loaded=["stopwords", "punkt"],
+        missing=["averaged_perceptron_tagger"],
+    )
+
+
+def test_combine():
+    first = WarmupReport(loaded=["punkt"], missing=["wordnet"])
+    second = WarmupReport(loaded=["punkt", "stopwords"], missing=["wordnet"])
+    assert first.combine(second) == WarmupReport(
+        loaded=["punkt", "stopwords"],
+        missing=["wordnet"],
+    )
+
+
+@pytest.mark.parametrize(
+    "primitive,resources",
+    [
+        (NumberOfSentences(), ["punkt"]),
+        (NumberOfSentences(splitter="fast"), []),
+        (StopwordCount(), ["punkt", "stopwords"]),
+        (StopwordCount(tokenizer="fast"), ["stopwords"]),
+        (
+            PartOfSpeechCount(),
+            ["stopwords", "wordnet", "averaged_perceptron_tagger"],
+        ),
+        (
+            PartOfSpeechCount(tagger="lexicon"),
+            ["stopwords", "wordnet", "pos_lexicon"],
+        ),
+        (PolarityScore(), ["stopwords", "wordnet", "vader_lexicon"]),
+    ],
+)
+def test_primitive_resources(primitive, resources):
+    assert primitive.resources == resources
+    assert set(resources) <= set(RESOURCES)
+
+
+def test_warmup(missing_tagger):
+    report = warmup([PartOfSpeechCount, "number_of_sentences", StopwordCount()])
+    assert report == WarmupReport(
+        loaded=["stopwords", "wordnet", "punkt"],
+        missing=["averaged_perceptron_tagger"],
+    )
+
+
+def test_warmup_all(missing_tagger):
+    report = nlp_primitives.warmup()
+    expected = set()
+    for primitive in nlp_primitives.NLP_PRIMITIVES:
+        expected.update(getattr(primitive(), "resources", []))
+    assert set(report.loaded) | set(report.missing) == expected
+    assert report.missing == ["averaged_perceptron_tagger"]
+
+
+def test_warmup_bad_name():
+    with pytest.raises(ValueError, match="primitive must be one of"):
+        warmup(["not_a_primitive"])
+
+
+def test_warmup_lsa():
+    lsa = LSA()
+    assert warmup([lsa]).missing == []
+    assert lsa.trainer is not None
+
+
+def test_warmup_lsa_missing_corpus(monkeypatch):
+    def missing_corpus(self):
+        raise LookupError("Resource gutenberg not found.")
+
+    monkeypatch.setattr(LSA, "_create_trainer", missing_corpus)
+    assert warmup([LSA()]).missing == ["gutenberg"]
+
+
+def test_preload_resources():
+    preload_resources()
+    assert set(PRELOADED_RESOURCES) <= set(RESOURCES)
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+from nltk.tokenize import sent_tokenize
+
+from nlp_primitives.segmentation import (
+    get_sentence_spans,
+    get_sentence_tokenizer,
+    segment_sentences,
+    sentence_cache,
+)
+
+
+def test_sentence_tokenizer_is_shared():
+    assert get_sentence_tokenizer() is get_sentence_tokenizer()
+
+
+def test_sentence_spans_match_sent_tokenize():
+    text = "Hello there.  Mr. Smith went home! Did he?\nYes."
+    spans = get_sentence_spans(text)
+
+    assert spans.shape == (4, 2)
+    assert [text[start:end] for start, end in spans] == sent_tokenize(text)
+
+
+def test_sentence_spans_empty():
+    assert get_sentence_spans("").shape == (0, 2)
+    assert get_sentence_spans("   ").shape == (0, 2)
+
+
+def test_sentence_spans_are_cached():
+    text = "One sentence. Two sentences."
+    sentence_cache.clear()
+    first = get_sentence_spans(text)
+    second = get_sentence_spans(text)
+
+    assert first is second
+    assert not first.flags.writeable
+    assert sentence_cache.hits == 1
+    assert sentence_cache.misses == 1
+
+
+def test_segment_sentences():
+    x = pd.Series(["A b. C d!", np.nan, "", "Yes."])
+    spans = segment_sentences(x)
+
+    np.testing.assert_array_equal(spans.valid, [True, False, True, True])
+    np.testing.assert_array_equal(spans.counts, [2, 0, 0, 1])
+    np.testing.assert_array_equal(spans.offsets, [0, 2, 2, 2, 3])
+    np.testing.assert_array_equal(spans.starts, [0, 5, 0])
+    np.testing.assert_array_equal(spans.ends, [4, 9, 4])
+    np.testing.assert_array_equal(spans.lengths(), [4, 4, 4])
+    np.testing.assert_array_equal(spans.rows(), [0, 0, 3])
+
+
+def test_segment_sentences_no_rows():
+    spans = segment_sentences(pd.Series([], dtype=object))
+
+    assert len(spans.counts) == 0
+    assert len(spans.starts) == 0
+    np.testing.assert_array_equal(spans.offsets, [0])
@@ -0,0 +1,31 @@
+import pytest
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+from nlp_primitives.sentiment import PolarityEngine, get_polarity_engine
+
+
+@pytest.mark.parametrize(
+    "tokens",
+    [
+        ["love", "dog"],
+        ["hate", "cat"],
+        ["good", "but", "terrible"],
+        ["kind", "of", "nice"],
+        ["extremely", "happy", "not", "sad"],
+        ["line\nbreak", "awful"],
+        ["a", "b", "great"],
+    ],
+)
+def test_matches_vader_on_text(tokens):
+    expected = SentimentIntensityAnalyzer().polarity_scores(" ".join(tokens))
+    assert PolarityEngine().polarity_scores(tokens) == expected
+
+
+def test_score_tokens():
+    engine = PolarityEngine()
+    scores = [engine.score_tokens(t) for t in [["love", "dog"], ["hate", "cat"], []]]
+    assert scores == [0.808, -0.787, 0.0]
+
+
+def test_engine_is_shared():
+    assert get_polarity_engine() is get_polarity_engine()
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from nlp_primitives.stopword_count import StopwordCount
 from nlp_primitives.tests.test_utils import (
@@ -31,8 +32,65 @@ class TestStopwordCount(PrimitiveT):
         answers = pd.Series([np.nan, 0, 3])
         pd.testing.assert_series_equal(primitive_func(x), answers, check_names=False)
 
+    def test_fast_tokenizer(self):
+        x = pd.Series(
+            [
+                "This is a test string.",
+                "This IS the fourth string.",
+                "I don't think it's five o'clock",
+                "You cannot be well-to-do.",
+                np.nan,
+                "",
+            ],
+            index=[3, 3, 1, 0, 2, 5],
+        )
+        primitive_func = self.primitive(tokenizer="fast").get_function()
+        answers = pd.Series([3, 3, 3, 4, pd.NA, 0], index=x.index, dtype="Int64")
+        pd.testing.assert_series_equal(primitive_func(x), answers)
+
+    def test_fast_tokenizer_matches_treebank(self):
+        x = pd.Series(
+            [
+                "This is a test string.",
+                "I don't think it's five o'clock",
+                "You cannot be well-to-do.",
+                "'Tis but a scratch, isn't it?",
+                np.nan,
+            ],
+        )
+        treebank = self.primitive().get_function()(x)
+        fast = self.primitive(tokenizer="fast").get_function()(x)
+        pd.testing.assert_series_equal(fast, treebank.astype("Int64"))
+
+    def test_fast_tokenizer_all_nan(self):
+        x = pd.Series([np.nan, np.nan])
+        primitive_func = self.primitive(tokenizer="fast").get_function()
+        answers = pd.Series([pd.NA, pd.NA], dtype="Int64")
+        pd.testing.assert_series_equal(primitive_func(x), answers)
+
+    def test_fast_tokenizer_string_dtype(self):
+        x = pd.Series(["The cat", None], dtype="string")
+        primitive_func = self.primitive(tokenizer="fast").get_function()
+        answers = pd.Series([1, pd.NA], dtype="Int64")
+        pd.testing.assert_series_equal(primitive_func(x), answers)
+
+    def test_bad_tokenizer_input_value(self):
+        with pytest.raises(ValueError, match="tokenizer must be one of"):
+            self.primitive(tokenizer="bad_tokenizer")
+
+    def test_args_string(self):
+        assert self.primitive().get_args_string() == ""
+        args_string = self.primitive(tokenizer="fast").get_args_string()
+        assert args_string == ", tokenizer=fast"
+
     def test_with_featuretools(self, es):
         transform, aggregation = find_applicable_primitives(self.primitive)
         primitive_instance = self.primitive()
         transform.append(primitive_instance)
         valid_dfs(es, aggregation, transform, self.primitive.name.upper())
+
+    def test_with_featuretools_fast_tokenizer(self, es):
+        transform, aggregation = find_applicable_primitives(self.primitive)
+        primitive_instance = self.primitive(tokenizer="fast")
+        transform.append(primitive_instance)
+        valid_dfs(es, aggregation, transform, self.primitive.name.upper())
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+from nlp_primitives import (
+    DiversityScore,
+    MeanCharactersPerSentence,
+    NumberOfSentences,
+    StopwordCount,
+)
+from nlp_primitives.tests.test_utils import (
+    PrimitiveT,
+    find_applicable_primitives,
+    valid_dfs,
+)
+from nlp_primitives.text_statistics import STATISTICS, TextStatistics
+
+
+class TestTextStatistics(PrimitiveT):
+    primitive = TextStatistics
+
+    def test_strings(self):
+        x = pd.Series(
+            [
+                "This is a test string. It has two sentences!",
+                "Mr. Smith didn't go to Washington... or did he?",
+                "hi hi hi",
+                "Ángel is here áèí! I am not.",
+            ],
+        )
+        primitive_func = self.primitive().get_function()
+        answers = np.array(
+            [
+                [2.0, 1.0, 1.0, 2.0],
+                [21.5, 47.0, 8.0, 13.5],
+                [5.0, 5.0, 0.0, 5.0],
+                [1.0, 1.0, 1 / 3, 1.0],
+            ],
+        )
+        np.testing.assert_array_equal(primitive_func(x), answers)
+
+    def test_nan(self):
+        x = pd.Series([np.nan, "", "   ", None, "Yes."])
+        primitive_func = self.primitive().get_function()
+        answers = np.array(
+            [
+                [np.nan, 0.0, 0.0, np.nan, 1.0],
+                [np.nan, 0.0, 0.0, np.nan, 4.0],
+                [np.nan, 0.0, 0.0, np.nan, 0.0],
+                [np.nan, 0.0, 0.0, np.nan, 1.0],
+            ],
+        )
+        np.testing.assert_array_equal(primitive_func(x), answers)
+
+    def test_matches_standalone_primitives(self):
+        x = pd.Series(
+            [
+                "The dogs were running in the park. It was sunny!",
+                np.nan,
+                "",
+                "I cannot believe it's not butter, can't you?",
+                "Dr. Jones arrived at 5 p.m. and left. Odd.",
+                "Yes\n, this is true!",
+            ],
+            index=[4, 2, 0, 1, 3, 9],
+        )
+        expected = [
+            NumberOfSentences(),
+            MeanCharactersPerSentence(),
+            StopwordCount(),
+            DiversityScore(),
+        ]
+        expected = np.array(
+            [np.asarray(p.get_function()(x), dtype=float) for p in expected],
+        )
+        actual = self.primitive().get_function()(x)
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_names(self):
+        names = self.primitive().generate_names(["text"])
+        assert names == [f"TEXT_STATISTICS(text)[{name}]" for name in STATISTICS]
+
+    def test_with_featuretools(self, es):
+        transform, aggregation = find_applicable_primitives(self.primitive)
+        primitive_instance = self.primitive()
+        transform.append(primitive_instance)
+        valid_dfs(
+            es,
+            aggregation,
+            transform,
+            self.primitive.name.upper(),
+            multi_output=True,
+        )
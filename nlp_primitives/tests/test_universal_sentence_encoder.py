@@ -7,6 +7,8 @@ import pytest
 from featuretools.primitives.utils import PrimitivesDeserializer, serialize_primitive
 from woodwork.logical_types import NaturalLanguage
 
+from nlp_primitives import _has_tensorflow
+from nlp_primitives.tensorflow.hub_model import get_hub_model
 from nlp_primitives.tensorflow.universal_sentence_encoder import (
     UniversalSentenceEncoder,
 )
@@ -29,6 +31,52 @@ def test_regular(universal_sentence_encoder):
     np.testing.assert_array_almost_equal(a, b)
 
 
+def test_batches_match(universal_sentence_encoder):
+    sentences = pd.Series(
+        [
+            "",
+            "I like to eat pizza",
+            "The roller coaster was built in 1885.",
+            "When will humans go to mars?",
+            "Mitochondria is the powerhouse of the cell",
+        ],
+    )
+    expected = universal_sentence_encoder(sentences)
+    actual = UniversalSentenceEncoder(batch_size=2)(sentences)
+    assert actual.shape == (512, 5)
+    np.testing.assert_allclose(actual, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_cache(universal_sentence_encoder, monkeypatch, tmp_path):
+    monkeypatch.setenv("NLP_PRIMITIVES_CACHE_DIR", str(tmp_path))
+    sentences = ["I like to eat pizza", "", "I like to eat pizza"]
+    expected = universal_sentence_encoder(sentences)
+    cached = UniversalSentenceEncoder(cache=True)
+    np.testing.assert_allclose(cached(sentences), expected, rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(cached(sentences), expected, rtol=1e-5, atol=1e-6)
+    assert (tmp_path / "embeddings.sqlite").exists()
+
+
+def test_model_loaded_once(universal_sentence_encoder):
+    universal_sentence_encoder(["I like to eat pizza"])
+    misses = get_hub_model.cache_info().misses
+    UniversalSentenceEncoder()(["When will humans go to mars?"])
+    universal_sentence_encoder(["Mitochondria is the powerhouse of the cell"])
+    assert get_hub_model.cache_info().misses == misses
+
+
+@pytest.mark.skipif(not _has_tensorflow(), reason="tensorflow is not installed")
+def test_batch_size_not_in_args_string():
+    assert UniversalSentenceEncoder(batch_size=8).get_args_string() == ""
+
+
+def test_bad_batch_size():
+    with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+        UniversalSentenceEncoder(batch_size=0)
+    with pytest.raises(ValueError, match="cache_size must be a positive number"):
+        UniversalSentenceEncoder(cache_size=0)
+
+
 def test_name_in_primitive_list(universal_sentence_encoder):
     assert PRIMITIVES.name.eq(universal_sentence_encoder.name).any()
 
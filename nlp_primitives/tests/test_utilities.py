@@ -0,0 +1,94 @@
+import pytest
+
+from nlp_primitives.utilities import (
+    AnalysisCache,
+    CleanTokenizer,
+    clean_tokens,
+    get_clean_tokens,
+    token_cache,
+)
+
+
+def test_clean_tokens():
+    text = "The 2 dogs, were RUNNING in parks!"
+    assert clean_tokens(text) == ["0", "dog", "running", "park"]
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        ({}, ["0", "dog", "running", "park"]),
+        ({"remove_punctuation": False}, ["0", "dogs,", "running", "parks!"]),
+        (
+            {"remove_stopwords": False},
+            ["the", "0", "dog", "were", "running", "in", "park"],
+        ),
+        ({"lemmatize": False}, ["0", "dogs", "running", "parks"]),
+        ({"fold_digits": False}, ["2", "dog", "running", "park"]),
+    ],
+)
+def test_clean_tokenizer_steps(kwargs, expected):
+    tokenizer = CleanTokenizer(**kwargs)
+    assert tokenizer.clean("The 2 dogs, were RUNNING in parks!") == expected
+
+
+def test_clean_tokenizer_clean_many():
+    tokenizer = CleanTokenizer()
+    texts = ["Cats and dogs", "", "Hello?!"]
+    assert tokenizer.clean_many(texts) == [clean_tokens(t) for t in texts]
+    assert tokenizer.clean_many(iter(texts)) == [["cat", "dog"], [], ["hello"]]
+
+
+def test_analysis_cache_hits_and_misses():
+    cache = AnalysisCache(maxsize=2)
+    calls = []
+
+    def compute(key):
+        calls.append(key)
+        return key.upper()
+
+    assert cache.get_or_compute("a", compute) == "A"
+    assert cache.get_or_compute("a", compute) == "A"
+    assert calls == ["a"]
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_analysis_cache_evicts_least_recently_used():
+    cache = AnalysisCache(maxsize=2)
+    cache.get_or_compute("a", str.upper)
+    cache.get_or_compute("b", str.upper)
+    # Touch "a" so "b" becomes the least recently used entry
+    cache.get_or_compute("a", str.upper)
+    cache.get_or_compute("c", str.upper)
+
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_analysis_cache_clear():
+    cache = AnalysisCache()
+    cache.get_or_compute("a", str.upper)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_analysis_cache_bad_maxsize():
+    with pytest.raises(ValueError, match="maxsize must be a positive integer"):
+        AnalysisCache(maxsize=0)
+
+
+def test_get_clean_tokens_uses_shared_cache():
+    text = "The dogs were running in 2 parks!"
+    token_cache.clear()
+    first = get_clean_tokens(text)
+    second = get_clean_tokens(text)
+
+    assert first == tuple(clean_tokens(text))
+    assert first is second
+    assert token_cache.hits == 1
+    assert token_cache.misses == 1
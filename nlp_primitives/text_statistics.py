@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+from featuretools.primitives.base import TransformPrimitive
+from woodwork.column_schema import ColumnSchema
+from woodwork.logical_types import Double, NaturalLanguage
+
+from nlp_primitives.execution import ExecutionMixin, check_n_jobs
+from nlp_primitives.instrumentation import stage
+from nlp_primitives.segmentation import segment_sentences
+from nlp_primitives.stopword_count import count_stopwords
+from nlp_primitives.utilities import get_clean_tokens
+
+# The statistics computed, in the order of the outputs
+STATISTICS = [
+    "number_of_sentences",
+    "mean_characters_per_sentence",
+    "stopword_count",
+    "diversity_score",
+]
+
+
+class TextStatistics(ExecutionMixin, TransformPrimitive):
+    """Calculates several statistics of a string in a single pass.
+
+    Description:
+        Given a list of N strings, this method will return a 4xN matrix with the
+        number of sentences, the mean number of characters per sentence, the
+        number of stopwords and the diversity score of each string. The values
+        are the same as those of the ``NumberOfSentences``,
+        ``MeanCharactersPerSentence``, ``StopwordCount`` and ``DiversityScore``
+        primitives, but each string is only split into sentences once, and the
+        sentences are reused to split the string into words.
+
+        If a string is missing, return `NaN`.
+
+    Args:
+        n_jobs (int, optional): The number of processes to compute the primitive
+            with. Negative values count back from the number of CPUs, so -1 uses
+            all of them. Defaults to 1.
+        deduplicate (bool, optional): Compute the primitive only once for each
+            distinct string, and copy the results to the rows repeating it.
+            Speeds up columns with many repeated values. Defaults to False.
+
+    Examples:
+        >>> x = ['This is a test. Yay!', 'hi hi hi', '']
+        >>> text_statistics = TextStatistics()
+        >>> text_statistics(x).tolist()
+        [[2.0, 1.0, 0.0], [9.5, 8.0, 0.0], [3.0, 0.0, 0.0], [1.0, 0.3333333333333333, 0.0]]
+    """
+
+    name = "text_statistics"
+    input_types = [ColumnSchema(logical_type=NaturalLanguage)]
+    return_type = ColumnSchema(logical_type=Double, semantic_tags={"numeric"})
+    default_value = 0
+    cost_per_character = 1.5e-6
+    resources = ["punkt", "stopwords", "wordnet"]
+
+    def __init__(self, n_jobs=1, deduplicate=False):
+        self.number_output_features = len(STATISTICS)
+        self.n = len(STATISTICS)
+        self.n_jobs = check_n_jobs(n_jobs)
+        self.deduplicate = deduplicate
+
+    def generate_names(self, base_feature_names):
+        base_name = self.generate_name(base_feature_names)
+        return [f"{base_name}[{statistic}]" for statistic in STATISTICS]
+
+    def get_function(self):
+        def text_statistics(array):
+            array = pd.Series(array)
+            spans = segment_sentences(array)
+            valid = spans.valid
+            values = np.full((len(STATISTICS), len(array)), np.nan)
+
+            counts = spans.counts
+            values[0, valid] = counts[valid]
+            totals = np.bincount(
+                spans.rows(),
+                weights=spans.lengths(),
+                minlength=len(counts),
+            )
+            values[1, valid] = 0.0
+            np.divide(totals, counts, out=values[1], where=valid & (counts > 0))
+
+            rows = np.flatnonzero(valid)
+            with stage("count", len(rows)):
+                for i in rows:
+                    start, end = spans.offsets[i], spans.offsets[i + 1]
+                    sentences = zip(spans.starts[start:end], spans.ends[start:end])
+                    values[2, i] = count_stopwords(array.iat[i], sentences)
+
+            with stage("tokenize", len(rows)):
+                token_lists = [get_clean_tokens(array.iat[i]) for i in rows]
+            with stage("score", len(rows)):
+                for i, tokens in zip(rows, token_lists):
+                    if len(tokens) < 1:
+                        values[3, i] = 0.0
+                    else:
+                        values[3, i] = float(len(set(tokens))) / float(len(tokens))
+            return values
+
+        return self._execute(text_statistics)
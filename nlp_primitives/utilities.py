@@ -1,23 +1,196 @@
 import string
-from typing import List
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Tuple
 
-import nltk
+from nlp_primitives.instrumentation import register_cache, stage
+
+
+@lru_cache(maxsize=None)
+def add_nltk_data_path():
+    """Add the NLTK data shipped with nlp_primitives to the front of the NLTK
+    data search path.
+
+    NLTK is only imported the first time this is called, so every function
+    loading NLTK data calls it first rather than importing NLTK when
+    nlp_primitives is imported.
+    """
+    import nltk.data
+
+    from nlp_primitives import nltk_data_path
+
+    if nltk_data_path not in nltk.data.path:
+        nltk.data.path.insert(0, nltk_data_path)
+
+
+@lru_cache(maxsize=None)
+def get_stopwords() -> FrozenSet[str]:
+    """Return the English stopwords defined in ``nltk.corpus.stopwords``."""
+    add_nltk_data_path()
+    from nltk.corpus import stopwords
+
+    return frozenset(stopwords.words("english"))
+
+
+class CleanTokenizer:
+    """Splits text into lower case tokens and cleans them.
+
+    The punctuation table, stopword set and lemmatizer are built once when the
+    tokenizer is created, so a single instance can be reused for any number of
+    strings.
+
+    Args:
+        remove_punctuation (bool, optional): Remove all punctuation characters
+            before splitting the text. Defaults to True.
+        remove_stopwords (bool, optional): Drop English stopwords and
+            punctuation tokens. Defaults to True.
+        lemmatize (bool, optional): Lemmatize tokens with the WordNet
+            lemmatizer. Defaults to True.
+        fold_digits (bool, optional): Replace every token containing a digit
+            with ``"0"``. Defaults to True.
+
+    Examples:
+        >>> tokenizer = CleanTokenizer()
+        >>> tokenizer.clean("The dogs ate 3 apples!")
+        ['dog', 'ate', '0', 'apple']
+        >>> tokenizer.clean_many(["Hi there", "Cats"])
+        [['hi'], ['cat']]
+    """
+
+    def __init__(
+        self,
+        remove_punctuation=True,
+        remove_stopwords=True,
+        lemmatize=True,
+        fold_digits=True,
+    ):
+        self.remove_punctuation = remove_punctuation
+        self.remove_stopwords = remove_stopwords
+        self.lemmatize = lemmatize
+        self.fold_digits = fold_digits
+
+        self._punctuation_table = str.maketrans("", "", string.punctuation)
+        self._stopwords = frozenset()
+        if remove_stopwords:
+            self._stopwords = get_stopwords().union(string.punctuation)
+        self._lemmatize = None
+        if lemmatize:
+            add_nltk_data_path()
+            from nltk.stem import WordNetLemmatizer
+
+            # Lemmatizing is by far the most expensive step and the same words
+            # come up over and over, so remember the lemma of every word seen.
+            self._lemmatize = lru_cache(maxsize=2**16)(WordNetLemmatizer().lemmatize)
+
+    def clean(self, text: str) -> List[str]:
+        """Return the cleaned tokens for a single string."""
+        if self.remove_punctuation:
+            text = text.translate(self._punctuation_table)
+        tokens = [word.lower() for word in text.split(" ") if len(word) > 0]
+
+        if self.remove_stopwords:
+            stopwords = self._stopwords
+            tokens = [word for word in tokens if word not in stopwords]
+
+        if self.lemmatize:
+            lemmatize = self._lemmatize
+            with stage("lemmatize", 1):
+                tokens = [lemmatize(word) for word in tokens]
+
+        if self.fold_digits:
+            tokens = ["0" if any(map(str.isdigit, word)) else word for word in tokens]
+        return tokens
+
+    def clean_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """Return the cleaned tokens for each string in ``texts``."""
+        return [self.clean(text) for text in texts]
+
+
+@lru_cache(maxsize=None)
+def _default_tokenizer() -> CleanTokenizer:
+    return CleanTokenizer()
 
 
 def clean_tokens(text: str) -> List[str]:
-    text = text.translate(str.maketrans("", "", string.punctuation))
-    text = [word.lower() for word in text.split(" ") if len(word) > 0]
-
-    # Remove stopwords and punctuation
-    stopwords_and_punctuation = set(nltk.corpus.stopwords.words("english")).union(
-        set(string.punctuation),
-    )
-    text = [word for word in text if word not in stopwords_and_punctuation]
-
-    # Lemmatize tokens
-    wn = nltk.WordNetLemmatizer()
-    text = [wn.lemmatize(word) for word in text]
-
-    # Set all tokens with a digit in them to '0'
-    text = ["0" if any(map(str.isdigit, word)) else word for word in text]
-    return text
+    return _default_tokenizer().clean(text)
+
+
+class AnalysisCache:
+    """A bounded mapping from a piece of text to the result of analyzing it.
+
+    Entries are evicted in least recently used order once ``maxsize`` entries
+    are stored. Lookups and insertions are guarded by a lock so the cache can
+    be shared between threads.
+
+    Args:
+        maxsize (int, optional): The maximum number of entries to keep.
+            Defaults to 65536.
+    """
+
+    def __init__(self, maxsize=65536):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get_or_compute(self, key, func):
+        """Return the cached value for ``key``, computing it with ``func(key)``
+        and storing it if it is not present."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+
+        value = func(key)
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Shared by every primitive that cleans text, so a column used by several
+# primitives in the same feature matrix calculation is only cleaned once.
+token_cache = AnalysisCache()
+register_cache("tokens", lambda: (token_cache.hits, token_cache.misses))
+
+
+def _lemma_counts():
+    # Creating the default tokenizer here would load the stopwords and WordNet
+    # for primitives that never lemmatize
+    if _default_tokenizer.cache_info().currsize == 0:
+        return 0, 0
+    return _default_tokenizer()._lemmatize.cache_info()[:2]
+
+
+register_cache("lemmas", _lemma_counts)
+
+
+def get_clean_tokens(text: str) -> Tuple[str, ...]:
+    """Return the cleaned tokens for ``text``, using the shared token cache.
+
+    The tokens are returned as a tuple since the same object is handed to
+    every primitive that requests the tokens for this text.
+    """
+    return token_cache.get_or_compute(text, lambda t: tuple(clean_tokens(t)))